@@ -15,6 +15,7 @@
 #
 
 
+import asyncio
 import logging
 
 from fastapi import FastAPI, Depends
@@ -22,10 +23,13 @@ from fastapi.exceptions import RequestValidationError
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.db import create_models
+from app.services.action import action_writer
 from app.utils.validation_error import validation_error
 from app.utils.client import init
 from app.utils.middleware import Middleware
+from app.utils.reference_cache import reference_cache
 from app.routers import routers
+from config import settings
 
 
 app = FastAPI(
@@ -51,6 +55,23 @@ app.add_middleware(
 [app.include_router(router) for router in routers]
 
 
+@app.on_event('startup')
+async def listen_reference_cache():
+    if settings.reference_cache_pubsub:
+        asyncio.create_task(coro=reference_cache.listen(), name='reference_cache')
+
+
+@app.on_event('startup')
+async def start_action_writer():
+    if settings.actions_write_behind:
+        action_writer.start()
+
+
+@app.on_event('shutdown')
+async def stop_action_writer():
+    await action_writer.stop()
+
+
 def create_app():
     logging.basicConfig(level=logging.DEBUG)
     logging.info(msg='Application starting...')
@@ -15,11 +15,22 @@
 #
 
 
-from app.db.db import db
-from app.db.db_manager import db_manager_sync
+from app.db.db import after_commit, db, reset_db_state
+from app.db.db_manager import db_connection, db_manager, db_manager_sync
+from app.db.db_transaction import db_transaction
 from app.db.models import models
+from app.db.migrations import run_migrations
+from app.db.hot_queries import check_hot_queries
+from config import settings
 
 
 @db_manager_sync
 def create_models():
     db.create_tables(models=models)
+    run_migrations()
+    if settings.mysql_check_hot_queries:
+        check_hot_queries()
+
+
+def get_pool_stats() -> dict:
+    return db.get_pool_stats()
@@ -15,12 +15,84 @@
 #
 
 
-from peewee import MySQLDatabase
+from contextvars import ContextVar
+
+from peewee import _ConnectionState
+from playhouse.pool import PooledMySQLDatabase
 
 from config import settings
 
 
-db = MySQLDatabase(
+db_state: ContextVar[dict | None] = ContextVar('db_state', default=None)
+
+
+def reset_db_state():
+    db_state.set(
+        {
+            'closed': True,
+            'conn': None,
+            'ctx': [],
+            'transactions': [],
+            'after_commit': [],
+        },
+    )
+
+
+def after_commit(callback):
+    """
+    Awaits callback (coroutine function) once the transaction of the current request or job is committed.
+    """
+    ConnectionState._get_state().setdefault('after_commit', []).append(callback)
+
+
+class ConnectionState(_ConnectionState):
+    """
+    Connection state stored in a context variable, so every asyncio task (request, job) works with its own
+    connection instead of sharing the thread-local one.
+    """
+    @staticmethod
+    def _get_state() -> dict:
+        state = db_state.get()
+        if state is None:
+            reset_db_state()
+            state = db_state.get()
+        return state
+
+    def __setattr__(self, name, value):
+        self._get_state()[name] = value
+
+    def __getattr__(self, name):
+        try:
+            return self._get_state()[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class Database(PooledMySQLDatabase):
+    def __init__(self, *args, pool_size: int, max_overflow: int, **kwargs):
+        self._pool_size = pool_size
+        super().__init__(*args, max_connections=pool_size + max_overflow, **kwargs)
+        self._state = ConnectionState()
+
+    def _close(self, conn, close_conn=False):
+        # Overflow connections are closed on check-in instead of being kept idle
+        with self._pool_lock:
+            if not close_conn and len(self._connections) >= self._pool_size:
+                self._in_use.pop(self.conn_key(conn), None)
+                close_conn = True
+            super()._close(conn, close_conn=close_conn)
+
+    def get_pool_stats(self) -> dict:
+        with self._pool_lock:
+            return {
+                'pool_size': self._pool_size,
+                'max_connections': self._max_connections,
+                'in_use': len(self._in_use),
+                'idle': len(self._connections),
+            }
+
+
+db = Database(
     host=settings.mysql_host,
     port=settings.mysql_port,
     user=settings.mysql_user,
@@ -28,4 +100,9 @@ db = MySQLDatabase(
     database=settings.mysql_name,
     charset='utf8mb4',
     autoconnect=False,
+    pool_size=settings.mysql_pool_size,
+    max_overflow=settings.mysql_pool_max_overflow,
+    stale_timeout=settings.mysql_pool_stale_timeout,
+    # No blocking wait for a free connection in the pool, db_connection waits for it on the event loop
+    timeout=None,
 )
@@ -0,0 +1,42 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+
+from config import settings
+
+
+# One worker per pooled connection, so a query never waits for a thread while holding a connection
+db_executor = ThreadPoolExecutor(
+    max_workers=settings.mysql_pool_size + settings.mysql_pool_max_overflow,
+    thread_name_prefix='db',
+)
+
+
+async def run_sync(function, *args, **kwargs):
+    """
+    Run blocking peewee work in the database thread pool. The caller's context is copied into the worker,
+    so the query uses the connection checked out by the current request.
+    """
+    context = copy_context()
+    return await get_running_loop().run_in_executor(
+        db_executor,
+        partial(context.run, function, *args, **kwargs),
+    )
@@ -15,13 +15,48 @@
 #
 
 
-from app.db.db import db
+from asyncio import sleep
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from playhouse.pool import MaxConnectionsExceeded
+
+from app.db.db import db, db_state, reset_db_state
+from app.db.db_executor import run_sync
+from config import settings
+
+
+@asynccontextmanager
+async def db_connection():
+    """
+    Async "with db:", connection and transaction are taken and given back in the database threads. While the pool
+    is exhausted it waits on the event loop up to mysql_pool_timeout, then raises MaxConnectionsExceeded. Callbacks
+    registered with after_commit run once the transaction is committed.
+    """
+    expires = monotonic() + settings.mysql_pool_timeout
+    while True:
+        try:
+            await run_sync(db.__enter__)
+            break
+        except MaxConnectionsExceeded:
+            if monotonic() >= expires:
+                raise
+            await sleep(0.1)
+    try:
+        yield
+    except BaseException as e:
+        await run_sync(db.__exit__, type(e), e, e.__traceback__)
+        raise
+    await run_sync(db.__exit__, None, None, None)
+    for callback in db_state.get().pop('after_commit', []):
+        await callback()
 
 
 def db_manager(function):
-    async def wrapper(*args):
-        with db:
-            result = await function(*args)
+    async def wrapper(*args, **kwargs):
+        reset_db_state()
+        async with db_connection():
+            result = await function(*args, **kwargs)
 
         return result
 
@@ -30,6 +65,7 @@ def db_manager(function):
 
 def db_manager_sync(function):
     def wrapper(*args, **kwargs):
+        reset_db_state()
         with db:
             result = function(*args, **kwargs)
         return result
@@ -0,0 +1,37 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from contextlib import asynccontextmanager
+
+from app.db.db import db
+from app.db.db_executor import run_sync
+
+
+@asynccontextmanager
+async def db_transaction():
+    """
+    Unit of work for service methods, usable as "async with db_transaction()" or "@db_transaction()". The outermost
+    level commits once, nested levels become savepoints, so a caught error in a nested call only undoes its writes.
+    """
+    transaction = db.atomic()
+    await run_sync(transaction.__enter__)
+    try:
+        yield
+    except BaseException as e:
+        await run_sync(transaction.__exit__, type(e), e, e.__traceback__)
+        raise
+    await run_sync(transaction.__exit__, None, None, None)
@@ -0,0 +1,80 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from datetime import date
+
+from app.db.db import db
+from app.db.models import Account, Day, Meal, Payment, RolePermission, TextTranslation, Url
+
+
+class HotQueryFullScan(Exception):
+    pass
+
+
+# Representative shapes of the hottest lookups, the parameter values do not matter for EXPLAIN
+hot_queries = {
+    'meal_by_parameters': lambda: Meal.select().where(
+        (Meal.account_service == 1) &
+        (Meal.date == date.today()) &
+        (Meal.type == 'meal_1') &
+        (Meal.is_deleted == False)
+    ),
+    'day_by_date': lambda: Day.select().where(
+        (Day.account_service == 1) &
+        (Day.date == date.today()) &
+        (Day.is_deleted == False)
+    ),
+    'text_translation': lambda: TextTranslation.select().where(
+        (TextTranslation.text == 1) &
+        (TextTranslation.language == 1) &
+        (TextTranslation.is_deleted == False)
+    ),
+    'payments_unpaid': lambda: Payment.select().where(
+        (Payment.state == 'waiting') &
+        (Payment.is_deleted == False)
+    ),
+    'url_by_name': lambda: Url.select().where(
+        (Url.name == 'name') &
+        (Url.is_deleted == False)
+    ),
+    'account_by_username': lambda: Account.select().where(
+        Account.username == 'username'
+    ),
+    'role_permissions_by_role': lambda: RolePermission.select().where(
+        (RolePermission.role == 1) &
+        (RolePermission.is_deleted == False)
+    ),
+}
+
+
+def explain(query) -> list[dict]:
+    sql, params = query.sql()
+    cursor = db.execute_sql(f'EXPLAIN {sql}', params)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def check_hot_queries():
+    full_scans = []
+    for name, query in hot_queries.items():
+        for row in explain(query=query()):
+            if row.get('type') == 'ALL':
+                full_scans.append(f'{name} ({row.get("table")})')
+
+    if full_scans:
+        raise HotQueryFullScan(f'Hot queries fall back to a full scan: {", ".join(full_scans)}')
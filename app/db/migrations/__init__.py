@@ -0,0 +1,43 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+import logging
+
+from app.db.models import Migration
+from .base import BaseMigration
+from .m0001_hot_lookup_indexes import HotLookupIndexesMigration
+from .m0002_trainings_dates_index import TrainingsDatesIndexMigration
+from .m0003_unique_natural_keys import UniqueNaturalKeysMigration
+
+
+migrations: list[BaseMigration] = [
+    HotLookupIndexesMigration(),
+    TrainingsDatesIndexMigration(),
+    UniqueNaturalKeysMigration(),
+]
+
+
+def run_migrations():
+    applied = [migration.version for migration in Migration.select()]
+
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+        logging.info(msg=f'Applying migration {migration.version:04}_{migration.name}...')
+        migration.up()
+        Migration.create(version=migration.version, name=migration.name)
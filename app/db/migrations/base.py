@@ -0,0 +1,89 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+import logging
+import operator
+from functools import reduce
+
+from peewee import Model, fn
+from playhouse.migrate import MySQLMigrator, migrate
+
+from app.db.db import db
+
+
+class BaseMigration:
+    version: int
+    name: str
+
+    def __init__(self):
+        self.migrator = MySQLMigrator(database=db)
+
+    def up(self):
+        raise NotImplementedError
+
+    def add_index(self, model: type[Model], fields: tuple[str, ...], unique: bool = False):
+        table = model._meta.table_name
+        columns = [model._meta.fields[field].column_name for field in fields]
+
+        # Fresh databases already got this index from create_tables()
+        if columns in [index.columns for index in db.get_indexes(table)]:
+            return
+
+        migrate(self.migrator.add_index(table, columns, unique))
+
+    def add_unique_active_index(self, model: type[Model], fields: tuple[str, ...]):
+        """
+        Unique index over rows that are not soft deleted: for deleted rows the extra key part is NULL and never
+        collides. Functional key parts need MySQL 8.0.13+.
+        """
+        table = model._meta.table_name
+        columns = [model._meta.fields[field].column_name for field in fields]
+        name = f'{table}_{"_".join(columns)}_active'
+
+        if name in [index.name for index in db.get_indexes(table)]:
+            return
+        if db.server_version < (8, 0, 13):
+            raise RuntimeError(
+                f'Index {name} needs MySQL 8.0.13+, server is {".".join(map(str, db.server_version))}',
+            )
+
+        self.delete_active_duplicates(model=model, fields=fields)
+        columns = ', '.join(f'`{column}`' for column in columns)
+        db.execute_sql(f'CREATE UNIQUE INDEX `{name}` ON `{table}` ({columns}, (IF(`is_deleted`, NULL, 1)))')
+
+    @staticmethod
+    def delete_active_duplicates(model: type[Model], fields: tuple[str, ...]):
+        """
+        Rows created before uniqueness was enforced would fail the index: of every group of not deleted rows with
+        the same key the lowest id is kept, the others are soft deleted and logged.
+        """
+        fields = [model._meta.fields[field] for field in fields]
+        duplicates = model.select(*fields, fn.MIN(model.id), fn.COUNT(model.id)).where(
+            model.is_deleted == False,
+        ).group_by(*fields).having(fn.COUNT(model.id) > 1).tuples()
+        for *values, keep_id, count in duplicates:
+            model.update(is_deleted=True).where(
+                reduce(operator.and_, [field == value for field, value in zip(fields, values)]) &
+                (model.is_deleted == False) &
+                (model.id != keep_id)
+            ).execute()
+            keys = ', '.join(f'{field.column_name}={value}' for field, value in zip(fields, values))
+            logging.warning(
+                msg=f'[migrations] {model._meta.table_name}: {count - 1} duplicates of ({keys}) soft deleted, '
+                    f'kept id {keep_id}',
+            )
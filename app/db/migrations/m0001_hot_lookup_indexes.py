@@ -0,0 +1,34 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from app.db.models import Account, Day, Meal, Payment, RolePermission, TextTranslation, Url
+from .base import BaseMigration
+
+
+class HotLookupIndexesMigration(BaseMigration):
+    version = 1
+    name = 'hot_lookup_indexes'
+
+    def up(self):
+        self.add_index(model=Meal, fields=('account_service', 'date', 'type', 'is_deleted'))
+        self.add_index(model=Day, fields=('account_service', 'date'))
+        self.add_index(model=TextTranslation, fields=('text', 'language'))
+        self.add_index(model=Payment, fields=('state', 'is_deleted'))
+        self.add_index(model=Url, fields=('name',))
+        self.add_index(model=Account, fields=('username',))
+        self.add_index(model=RolePermission, fields=('role', 'is_deleted'))
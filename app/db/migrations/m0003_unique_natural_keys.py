@@ -0,0 +1,36 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from app.db.models import AccountRole, Country, Currency, Day, Image, Language, Meal, PaymentMethod, Permission, \
+    Promocode, RolePermission, Service, TelegramUrl, Timezone, Url
+from .base import BaseMigration
+
+
+class UniqueNaturalKeysMigration(BaseMigration):
+    version = 3
+    name = 'unique_natural_keys'
+
+    def up(self):
+        for model in [Country, Currency, Image, Language, PaymentMethod, Permission, Promocode, Service, TelegramUrl,
+                      Timezone]:
+            self.add_unique_active_index(model=model, fields=('id_str',))
+        self.add_unique_active_index(model=Url, fields=('name',))
+        self.add_unique_active_index(model=Day, fields=('account_service', 'date'))
+        self.add_unique_active_index(model=Meal, fields=('account_service', 'date', 'type'))
+        self.add_unique_active_index(model=RolePermission, fields=('role', 'permission'))
+        self.add_unique_active_index(model=AccountRole, fields=('account', 'role'))
@@ -34,6 +34,7 @@ from .meal_product import MealProduct
 from .meal_report import MealReport
 from .meal_report_image import MealReportImage
 from .meal_report_product import MealReportProduct
+from .migration import Migration
 from .payment_method import PaymentMethod
 from .payment_method_currency import PaymentMethodCurrency
 from .permission import Permission
@@ -61,6 +62,8 @@ from .url_click import UrlClick
 from .request import Request
 
 models = (
+    Migration,
+
     Action,
     ActionParameter,
 
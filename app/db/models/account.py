@@ -26,7 +26,7 @@ from .timezone import Timezone
 
 class Account(BaseModel):
     id = PrimaryKeyField()
-    username = CharField(max_length=32)
+    username = CharField(max_length=32, index=True)
     password_salt = CharField(max_length=32)
     password_hash = CharField(max_length=32)
     firstname = CharField(max_length=32)
@@ -31,3 +31,6 @@ class Day(BaseModel):
 
     class Meta:
         db_table = 'days'
+        indexes = (
+            (('account_service', 'date'), False),
+        )
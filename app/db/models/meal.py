@@ -33,3 +33,6 @@ class Meal(BaseModel):
 
     class Meta:
         db_table = 'meals'
+        indexes = (
+            (('account_service', 'date', 'type', 'is_deleted'), False),
+        )
@@ -0,0 +1,33 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from datetime import datetime
+from peewee import PrimaryKeyField, CharField, IntegerField, DateTimeField
+from pytz import UTC
+
+from .base import BaseModel
+
+
+class Migration(BaseModel):
+    id = PrimaryKeyField()
+    version = IntegerField(unique=True)
+    name = CharField(max_length=128)
+    datetime = DateTimeField(default=lambda: datetime.now(tz=UTC))
+
+    class Meta:
+        db_table = 'migrations'
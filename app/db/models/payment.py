@@ -39,3 +39,6 @@ class Payment(BaseModel):
 
     class Meta:
         db_table = 'payments'
+        indexes = (
+            (('state', 'is_deleted'), False),
+        )
@@ -30,3 +30,6 @@ class RolePermission(BaseModel):
 
     class Meta:
         db_table = 'roles_permissions'
+        indexes = (
+            (('role', 'is_deleted'), False),
+        )
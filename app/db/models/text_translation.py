@@ -31,3 +31,6 @@ class TextTranslation(BaseModel):
 
     class Meta:
         db_table = 'texts_translations'
+        indexes = (
+            (('text', 'language'), False),
+        )
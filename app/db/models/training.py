@@ -29,3 +29,6 @@ class Training(BaseModel):
 
     class Meta:
         db_table = 'trainings'
+        indexes = (
+            (('account_service', 'date'), False),
+        )
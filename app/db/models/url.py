@@ -22,7 +22,7 @@ from .base import BaseModel
 
 class Url(BaseModel):
     id = PrimaryKeyField()
-    name = CharField()
+    name = CharField(index=True)
     redirect = CharField()
     is_deleted = BooleanField(default=False)
 
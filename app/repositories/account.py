@@ -17,7 +17,8 @@
 
 from peewee import DoesNotExist
 
-from app.db.models import Account
+from app.db.db_executor import run_sync
+from app.db.models import Account, Country, Language, Timezone, Currency
 from app.repositories.base import BaseRepository
 from app.utils.exceptions import ModelDoesNotExist
 from config import settings
@@ -26,6 +27,40 @@ from config import settings
 class AccountRepository(BaseRepository):
     model = Account
 
+    @staticmethod
+    def select_with_references():
+        """
+        Account select with country, language, timezone and currency joined, so their id_str need no lazy queries.
+        """
+        return Account.select(
+            Account, Country, Language, Timezone, Currency,
+        ).join_from(
+            Account, Country,
+        ).join_from(
+            Account, Language,
+        ).join_from(
+            Account, Timezone,
+        ).join_from(
+            Account, Currency,
+        )
+
+    async def get_by_id_with_references(self, id_: int) -> Account:
+        try:
+            return await run_sync(
+                self.select_with_references().where(
+                    (Account.id == id_) &
+                    (Account.is_deleted == False)
+                ).get
+            )
+        except DoesNotExist:
+            raise ModelDoesNotExist(
+                kwargs={
+                    'model': 'Account',
+                    'id_type': 'id',
+                    'id_value': id_,
+                },
+            )
+
     @staticmethod
     async def get_by_username(username: str) -> Account:
         try:
@@ -54,14 +89,14 @@ class AccountRepository(BaseRepository):
         if not id_:
             id_ = ''
 
-        query = Account.select().where(
+        query = AccountRepository.select_with_references().where(
             (Account.is_deleted == False) &
             (Account.username % f'%{username}%') &
             (Account.id % f'%{id_}%')
         )
 
-        accounts = query.limit(
+        accounts = await run_sync(query.limit(
             settings.items_per_page
-        ).offset(settings.items_per_page*(page-1)).order_by(Account.id).execute()
-        results = query.count()
+        ).offset(settings.items_per_page*(page-1)).order_by(Account.id).execute)
+        results = await run_sync(query.count)
         return accounts, results
@@ -13,50 +13,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from peewee import DoesNotExist
-
-from app.db.models import AccountRole, Account, Permission
-from .role_permission import RolePermissionRepository
+from app.db.db_executor import run_sync
+from app.db.models import AccountRole, Account, Permission, RolePermission
 from app.repositories.base import BaseRepository
-from ..utils.exceptions import ModelAlreadyExist
 
 
 class AccountRoleRepository(BaseRepository):
     model = AccountRole
-
-    async def create(self, **kwargs):
-        try:
-            account = kwargs.get('account')
-            role = kwargs.get('role')
-            AccountRole.get(
-                (AccountRole.promocode == account) &
-                (AccountRole.currency == role) &
-                (AccountRole.is_deleted == False)
-            )
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'AccountRole',
-                    'id_type': 'account, role',
-                    'id_value': [account.id, role.id],
-                },
-            )
-        except DoesNotExist:
-            return await super().create(**kwargs)
+    unique_fields = ('account', 'role')
 
     @staticmethod
     async def get_account_permissions(account: Account, only_id_str=False) -> list[str | Permission]:
-        permissions = []
-
-        for account_role in AccountRole.select().where(
-                (AccountRole.account == account) &
-                (AccountRole.is_deleted == False)
-        ):
-            permissions += await RolePermissionRepository.get_permissions_by_role(
-                role=account_role.role,
-                only_id_str=only_id_str,
-            )
-
-        return permissions
+        query = Permission.select().join(
+            RolePermission,
+            on=(RolePermission.permission == Permission.id),
+        ).join(
+            AccountRole,
+            on=(AccountRole.role == RolePermission.role),
+        ).where(
+            (AccountRole.account == account) &
+            (AccountRole.is_deleted == False) &
+            (RolePermission.is_deleted == False)
+        )
+        permissions = await run_sync(query.execute)
+
+        return [permission.id_str if only_id_str else permission for permission in permissions]
 
     @staticmethod
     async def get_by_account(account: Account) -> list[AccountRole]:
@@ -16,6 +16,7 @@
 
 
 from .base import BaseRepository
+from ..db.db_executor import run_sync
 from ..db.models import Account, AccountService
 
 
@@ -24,8 +25,15 @@ class AccountServiceRepository(BaseRepository):
 
     @staticmethod
     async def get_list_by_account(account: Account) -> list[AccountService]:
-        return AccountService.select().where(
+        return await run_sync(AccountService.select().where(
             (AccountService.account == account) &
             (AccountService.is_deleted == False)
-        )
+        ).execute)
 
+    @staticmethod
+    async def get_ids_by_ids(ids: list[int]) -> list[int]:
+        rows = await run_sync(AccountService.select(AccountService.id).where(
+            (AccountService.id.in_(ids)) &
+            (AccountService.is_deleted == False)
+        ).tuples().execute)
+        return [id_ for id_, in rows]
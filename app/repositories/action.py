@@ -15,6 +15,11 @@
 #
 
 
+
+from peewee import chunked
+
+from app.db.db import db
+from app.db.db_executor import run_sync
 from app.db.models import Action, ActionParameter
 from app.repositories.base import BaseRepository
 
@@ -23,5 +28,22 @@ class ActionRepository(BaseRepository):
     model = Action
 
     @staticmethod
-    async def create_parameter(action: Action, key: str, value: str) -> ActionParameter:
-        return ActionParameter.create(action=action, key=key, value=value)
+    def _create_list(actions: list[dict]):
+        with db.atomic():
+            parameters = []
+            for action in actions:
+                action_id = Action.insert(
+                    datetime=action['datetime'],
+                    model=action['model'],
+                    model_id=action['model_id'],
+                    action=action['action'],
+                ).execute()
+                parameters += [
+                    {'action': action_id, 'key': key, 'value': value}
+                    for key, value in action['parameters'].items()
+                ]
+            for parameters_chunk in chunked(parameters, 1000):
+                ActionParameter.insert_many(parameters_chunk).execute()
+
+    async def create_list(self, actions: list[dict]):
+        await run_sync(self._create_list, actions=actions)
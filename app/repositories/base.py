@@ -15,15 +15,23 @@
 #
 
 
-from peewee import DoesNotExist
+from datetime import date
 
+from peewee import DoesNotExist, IntegrityError
+
+from app.db.db_executor import run_sync
 from app.db.models.base import BaseModel
-from app.utils.exceptions import ModelDoesNotExist, ModelAlreadyExist
+from app.repositories.cascade import delete_cascade
+from app.utils.exceptions import InvalidCursor, ModelDoesNotExist, ModelAlreadyExist
+
+
+ER_DUP_ENTRY = 1062
 
 
 class BaseRepository:
     model: BaseModel
     model_name: str
+    unique_fields: tuple[str, ...] = ('id_str',)
 
     def __init__(self, model: BaseModel = None):
         if model:
@@ -31,43 +39,94 @@ class BaseRepository:
 
     async def is_exist(self, id_: str) -> bool:
         try:
-            self.model.get((self.model.id == id_) & (self.model.is_deleted == False))
+            await run_sync(self.model.get, (self.model.id == id_) & (self.model.is_deleted == False))
             return True
         except DoesNotExist:
             return False
 
     async def is_exist_by_id_str(self, id_str: str) -> bool:
         try:
-            self.model.get((self.model.id_str == id_str) & (self.model.is_deleted == False))
+            await run_sync(self.model.get, (self.model.id_str == id_str) & (self.model.is_deleted == False))
             return True
         except DoesNotExist:
             return False
 
     async def create(self, **kwargs):
-        if 'id_str' in kwargs.keys():
-            id_str = kwargs.get('id_str')
+        # Uniqueness of unique_fields among not deleted rows is enforced by the database (see migration 3)
+        try:
+            return await run_sync(self.model.create, **kwargs)
+        except IntegrityError as e:
+            self._raise_already_exist(e=e, values=kwargs)
+
+    def _raise_already_exist(self, e: IntegrityError, values: dict):
+        # Duplicate key of a unique index becomes ModelAlreadyExist, any other integrity error is raised as is
+        if e.args[0] != ER_DUP_ENTRY:
+            raise e
+        values = [values.get(field) for field in self.unique_fields]
+        values = [value.id if isinstance(value, BaseModel) else value for value in values]
+        values = [value.isoformat() if isinstance(value, date) else value for value in values]
+        raise ModelAlreadyExist(
+            kwargs={
+                'model': self.model.__name__,
+                'id_type': ', '.join(self.unique_fields),
+                'id_value': values[0] if len(values) == 1 else values,
+            },
+        )
+
+    async def get_list(self) -> list[BaseModel]:
+        return await run_sync(self.model.select().where(self.model.is_deleted == False).execute)
+
+    async def get_list_by_account_service_and_dates(
+            self,
+            account_service: BaseModel,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
+    ) -> tuple[list[BaseModel], str | None]:
+        """
+        Keyset page ordered by (date, id) for models with account_service and date, the cursor is "<date>_<id>"
+        of the last returned row.
+        """
+        query = self.model.select().where(
+            (self.model.account_service == account_service) &
+            (self.model.is_deleted == False)
+        )
+        if date_from:
+            query = query.where(self.model.date >= date_from)
+        if date_to:
+            query = query.where(self.model.date <= date_to)
+        if cursor:
             try:
-                await self.get_by_id_str(id_str=id_str)
-                raise ModelAlreadyExist(
+                cursor_date_str, cursor_id_str = cursor.split('_')
+                cursor_date, cursor_id = date.fromisoformat(cursor_date_str), int(cursor_id_str)
+            except ValueError:
+                raise InvalidCursor(
                     kwargs={
-                        'model': self.model.__class__.__name__,
-                        'id_type': 'id_str',
-                        'id_value': id_str,
+                        'cursor': cursor,
                     },
                 )
-            except ModelDoesNotExist:
-                pass
-
-        return self.model.create(**kwargs)
+            query = query.where(
+                (self.model.date > cursor_date) |
+                ((self.model.date == cursor_date) & (self.model.id > cursor_id))
+            )
+        query = query.order_by(self.model.date, self.model.id)
+        if limit:
+            query = query.limit(limit + 1)
 
-    async def get_list(self) -> list[BaseModel]:
-        return self.model.select().where(self.model.is_deleted == False).execute()
+        models = list(await run_sync(query.execute))
+        next_cursor = None
+        if limit and len(models) > limit:
+            models = models[:limit]
+            next_cursor = f'{models[-1].date.isoformat()}_{models[-1].id}'
+        return models, next_cursor
 
     async def get_by_id(self, id_: int) -> BaseModel:
         try:
-            model = self.model.get(
+            model = await run_sync(
+                self.model.get,
                 (self.model.id == id_) &
-                (self.model.is_deleted == False)
+                (self.model.is_deleted == False),
             )
             return model
         except DoesNotExist:
@@ -81,11 +140,12 @@ class BaseRepository:
 
     async def get_by_id_str(self, id_str: str) -> BaseModel:
         try:
-            self.model = self.model.get(
+            model = await run_sync(
+                self.model.get,
                 (self.model.id_str == id_str) &
-                (self.model.is_deleted == False)
+                (self.model.is_deleted == False),
             )
-            return self.model
+            return model
         except DoesNotExist:
             raise ModelDoesNotExist(
                 kwargs={
@@ -95,26 +155,39 @@ class BaseRepository:
                 },
             )
 
-    @staticmethod
-    async def update(model, **kwargs):
+    async def update(self, model: BaseModel, **kwargs) -> bool:
+        """
+        Empty values are skipped and -1 clears a field. Only the changed fields are written, returns False without
+        touching the database when nothing changed.
+        """
+        fields = []
         for key, value in kwargs.items():
             if key[-1] == '_':
                 key = key[:-1]
-            if value:
-                if isinstance(value, int) and value == -1:
-                    exec(f'model.{key} = None')
-                else:
-                    exec(f'model.{key} = value')
-            elif isinstance(value, bool) and value == False:
-                exec(f'model.{key} = False')
-            elif isinstance(value, bool) and value == True:
-                exec(f'model.{key} = True')
-            elif isinstance(value, int) and value == 0:
-                exec(f'model.{key} = 0')
-        model.save()
+            if not value and not isinstance(value, int):
+                continue
+            if isinstance(value, int) and value == -1:
+                value = None
+            field = model._meta.fields.get(key)
+            if not field:
+                continue
+            if model.__data__.get(field.name) == (value.id if isinstance(value, BaseModel) else value):
+                continue
+            setattr(model, key, value)
+            fields.append(field)
+        if not fields:
+            return False
+        try:
+            await run_sync(model.save, only=fields)
+        except IntegrityError as e:
+            self._raise_already_exist(e=e, values=model.__data__)
+        return True
+
+    async def delete_cascade(self, models: list[BaseModel]) -> dict[type[BaseModel], list[int]]:
+        return await run_sync(delete_cascade, self.model, [model.id for model in models])
 
     @staticmethod
     async def delete(model: BaseModel) -> BaseModel:
         model.is_deleted = True
-        model.save()
+        await run_sync(model.save)
         return model
@@ -0,0 +1,95 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from peewee import chunked, fn
+
+from app.db.db import db
+from app.db.models import Day, DayMeal, DayTraining, Meal, MealProduct, MealReport, MealReportImage, \
+    MealReportProduct, Training, TrainingExercise, TrainingReport
+from app.db.models.base import BaseModel
+
+
+# Parent model -> (child model, condition selecting children of the given parent ids)
+CASCADE = {
+    Day: [
+        (DayMeal, lambda ids: DayMeal.day.in_(ids)),
+        (DayTraining, lambda ids: DayTraining.day.in_(ids)),
+        (Meal, lambda ids: fn.EXISTS(Day.select(Day.id).where(
+            (Day.id.in_(ids)) &
+            (Day.account_service == Meal.account_service) &
+            (Day.date == Meal.date)
+        ))),
+        (Training, lambda ids: fn.EXISTS(Day.select(Day.id).where(
+            (Day.id.in_(ids)) &
+            (Day.account_service == Training.account_service) &
+            (Day.date == Training.date)
+        ))),
+    ],
+    DayMeal: [
+        (Meal, lambda ids: Meal.id.in_(DayMeal.select(DayMeal.meal).where(DayMeal.id.in_(ids)))),
+    ],
+    DayTraining: [
+        (Training, lambda ids: Training.id.in_(
+            DayTraining.select(DayTraining.training).where(DayTraining.id.in_(ids))
+        )),
+    ],
+    Meal: [
+        (DayMeal, lambda ids: DayMeal.meal.in_(ids)),
+        (MealProduct, lambda ids: MealProduct.meal.in_(ids)),
+        (MealReport, lambda ids: MealReport.meal.in_(ids)),
+    ],
+    MealReport: [
+        (MealReportProduct, lambda ids: MealReportProduct.meal_report.in_(ids)),
+        (MealReportImage, lambda ids: MealReportImage.meal_report.in_(ids)),
+    ],
+    Training: [
+        (DayTraining, lambda ids: DayTraining.training.in_(ids)),
+        (TrainingExercise, lambda ids: TrainingExercise.training.in_(ids)),
+        (TrainingReport, lambda ids: TrainingReport.training.in_(ids)),
+    ],
+}
+
+
+def delete_cascade(model, ids: list[int]) -> dict[type[BaseModel], list[int]]:
+    """
+    Soft delete rows with their whole subtree: children are collected level by level, then every table gets
+    a single UPDATE. Returns affected ids by model, roots included.
+    """
+    deleted = {}
+    queue = [(model, ids)]
+    with db.atomic():
+        while queue:
+            model, ids = queue.pop(0)
+            ids = [id_ for id_ in ids if id_ not in deleted.setdefault(model, [])]
+            if not ids:
+                continue
+            deleted[model] += ids
+            for child_model, condition in CASCADE.get(model, []):
+                queue.append((
+                    child_model,
+                    [
+                        id_ for id_, in child_model.select(child_model.id).where(
+                            (condition(ids)) &
+                            (child_model.is_deleted == False)
+                        ).order_by(child_model.id).tuples()
+                    ],
+                ))
+
+        for model, ids in deleted.items():
+            for ids_chunk in chunked(ids, 1000):
+                model.update(is_deleted=True).where(model.id.in_(ids_chunk)).execute()
+    return {model: ids for model, ids in deleted.items() if ids}
@@ -16,8 +16,8 @@
 
 
 from app.db.models import Country
-from app.repositories.base import BaseRepository
+from app.repositories.reference import ReferenceRepository
 
 
-class CountryRepository(BaseRepository):
+class CountryRepository(ReferenceRepository):
     model = Country
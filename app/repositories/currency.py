@@ -16,8 +16,8 @@
 
 
 from app.db.models import Currency
-from app.repositories.base import BaseRepository
+from app.repositories.reference import ReferenceRepository
 
 
-class CurrencyRepository(BaseRepository):
+class CurrencyRepository(ReferenceRepository):
     model = Currency
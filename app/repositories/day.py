@@ -15,40 +15,25 @@
 #
 from datetime import date
 
-from peewee import DoesNotExist
+from peewee import DoesNotExist, chunked
 
-from app.db.models import Day
+from app.db.db import db
+from app.db.db_executor import run_sync
+from app.db.models import Day, DayMeal, DayTraining, Meal, MealProduct, Training, TrainingExercise
 from .base import BaseRepository
 from app.db.models import AccountService
-from ..utils.exceptions import ModelAlreadyExist, ModelDoesNotExist
+from ..utils.exceptions import ModelDoesNotExist
 
 
 class DayRepository(BaseRepository):
     model = Day
-
-    async def create(self, **kwargs):
-        try:
-            account_service = kwargs.get('account_service')
-            date_ = kwargs.get('date')
-            Day.get(
-                (Day.account_service == account_service) &
-                (Day.date == date_) &
-                (Day.is_deleted == False)
-            )
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Day',
-                    'id_type': 'account_service, date',
-                    'id_value': [account_service.id, str(date_)],
-                },
-            )
-        except DoesNotExist:
-            return await super().create(**kwargs)
+    unique_fields = ('account_service', 'date')
 
     @staticmethod
     async def get_by_date(date_: date, account_service: AccountService):
         try:
-            return Day.get(
+            return await run_sync(
+                Day.get,
                 (Day.account_service == account_service) &
                 (Day.date == date_) &
                 (Day.is_deleted == False)
@@ -63,8 +48,160 @@ class DayRepository(BaseRepository):
             )
 
     @staticmethod
-    async def get_list_by_account_service(account_service: AccountService):
-        return Day.select().where(
-            (Day.account_service == account_service) &
-            (Day.is_deleted == False)
+    def _get_ids_by_dates(model, account_service: AccountService, dates: list[date], types: list[str] = None) -> dict:
+        query = model.select().where(
+            (model.account_service == account_service) &
+            (model.date.in_(dates)) &
+            (model.is_deleted == False)
+        )
+        if types is not None:
+            query = query.where(model.type.in_(types))
+            return {(model_.date, model_.type): model_.id for model_ in query.order_by(model.id)}
+        return {model_.date: model_.id for model_ in query.order_by(model.id)}
+
+    @staticmethod
+    def _get_linked_ids(field, ids: list[int]) -> set[int]:
+        # Ids from ids that already have a not deleted day link through field (DayMeal.meal, DayTraining.training)
+        if not ids:
+            return set()
+        return {
+            id_ for id_, in field.model.select(field).where(
+                (field.in_(ids)) &
+                (field.model.is_deleted == False)
+            ).tuples()
+        }
+
+    def _duplicate(self, day: Day, dates: list[date]) -> dict:
+        account_service = day.account_service
+        meals = list(
+            Meal.select().join(DayMeal, on=(DayMeal.meal == Meal.id)).where(
+                (DayMeal.day == day) &
+                (DayMeal.is_deleted == False) &
+                (Meal.is_deleted == False)
+            ).order_by(Meal.id)
+        )
+        meals_products = {meal.id: [] for meal in meals}
+        if meals:
+            for meal_product in MealProduct.select().where(
+                (MealProduct.meal.in_(list(meals_products))) &
+                (MealProduct.is_deleted == False)
+            ).order_by(MealProduct.id):
+                meals_products[meal_product.meal_id].append(meal_product)
+        trainings_exercises = list(
+            TrainingExercise.select().join(
+                DayTraining, on=(DayTraining.training == TrainingExercise.training),
+            ).where(
+                (DayTraining.day == day) &
+                (DayTraining.is_deleted == False) &
+                (TrainingExercise.is_deleted == False)
+            ).order_by(TrainingExercise.id)
         )
+        types = [meal.type for meal in meals]
+
+        with db.atomic():
+            # Days
+            days = self._get_ids_by_dates(Day, account_service=account_service, dates=dates)
+            if days:
+                Day.update(water_amount=day.water_amount).where(Day.id.in_(list(days.values()))).execute()
+            days_created = [date_ for date_ in dates if date_ not in days]
+            for dates_chunk in chunked(days_created, 500):
+                Day.insert_many(
+                    [
+                        {'account_service': account_service, 'date': date_, 'water_amount': day.water_amount}
+                        for date_ in dates_chunk
+                    ],
+                ).execute()
+            days = self._get_ids_by_dates(Day, account_service=account_service, dates=dates)
+
+            # Meals
+            meals_current = self._get_ids_by_dates(Meal, account_service=account_service, dates=dates, types=types)
+            for meal in meals:
+                meals_ids = [meals_current[date_, meal.type] for date_ in dates if (date_, meal.type) in meals_current]
+                if meals_ids:
+                    Meal.update(
+                        fats=meal.fats,
+                        proteins=meal.proteins,
+                        carbohydrates=meal.carbohydrates,
+                    ).where(Meal.id.in_(meals_ids)).execute()
+            if meals_current:
+                MealProduct.update(is_deleted=True).where(
+                    (MealProduct.meal.in_(list(meals_current.values()))) &
+                    (MealProduct.is_deleted == False)
+                ).execute()
+            meals_created = [
+                (date_, meal) for date_ in dates for meal in meals if (date_, meal.type) not in meals_current
+            ]
+            for meals_chunk in chunked(meals_created, 500):
+                Meal.insert_many(
+                    [
+                        {
+                            'account_service': account_service,
+                            'date': date_,
+                            'type': meal.type,
+                            'fats': meal.fats,
+                            'proteins': meal.proteins,
+                            'carbohydrates': meal.carbohydrates,
+                        }
+                        for date_, meal in meals_chunk
+                    ],
+                ).execute()
+            meals_ids = self._get_ids_by_dates(Meal, account_service=account_service, dates=dates, types=types)
+            # Existing meals may have no day link yet, so every unlinked target meal gets one
+            meals_linked = self._get_linked_ids(field=DayMeal.meal, ids=list(meals_ids.values()))
+            for meals_chunk in chunked([key for key, id_ in meals_ids.items() if id_ not in meals_linked], 500):
+                DayMeal.insert_many(
+                    [{'day': days[date_], 'meal': meals_ids[date_, type_]} for date_, type_ in meals_chunk],
+                ).execute()
+            for meals_products_chunk in chunked(
+                    [
+                        {'meal': meals_ids[date_, meal.type], 'product': meal_product.product_id,
+                         'value': meal_product.value}
+                        for date_ in dates for meal in meals for meal_product in meals_products[meal.id]
+                    ],
+                    500,
+            ):
+                MealProduct.insert_many(meals_products_chunk).execute()
+
+            # Trainings
+            trainings_current = self._get_ids_by_dates(Training, account_service=account_service, dates=dates)
+            if trainings_current:
+                TrainingExercise.update(is_deleted=True).where(
+                    (TrainingExercise.training.in_(list(trainings_current.values()))) &
+                    (TrainingExercise.is_deleted == False)
+                ).execute()
+            trainings_created = [date_ for date_ in dates if date_ not in trainings_current]
+            for dates_chunk in chunked(trainings_created, 500):
+                Training.insert_many(
+                    [{'account_service': account_service, 'date': date_} for date_ in dates_chunk],
+                ).execute()
+            trainings_ids = self._get_ids_by_dates(Training, account_service=account_service, dates=dates)
+            trainings_linked = self._get_linked_ids(field=DayTraining.training, ids=list(trainings_ids.values()))
+            trainings_unlinked = [date_ for date_, id_ in trainings_ids.items() if id_ not in trainings_linked]
+            for dates_chunk in chunked(trainings_unlinked, 500):
+                DayTraining.insert_many(
+                    [{'day': days[date_], 'training': trainings_ids[date_]} for date_ in dates_chunk],
+                ).execute()
+            for trainings_exercises_chunk in chunked(
+                    [
+                        {'training': trainings_ids[date_], 'exercise': training_exercise.exercise_id,
+                         'priority': training_exercise.priority, 'value': training_exercise.value,
+                         'rest': training_exercise.rest}
+                        for date_ in dates for training_exercise in trainings_exercises
+                    ],
+                    500,
+            ):
+                TrainingExercise.insert_many(trainings_exercises_chunk).execute()
+
+        return {
+            date_: {
+                'id': days[date_],
+                'is_created': date_ in days_created,
+                'meals': len(meals),
+                'meals_products': sum(len(meal_products) for meal_products in meals_products.values()),
+                'trainings_exercises': len(trainings_exercises),
+            }
+            for date_ in dates
+        }
+
+    async def duplicate(self, day: Day, dates: list[date]) -> dict:
+        return await run_sync(self._duplicate, day, dates)
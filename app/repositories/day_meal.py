@@ -16,6 +16,7 @@
 
 from peewee import DoesNotExist
 
+from app.db.db_executor import run_sync
 from app.db.models import DayMeal, Day, Meal
 from .base import BaseRepository
 from ..utils.exceptions import ModelAlreadyExist
@@ -26,10 +27,10 @@ class DayMealRepository(BaseRepository):
 
     @staticmethod
     async def get_list_by_day(day: Day) -> list[DayMeal]:
-        return DayMeal.select().where(
+        return await run_sync(DayMeal.select().where(
             (DayMeal.day == day) &
             (DayMeal.is_deleted == False)
-        ).execute()
+        ).execute)
 
     @staticmethod
     async def get_by_day_and_meal(
@@ -37,7 +38,8 @@ class DayMealRepository(BaseRepository):
             meal: Meal,
     ):
         try:
-            return DayMeal.get(
+            return await run_sync(
+                DayMeal.get,
                 (DayMeal.day == day) &
                 (DayMeal.meal == meal) &
                 (DayMeal.is_deleted == False)
@@ -49,7 +51,8 @@ class DayMealRepository(BaseRepository):
         try:
             day = kwargs.get('day')
             meal = kwargs.get('meal')
-            DayMeal.get(
+            await run_sync(
+                DayMeal.get,
                 (DayMeal.day == day) &
                 (DayMeal.meal == meal) &
                 (DayMeal.is_deleted == False)
@@ -64,3 +67,11 @@ class DayMealRepository(BaseRepository):
         except DoesNotExist:
             return await super().create(**kwargs)
 
+    @staticmethod
+    async def get_list_by_days(days: list[Day]) -> list[DayMeal]:
+        return await run_sync(
+            DayMeal.select(DayMeal, Meal).join(Meal).where(
+                (DayMeal.day.in_([day.id for day in days])) &
+                (DayMeal.is_deleted == False)
+            ).order_by(DayMeal.id).execute
+        )
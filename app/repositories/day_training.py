@@ -16,7 +16,8 @@
 
 from peewee import DoesNotExist
 
-from app.db.models import DayTraining, Day
+from app.db.db_executor import run_sync
+from app.db.models import DayTraining, Day, Training
 from .base import BaseRepository
 from ..utils.exceptions import ModelAlreadyExist
 
@@ -27,7 +28,8 @@ class DayTrainingRepository(BaseRepository):
     @staticmethod
     async def get_by_day(day: Day) -> DayTraining | bool:
         try:
-            return DayTraining.get(
+            return await run_sync(
+                DayTraining.get,
                 (DayTraining.day == day) &
                 (DayTraining.is_deleted == False)
             )
@@ -38,7 +40,8 @@ class DayTrainingRepository(BaseRepository):
         try:
             day = kwargs.get('day')
             training = kwargs.get('training')
-            DayTraining.get(
+            await run_sync(
+                DayTraining.get,
                 (DayTraining.day == day) &
                 (DayTraining.training == training) &
                 (DayTraining.is_deleted == False)
@@ -53,3 +56,11 @@ class DayTrainingRepository(BaseRepository):
         except DoesNotExist:
             return await super().create(**kwargs)
 
+    @staticmethod
+    async def get_list_by_days(days: list[Day]) -> list[DayTraining]:
+        return await run_sync(
+            DayTraining.select(DayTraining, Training).join(Training).where(
+                (DayTraining.day.in_([day.id for day in days])) &
+                (DayTraining.is_deleted == False)
+            ).order_by(DayTraining.id).execute
+        )
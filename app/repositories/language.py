@@ -16,8 +16,8 @@
 
 
 from app.db.models import Language
-from app.repositories.base import BaseRepository
+from app.repositories.reference import ReferenceRepository
 
 
-class LanguageRepository(BaseRepository):
+class LanguageRepository(ReferenceRepository):
     model = Language
@@ -19,34 +19,14 @@ from datetime import date
 
 from peewee import DoesNotExist
 
+from app.db.db_executor import run_sync
 from app.db.models import AccountService, Meal
 from app.repositories.base import BaseRepository
-from app.utils.exceptions import ModelAlreadyExist
 
 
 class MealRepository(BaseRepository):
     model = Meal
-
-    async def create(self, **kwargs):
-        try:
-            account_service = kwargs.get('account_service')
-            date_ = kwargs.get('date')
-            type_ = kwargs.get('type')
-            Meal.get(
-                (Meal.account_service == account_service) &
-                (Meal.date == date_) &
-                (Meal.type == type_) &
-                (Meal.is_deleted == False)
-            )
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Meal',
-                    'id_type': 'account_service, date, type',
-                    'id_value': [account_service.id, str(date_), type_],
-                },
-            )
-        except DoesNotExist:
-            return await super().create(**kwargs)
+    unique_fields = ('account_service', 'date', 'type')
 
     @staticmethod
     async def get_by_parameters(
@@ -55,7 +35,8 @@ class MealRepository(BaseRepository):
             type_: str,
     ):
         try:
-            return Meal.get(
+            return await run_sync(
+                Meal.get,
                 (Meal.account_service == account_service) &
                 (Meal.date == date_) &
                 (Meal.type == type_) &
@@ -70,16 +51,16 @@ class MealRepository(BaseRepository):
             date_: date = None,
     ) -> list[Meal]:
         if date_:
-            return Meal.select().where(
+            return await run_sync(Meal.select().where(
                 (Meal.account_service == account_service) &
                 (Meal.date == date_) &
                 (Meal.is_deleted == False)
-            ).execute()
+            ).execute)
         else:
-            return Meal.select().where(
+            return await run_sync(Meal.select().where(
                 (Meal.account_service == account_service) &
                 (Meal.is_deleted == False)
-            ).execute()
+            ).execute)
 
     @staticmethod
     async def is_exist_by_parameters(
@@ -88,7 +69,8 @@ class MealRepository(BaseRepository):
             type_: str,
     ) -> bool:
         try:
-            Meal.get(
+            await run_sync(
+                Meal.get,
                 (Meal.account_service == account_service) &
                 (Meal.date == date_) &
                 (Meal.type == type_) &
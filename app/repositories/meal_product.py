@@ -15,6 +15,9 @@
 #
 
 
+from datetime import date
+
+from app.db.db_executor import run_sync
 from app.db.models import Meal, MealProduct
 from app.repositories.base import BaseRepository
 
@@ -24,7 +27,35 @@ class MealProductRepository(BaseRepository):
 
     @staticmethod
     async def get_list_by_meal(meal: Meal) -> list[MealProduct]:
-        return MealProduct().select().where(
+        return await run_sync(MealProduct().select().where(
             (MealProduct.meal == meal) &
             (MealProduct.is_deleted == False)
-        ).execute()
+        ).execute)
+
+    @staticmethod
+    async def get_list_by_meals(meals: list[Meal]) -> list[MealProduct]:
+        return await run_sync(
+            MealProduct.select().where(
+                (MealProduct.meal.in_([meal.id for meal in meals])) &
+                (MealProduct.is_deleted == False)
+            ).order_by(MealProduct.id).execute
+        )
+
+    @staticmethod
+    async def get_values_by_account_services(
+            account_services_ids: list[int],
+            date_from: date,
+            date_to: date,
+    ) -> list[tuple[int, date, int, int]]:
+        # (account_service_id, date, product_id, value)
+        return await run_sync(
+            MealProduct.select(Meal.account_service, Meal.date, MealProduct.product, MealProduct.value).join(
+                Meal, on=(Meal.id == MealProduct.meal),
+            ).where(
+                (Meal.account_service.in_(account_services_ids)) &
+                (Meal.date >= date_from) &
+                (Meal.date <= date_to) &
+                (Meal.is_deleted == False) &
+                (MealProduct.is_deleted == False)
+            ).tuples().execute
+        )
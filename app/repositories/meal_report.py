@@ -17,6 +17,7 @@
 
 from peewee import DoesNotExist
 
+from ..db.db_executor import run_sync
 from .base import BaseRepository
 from ..db.models import Meal, MealReport
 
@@ -27,7 +28,7 @@ class MealReportRepository(BaseRepository):
     @staticmethod
     async def is_exist_by_meal(meal: Meal):
         try:
-            MealReport.get((MealReport.meal == meal) & (MealReport.is_deleted == False))
+            await run_sync(MealReport.get, (MealReport.meal == meal) & (MealReport.is_deleted == False))
             return True
         except DoesNotExist:
             return False
@@ -35,6 +36,15 @@ class MealReportRepository(BaseRepository):
     @staticmethod
     async def get_by_meal(meal: Meal):
         try:
-            return MealReport.get((MealReport.meal == meal) & (MealReport.is_deleted == False))
+            return await run_sync(MealReport.get, (MealReport.meal == meal) & (MealReport.is_deleted == False))
         except DoesNotExist:
             return False
+
+    @staticmethod
+    async def get_list_by_meals(meals: list[Meal]) -> list[MealReport]:
+        return await run_sync(
+            MealReport.select().where(
+                (MealReport.meal.in_([meal.id for meal in meals])) &
+                (MealReport.is_deleted == False)
+            ).order_by(MealReport.id).execute
+        )
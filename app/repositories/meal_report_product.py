@@ -15,8 +15,11 @@
 #
 
 
+from datetime import date
+
 from .base import BaseRepository
-from ..db.models import MealReport, MealReportProduct
+from ..db.db_executor import run_sync
+from ..db.models import Meal, MealReport, MealReportProduct
 
 
 class MealReportProductRepository(BaseRepository):
@@ -28,3 +31,27 @@ class MealReportProductRepository(BaseRepository):
             (MealReportProduct.meal_report == meal_report) &
             (MealReportProduct.is_deleted == False)
         ).execute()
+
+    @staticmethod
+    async def get_values_by_account_services(
+            account_services_ids: list[int],
+            date_from: date,
+            date_to: date,
+    ) -> list[tuple[int, date, int, int]]:
+        # (account_service_id, date, product_id, value)
+        return await run_sync(
+            MealReportProduct.select(
+                Meal.account_service, Meal.date, MealReportProduct.product, MealReportProduct.value,
+            ).join(
+                MealReport, on=(MealReport.id == MealReportProduct.meal_report),
+            ).join(
+                Meal, on=(Meal.id == MealReport.meal),
+            ).where(
+                (Meal.account_service.in_(account_services_ids)) &
+                (Meal.date >= date_from) &
+                (Meal.date <= date_to) &
+                (Meal.is_deleted == False) &
+                (MealReport.is_deleted == False) &
+                (MealReportProduct.is_deleted == False)
+            ).tuples().execute
+        )
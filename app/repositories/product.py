@@ -15,6 +15,7 @@
 #
 
 
+from app.db.db_executor import run_sync
 from app.db.models import Product
 from .base import BaseRepository
 
@@ -36,3 +37,14 @@ class ProductRepository(BaseRepository):
             (Product.is_main == True) &
             (Product.is_deleted == False)
         ).execute()
+
+    @staticmethod
+    async def get_nutrients_by_ids(ids: list[int]) -> list[tuple[int, str, float, float, float, int | None]]:
+        # (id, unit, fats, proteins, carbohydrates, calories), deleted products are kept for the history
+        return await run_sync(
+            Product.select(
+                Product.id, Product.unit, Product.fats, Product.proteins, Product.carbohydrates, Product.calories,
+            ).where(
+                Product.id.in_(ids),
+            ).tuples().execute
+        )
@@ -0,0 +1,73 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from copy import copy
+
+from app.db.models.base import BaseModel
+from app.repositories.base import BaseRepository
+from app.utils.reference_cache import reference_cache
+
+
+class ReferenceRepository(BaseRepository):
+    @staticmethod
+    def _copy(model: BaseModel) -> BaseModel:
+        # Cached instances are shared between requests, callers get their own copy to modify
+        model_copy = copy(model)
+        model_copy.__data__ = dict(model.__data__)
+        model_copy._dirty = set(model._dirty)
+        model_copy.__rel__ = dict(model.__rel__)
+        return model_copy
+
+    async def is_exist_by_id_str(self, id_str: str) -> bool:
+        if reference_cache.get(key=(self.model.__name__, 'id_str', id_str)):
+            return True
+        return await super().is_exist_by_id_str(id_str=id_str)
+
+    async def get_list(self) -> list[BaseModel]:
+        key = (self.model.__name__, 'list')
+        models = reference_cache.get(key=key)
+        if models is None:
+            version = reference_cache.version
+            models = list(await super().get_list())
+            reference_cache.set(key=key, value=models, version=version)
+        return [self._copy(model=model) for model in models]
+
+    async def get_by_id(self, id_: int) -> BaseModel:
+        key = (self.model.__name__, 'id', id_)
+        model = reference_cache.get(key=key)
+        if not model:
+            version = reference_cache.version
+            model = await super().get_by_id(id_=id_)
+            reference_cache.set(key=key, value=model, version=version)
+        return self._copy(model=model)
+
+    async def get_by_id_str(self, id_str: str) -> BaseModel:
+        key = (self.model.__name__, 'id_str', id_str)
+        model = reference_cache.get(key=key)
+        if not model:
+            version = reference_cache.version
+            model = await super().get_by_id_str(id_str=id_str)
+            reference_cache.set(key=key, value=model, version=version)
+        return self._copy(model=model)
+
+    async def update(self, model: BaseModel, **kwargs) -> bool:
+        # Cached copies may be stale, changes are compared against the current row
+        model_current = await super().get_by_id(id_=model.id)
+        model.__data__.update(model_current.__data__)
+        model.__rel__.clear()
+        return await super().update(model=model, **kwargs)
@@ -16,8 +16,8 @@
 
 
 from app.db.models import Service
-from .base import BaseRepository
+from .reference import ReferenceRepository
 
 
-class ServiceRepository(BaseRepository):
+class ServiceRepository(ReferenceRepository):
     model = Service
@@ -15,9 +15,43 @@
 #
 
 
-from app.db.models import Session
+from peewee import DoesNotExist
+
+from app.db.db_executor import run_sync
+from app.db.models import Session, Account, Country, Language, Timezone, Currency
 from app.repositories.base import BaseRepository
+from app.utils.exceptions import ModelDoesNotExist
 
 
 class SessionRepository(BaseRepository):
     model = Session
+
+    @staticmethod
+    async def get_by_id_with_account(id_: int) -> Session:
+        try:
+            return await run_sync(
+                Session.select(
+                    Session, Account, Country, Language, Timezone, Currency,
+                ).join(
+                    Account,
+                ).join_from(
+                    Account, Country,
+                ).join_from(
+                    Account, Language,
+                ).join_from(
+                    Account, Timezone,
+                ).join_from(
+                    Account, Currency,
+                ).where(
+                    (Session.id == id_) &
+                    (Session.is_deleted == False)
+                ).get
+            )
+        except DoesNotExist:
+            raise ModelDoesNotExist(
+                kwargs={
+                    'model': 'Session',
+                    'id_type': 'id',
+                    'id_value': id_,
+                },
+            )
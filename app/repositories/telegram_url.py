@@ -14,29 +14,9 @@
 # limitations under the License.
 #
 
-from peewee import DoesNotExist
-
 from app.db.models import TelegramUrl
 from app.repositories.base import BaseRepository
-from ..utils.exceptions import ModelAlreadyExist
 
 
 class TelegramUrlRepository(BaseRepository):
     model = TelegramUrl
-
-    async def create(self, **kwargs):
-        try:
-            id_str = kwargs.get('id_str')
-            TelegramUrl.get(
-                (TelegramUrl.id_str == id_str) &
-                (TelegramUrl.is_deleted == False)
-            )
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'TelegramUrl',
-                    'id_type': 'id_str',
-                    'id_value': id_str,
-                },
-            )
-        except DoesNotExist:
-            return await super().create(**kwargs)
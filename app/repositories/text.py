@@ -15,9 +15,11 @@
 #
 
 
-from peewee import DoesNotExist
+from peewee import Case, DoesNotExist, chunked
 
 from app.db.models import Text, Language, TextTranslation
+from app.db.db import db
+from app.db.db_executor import run_sync
 from app.repositories.base import BaseRepository
 from app.utils.exceptions import ModelDoesNotExist
 
@@ -53,3 +55,170 @@ class TextRepository(BaseRepository):
         except DoesNotExist:
             value = text.value_default
         return value
+
+    @staticmethod
+    def _update_values(model, field, values: dict[int, str]):
+        for ids in chunked(list(values), 500):
+            model.update(
+                {field: Case(model.id, [(id_, values[id_]) for id_ in ids])},
+            ).where(model.id.in_(ids)).execute()
+
+    @staticmethod
+    def _get_translations(texts_ids: list[int]) -> dict[int, dict[int, tuple[int, str]]]:
+        translations = {}
+        for ids in chunked(texts_ids, 500):
+            for id_, text_id, language_id, value in TextTranslation.select(
+                TextTranslation.id,
+                TextTranslation.text,
+                TextTranslation.language,
+                TextTranslation.value,
+            ).where(
+                (TextTranslation.text.in_(ids)) &
+                (TextTranslation.is_deleted == False)
+            ).tuples():
+                translations.setdefault(text_id, {})[language_id] = (id_, value)
+        return translations
+
+    def _bulk_update(
+            self,
+            texts: list[dict],
+            languages: dict[str, int],
+            delete_keys: list[str],
+            delete_missing: bool,
+            keep_prefixes: list[str],
+            replace_translations: bool,
+    ) -> dict:
+        result = {
+            'texts': {'created': [], 'updated': [], 'deleted': []},
+            'translations': {'created': [], 'updated': [], 'deleted': []},
+        }
+        with db.atomic():
+            texts_current = {
+                key: (id_, value_default)
+                for id_, key, value_default in Text.select(Text.id, Text.key, Text.value_default).where(
+                    Text.is_deleted == False,
+                ).tuples()
+            }
+            keys = {text['key'] for text in texts}
+            delete_keys = [key for key in delete_keys if key in texts_current and key not in keys]
+            if delete_missing:
+                delete_keys += [
+                    key for key in texts_current
+                    if key not in keys and key not in delete_keys and not key.startswith(tuple(keep_prefixes))
+                ]
+
+            # Texts
+            texts_create = [text for text in texts if text['key'] not in texts_current]
+            texts_update = {
+                texts_current[text['key']][0]: text['value_default']
+                for text in texts
+                if text['key'] in texts_current and texts_current[text['key']][1] != text['value_default']
+            }
+            for texts_chunk in chunked(texts_create, 500):
+                Text.insert_many(
+                    [{'key': text['key'], 'value_default': text['value_default']} for text in texts_chunk],
+                ).execute()
+            self._update_values(model=Text, field=Text.value_default, values=texts_update)
+            delete_ids = [texts_current[key][0] for key in delete_keys]
+            for ids in chunked(delete_ids, 500):
+                Text.update(is_deleted=True).where(Text.id.in_(ids)).execute()
+
+            if texts_create:
+                created_keys = [text['key'] for text in texts_create]
+                for id_, key in Text.select(Text.id, Text.key).where(
+                    (Text.key.in_(created_keys)) &
+                    (Text.is_deleted == False)
+                ).tuples():
+                    texts_current[key] = (id_, None)
+            result['texts']['created'] = [(texts_current[text['key']][0], text) for text in texts_create]
+            result['texts']['updated'] = [
+                (texts_current[text['key']][0], text) for text in texts
+                if texts_current[text['key']][0] in texts_update
+            ]
+            result['texts']['deleted'] = [(texts_current[key][0], {'key': key}) for key in delete_keys]
+
+            # Translations
+            texts_ids = {texts_current[text['key']][0]: text for text in texts}
+            translations_current = self._get_translations(texts_ids=list(texts_ids))
+
+            translations_create, translations_update, translations_delete = [], {}, []
+            for text_id, text in texts_ids.items():
+                # An empty value deletes the translation, a missing language keeps it unless replace_translations
+                translations = {languages[language]: value for language, value in text['translations'].items()}
+                text_translations_current = translations_current.get(text_id, {})
+                for language_id, value in translations.items():
+                    if not value:
+                        continue
+                    if language_id not in text_translations_current:
+                        translations_create.append({'text': text_id, 'language': language_id, 'value': value})
+                    elif text_translations_current[language_id][1] != value:
+                        translations_update[text_translations_current[language_id][0]] = (text_id, language_id, value)
+                translations_delete += [
+                    (id_, text_id, language_id)
+                    for language_id, (id_, _) in text_translations_current.items()
+                    if (language_id in translations and not translations[language_id]) or
+                    (replace_translations and language_id not in translations)
+                ]
+
+            for translations_chunk in chunked(translations_create, 500):
+                TextTranslation.insert_many(translations_chunk).execute()
+            self._update_values(
+                model=TextTranslation,
+                field=TextTranslation.value,
+                values={id_: value for id_, (_, _, value) in translations_update.items()},
+            )
+            for ids in chunked([id_ for id_, _, _ in translations_delete], 500):
+                TextTranslation.update(is_deleted=True).where(TextTranslation.id.in_(ids)).execute()
+
+            if translations_create:
+                translations_current = self._get_translations(
+                    texts_ids=list({translation['text'] for translation in translations_create}),
+                )
+
+        languages_ids = {id_: id_str for id_str, id_ in languages.items()}
+        result['translations']['created'] = [
+            (
+                translations_current[translation['text']][translation['language']][0],
+                {
+                    'text_key': texts_ids[translation['text']]['key'],
+                    'language': languages_ids[translation['language']],
+                    'value': translation['value'],
+                },
+            )
+            for translation in translations_create
+        ]
+        result['translations']['updated'] = [
+            (
+                id_,
+                {
+                    'text_key': texts_ids[text_id]['key'],
+                    'language': languages_ids[language_id],
+                    'value': value,
+                },
+            )
+            for id_, (text_id, language_id, value) in translations_update.items()
+        ]
+        result['translations']['deleted'] = [
+            (id_, {'text_key': texts_ids[text_id]['key'], 'language': languages_ids[language_id]})
+            for id_, text_id, language_id in translations_delete
+        ]
+        return result
+
+    async def bulk_update(
+            self,
+            texts: list[dict],
+            languages: dict[str, int],
+            delete_keys: list[str] = None,
+            delete_missing: bool = False,
+            keep_prefixes: list[str] = None,
+            replace_translations: bool = False,
+    ) -> dict:
+        return await run_sync(
+            self._bulk_update,
+            texts=texts,
+            languages=languages,
+            delete_keys=delete_keys or [],
+            delete_missing=delete_missing,
+            keep_prefixes=keep_prefixes or [],
+            replace_translations=replace_translations,
+        )
@@ -15,13 +15,25 @@
 #
 
 
-from json import dumps
 
-from peewee import DoesNotExist
+import gzip
+from json import dumps, loads
+from os import listdir, makedirs, remove, replace, utime
+from os.path import exists, getmtime, getsize
+from time import time
 
-from app.db.models import Language, TextPack, Text
-from .text import TextRepository
+from peewee import DoesNotExist, chunked
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from app.db.db import db
+from app.db.db_executor import run_sync
+from app.db.models import Language, TextPack, Text, TextTranslation
 from app.repositories.base import BaseRepository
+from app.utils.response import raw_content
 from config import settings
 
 
@@ -29,26 +41,218 @@ class TextPackRepository(BaseRepository):
     model = TextPack
 
     @staticmethod
-    async def create(language: Language):
-        json = {}
-        for text in Text.select():
-            value = await TextRepository.get_value(text=text, language=language)
-            key = text.key
-            json[key] = value
+    def _get_values(languages: list[Language]) -> dict[int, dict[str, str]]:
+        texts = {
+            text_id: (key, value_default)
+            for text_id, key, value_default in Text.select(Text.id, Text.key, Text.value_default).where(
+                Text.is_deleted == False,
+            ).tuples()
+        }
+        values = {
+            language.id: {key: value_default for key, value_default in texts.values()}
+            for language in languages
+        }
+        translations = TextTranslation.select(
+            TextTranslation.text,
+            TextTranslation.language,
+            TextTranslation.value,
+        ).where(
+            (TextTranslation.language.in_(list(values))) &
+            (TextTranslation.is_deleted == False)
+        ).order_by(TextTranslation.id.desc()).tuples()
+        for text_id, language_id, value in translations:
+            if text_id in texts:
+                values[language_id][texts[text_id][0]] = value
+        return values
 
-        text_pack = TextPack.create(language=language)
+    @staticmethod
+    def get_path(text_pack_id: int) -> str:
+        return f'{settings.path_texts_packs}/{text_pack_id}.json'
+
+    @staticmethod
+    def get_delta_path(since_text_pack_id: int, text_pack_id: int) -> str:
+        return f'{settings.path_texts_packs}/deltas/{since_text_pack_id}_{text_pack_id}.json'
+
+    @staticmethod
+    def get_encodings() -> list[str]:
+        return ['br', 'gzip'] if brotli else ['gzip']
+
+    @staticmethod
+    def get_encoded_path(text_pack_id: int, encoding: str) -> str:
+        extension = {'br': 'br', 'gzip': 'gz'}[encoding]
+        return f'{settings.path_texts_packs}/{text_pack_id}.json.{extension}'
 
-        with open(f'{settings.path_texts_packs}/{text_pack.id}.json', encoding='utf-8', mode='w') as md_file:
+    def _write_encoded(self, text_pack: TextPack, json: dict):
+        # Compressed siblings hold the whole response envelope, so they are sent as they are
+        content = raw_content(text_pack_id=text_pack.id, text_pack=dumps(json).encode())
+        for encoding in self.get_encodings():
+            path = self.get_encoded_path(text_pack_id=text_pack.id, encoding=encoding)
+            if encoding == 'br':
+                encoded_content = brotli.compress(content, quality=11)
+            else:
+                encoded_content = gzip.compress(content, compresslevel=9)
+            with open(f'{path}.tmp', mode='wb') as md_file:
+                md_file.write(encoded_content)
+            replace(f'{path}.tmp', path)
+
+    @staticmethod
+    def _write(path: str, json: dict):
+        with open(f'{path}.tmp', encoding='utf-8', mode='w') as md_file:
             md_file.write(dumps(json))
+        replace(f'{path}.tmp', path)
+
+    def _get_encoded(self, text_pack_id: int, accept_encoding: str = None) -> tuple[str, str] | None:
+        if not accept_encoding or text_pack_id == 0:
+            return None
+        accepted = []
+        for value in accept_encoding.split(','):
+            encoding, _, quality = value.partition(';')
+            try:
+                if float(quality.strip().removeprefix('q=') or 1) == 0:
+                    continue
+            except ValueError:
+                pass
+            accepted.append(encoding.strip().lower())
+        for encoding in self.get_encodings():
+            path = self.get_encoded_path(text_pack_id=text_pack_id, encoding=encoding)
+            if encoding in accepted and exists(path):
+                return encoding, path
+        return None
+
+    async def get_encoded(self, text_pack_id: int, accept_encoding: str = None) -> tuple[str, str] | None:
+        return await run_sync(self._get_encoded, text_pack_id=text_pack_id, accept_encoding=accept_encoding)
+
+    def _read(self, text_pack_id: int) -> bytes:
+        if text_pack_id == 0:
+            return b'{}'
+        with open(self.get_path(text_pack_id=text_pack_id), mode='rb') as md_file:
+            return md_file.read()
+
+    async def read(self, text_pack_id: int) -> bytes:
+        return await run_sync(self._read, text_pack_id=text_pack_id)
+
+    def _create_list(self, languages: list[Language]) -> list[TextPack]:
+        values = self._get_values(languages=languages)
+        text_packs = []
+        for language in languages:
+            text_pack = TextPack.create(language=language)
+            self._write(path=self.get_path(text_pack_id=text_pack.id), json=values[language.id])
+            self._write_encoded(text_pack=text_pack, json=values[language.id])
+            text_packs.append(text_pack)
+        return text_packs
+
+    async def create_list(self, languages: list[Language]) -> list[TextPack]:
+        return await run_sync(self._create_list, languages=languages)
 
-        return text_pack
+    async def create(self, language: Language) -> TextPack:
+        text_packs = await self.create_list(languages=[language])
+        return text_packs[0]
 
-    async def create_all(self):
-        for language in Language.select():
-            await self.create(language=language)
+    async def create_all(self) -> list[TextPack]:
+        languages = await run_sync(Language.select().where(Language.is_deleted == False).execute)
+        return await self.create_list(languages=list(languages))
+
+    def _get_delta(self, language: Language, since_text_pack_id: int, text_pack_id: int) -> bytes | None:
+        delta_path = self.get_delta_path(since_text_pack_id=since_text_pack_id, text_pack_id=text_pack_id)
+        if exists(delta_path):
+            # mtime marks the base as in use for retention
+            utime(delta_path)
+            with open(delta_path, mode='rb') as md_file:
+                return md_file.read()
+
+        since_text_pack = TextPack.get_or_none(TextPack.id == since_text_pack_id)
+        if not since_text_pack or since_text_pack.language_id != language.id:
+            return None
+        if not exists(self.get_path(text_pack_id=since_text_pack_id)):
+            return None
+
+        try:
+            since_json = loads(self._read(text_pack_id=since_text_pack_id))
+            json = loads(self._read(text_pack_id=text_pack_id))
+        except FileNotFoundError:
+            return None
+        delta = {
+            'added': {key: value for key, value in json.items() if key not in since_json},
+            'changed': {
+                key: value for key, value in json.items()
+                if key in since_json and since_json[key] != value
+            },
+            'removed': [key for key in since_json if key not in json],
+        }
+        makedirs(f'{settings.path_texts_packs}/deltas', exist_ok=True)
+        self._write(path=delta_path, json=delta)
+        return dumps(delta).encode()
+
+    async def get_delta(self, language: Language, since_text_pack_id: int, text_pack_id: int) -> bytes | None:
+        return await run_sync(
+            self._get_delta,
+            language=language,
+            since_text_pack_id=since_text_pack_id,
+            text_pack_id=text_pack_id,
+        )
+
+    def _get_paths(self, text_pack_id: int) -> list[str]:
+        return [self.get_path(text_pack_id=text_pack_id)] + [
+            self.get_encoded_path(text_pack_id=text_pack_id, encoding=encoding)
+            for encoding in ['br', 'gzip']
+        ]
+
+    def _delete_old(self, keep: int, delta_base_ttl: int) -> dict:
+        deltas_path = f'{settings.path_texts_packs}/deltas'
+        deltas = {}
+        if exists(deltas_path):
+            for name in listdir(deltas_path):
+                since_text_pack_id, _, text_pack_id = name.removesuffix('.json').partition('_')
+                if since_text_pack_id.isdigit() and text_pack_id.isdigit():
+                    deltas[f'{deltas_path}/{name}'] = (int(since_text_pack_id), int(text_pack_id))
+
+        protected_ids = set()
+        for path, (since_text_pack_id, text_pack_id) in deltas.items():
+            if getmtime(path) > time() - delta_base_ttl:
+                protected_ids.update([since_text_pack_id, text_pack_id])
+
+        languages_kept = {}
+        delete_ids = []
+        text_packs = TextPack.select(TextPack.id, TextPack.language, TextPack.is_deleted).where(
+            TextPack.id != 0,
+        ).order_by(TextPack.id.desc()).tuples()
+        for text_pack_id, language_id, is_deleted in text_packs:
+            if not is_deleted and languages_kept.get(language_id, 0) < keep:
+                languages_kept[language_id] = languages_kept.get(language_id, 0) + 1
+            elif text_pack_id not in protected_ids:
+                delete_ids.append(text_pack_id)
+
+        # Unlike other models, pruned packs are deleted for real: they are generated artifacts whose files go away
+        # below, nothing references them, and soft deleted rows would keep the table growing with every texts change
+        if delete_ids:
+            with db.atomic():
+                for ids in chunked(delete_ids, 500):
+                    TextPack.delete().where(TextPack.id.in_(ids)).execute()
+
+        delete_ids = set(delete_ids)
+        paths = [path for text_pack_id in delete_ids for path in self._get_paths(text_pack_id=text_pack_id)]
+        paths += [path for path, ids in deltas.items() if delete_ids.intersection(ids)]
+        files, size = 0, 0
+        for path in paths:
+            try:
+                file_size = getsize(path)
+                remove(path)
+            except FileNotFoundError:
+                continue
+            files += 1
+            size += file_size
+
+        return {
+            'text_packs': len(delete_ids),
+            'files': files,
+            'size': size,
+        }
+
+    async def delete_old(self, keep: int, delta_base_ttl: int) -> dict:
+        return await run_sync(self._delete_old, keep=keep, delta_base_ttl=delta_base_ttl)
 
     @staticmethod
-    async def get_current(language: Language) -> TextPack:
+    def _get_current(language: Language) -> TextPack:
         try:
             text_pack = TextPack.select().where(
                 (TextPack.language == language) &
@@ -57,3 +261,7 @@ class TextPackRepository(BaseRepository):
             return text_pack
         except DoesNotExist:
             return TextPack().get(TextPack.id == 0)
+
+    @staticmethod
+    async def get_current(language: Language) -> TextPack:
+        return await run_sync(TextPackRepository._get_current, language=language)
@@ -16,8 +16,8 @@
 
 
 from app.db.models import Timezone
-from app.repositories.base import BaseRepository
+from app.repositories.reference import ReferenceRepository
 
 
-class TimezoneRepository(BaseRepository):
+class TimezoneRepository(ReferenceRepository):
     model = Timezone
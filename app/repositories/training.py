@@ -19,6 +19,7 @@ from datetime import date
 
 from peewee import DoesNotExist
 
+from app.db.db_executor import run_sync
 from app.db.models import Training
 from .base import BaseRepository
 from app.db.models import AccountService
@@ -28,22 +29,14 @@ from ..utils.exceptions import ModelDoesNotExist
 class TrainingRepository(BaseRepository):
     model = Training
 
-    @staticmethod
-    async def get_list_by_account_service(
-            account_service: AccountService,
-    ) -> list[Training]:
-        return Training.select().where(
-            (Training.account_service == account_service) &
-            (Training.is_deleted == False)
-        ).execute()
-
     @staticmethod
     async def is_exist_by_date_and_account_service(
             account_service: AccountService,
             date_: date,
     ):
         try:
-            Training.get(
+            await run_sync(
+                Training.get,
                 (Training.account_service == account_service) &
                 (Training.date == date_) &
                 (Training.is_deleted == False)
@@ -59,7 +52,8 @@ class TrainingRepository(BaseRepository):
     ):
 
         try:
-            return Training.get(
+            return await run_sync(
+                Training.get,
                 (Training.account_service == account_service) &
                 (Training.date == date_) &
                 (Training.is_deleted == False)
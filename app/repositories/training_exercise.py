@@ -15,6 +15,7 @@
 #
 
 
+from ..db.db_executor import run_sync
 from .base import BaseRepository
 from ..db.models import Training, TrainingExercise
 
@@ -24,7 +25,16 @@ class TrainingExerciseRepository(BaseRepository):
 
     @staticmethod
     async def get_list_by_training(training: Training) -> list[TrainingExercise]:
-        return TrainingExercise().select().where(
+        return await run_sync(TrainingExercise().select().where(
             (TrainingExercise.training == training) &
             (TrainingExercise.is_deleted == False)
-        ).execute()
+        ).execute)
+
+    @staticmethod
+    async def get_list_by_trainings(trainings: list[Training]) -> list[TrainingExercise]:
+        return await run_sync(
+            TrainingExercise.select().where(
+                (TrainingExercise.training.in_([training.id for training in trainings])) &
+                (TrainingExercise.is_deleted == False)
+            ).order_by(TrainingExercise.id).execute
+        )
@@ -17,6 +17,7 @@
 
 from peewee import DoesNotExist
 
+from ..db.db_executor import run_sync
 from .base import BaseRepository
 from ..db.models import Training, TrainingReport
 
@@ -27,7 +28,11 @@ class TrainingReportRepository(BaseRepository):
     @staticmethod
     async def is_exist_by_training(training: Training):
         try:
-            tr = TrainingReport.get((TrainingReport.training == training) & (TrainingReport.is_deleted == False))
+            tr = await run_sync(
+                TrainingReport.get,
+                (TrainingReport.training == training) &
+                (TrainingReport.is_deleted == False)
+            )
             return True
         except DoesNotExist:
             return False
@@ -35,6 +40,19 @@ class TrainingReportRepository(BaseRepository):
     @staticmethod
     async def get_by_training(training: Training):
         try:
-            return TrainingReport.get((TrainingReport.training == training) & (TrainingReport.is_deleted == False))
+            return await run_sync(
+                TrainingReport.get,
+                (TrainingReport.training == training) &
+                (TrainingReport.is_deleted == False)
+            )
         except DoesNotExist:
             return False
+
+    @staticmethod
+    async def get_list_by_trainings(trainings: list[Training]) -> list[TrainingReport]:
+        return await run_sync(
+            TrainingReport.select().where(
+                (TrainingReport.training.in_([training.id for training in trainings])) &
+                (TrainingReport.is_deleted == False)
+            ).order_by(TrainingReport.id).execute
+        )
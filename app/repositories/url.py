@@ -24,6 +24,7 @@ from app.utils.exceptions import ModelDoesNotExist
 
 class UrlRepository(BaseRepository):
     model = Url
+    unique_fields = ('name',)
 
     @staticmethod
     async def is_exist_by_name(name: str) -> bool:
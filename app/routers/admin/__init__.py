@@ -24,6 +24,7 @@ from .exercises import router as router_exercises
 from .images import router as router_images
 from .languages import router as router_languages
 from .meals import router as router_meals
+from .nutrition import router as router_nutrition
 from .permissions import router as router_permissions
 from .products import router as router_products
 from .roles import router as router_roles
@@ -52,6 +53,7 @@ router = Router(
         router_images,
         router_languages,
         router_meals,
+        router_nutrition,
         router_permissions,
         router_products,
         router_roles,
@@ -20,6 +20,7 @@ from .create import router as router_create
 from .update import router as router_update
 from .delete import router as router_delete
 from .duplicate import router as router_duplicate
+from .duplicate_list import router as router_duplicate_list
 from .get import router as router_get
 from .get_list import router as router_get_list
 from .get_by_date import router as router_get_by_date
@@ -34,6 +35,7 @@ router = Router(
         router_update,
         router_delete,
         router_duplicate,
+        router_duplicate_list,
         router_get,
         router_get_list,
         router_get_by_date,
@@ -0,0 +1,49 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from datetime import date as datetime_date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from app.services import DayService
+from app.utils import Response, Router
+
+
+router = Router(
+    prefix='/list/duplicate',
+)
+
+
+class DayDuplicateListByAdminSchema(BaseModel):
+    token: str = Field(min_length=32, max_length=64)
+    id: int = Field()
+    dates: Optional[list[datetime_date]] = Field(default=None)
+    date_from: Optional[datetime_date] = Field(default=None)
+    date_to: Optional[datetime_date] = Field(default=None)
+
+
+@router.post()
+async def route(schema: DayDuplicateListByAdminSchema):
+    result = await DayService().duplicate_list_by_admin(
+        token=schema.token,
+        id_=schema.id,
+        dates=schema.dates,
+        date_from=schema.date_from,
+        date_to=schema.date_to,
+    )
+    return Response(**result)
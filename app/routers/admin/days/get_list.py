@@ -15,6 +15,9 @@
 #
 
 
+from datetime import date as datetime_date
+from typing import Optional
+
 from fastapi import Depends
 from pydantic import BaseModel, Field
 
@@ -31,6 +34,10 @@ router = Router(
 class DayGetListByAdminSchema(BaseModel):
     token: str = Field(min_length=32, max_length=64)
     account_service_id: int = Field()
+    date_from: Optional[datetime_date] = Field(default=None)
+    date_to: Optional[datetime_date] = Field(default=None)
+    cursor: Optional[str] = Field(default=None, max_length=64)
+    limit: Optional[int] = Field(default=None, ge=1, le=100)
 
 
 @router.get()
@@ -38,5 +45,9 @@ async def route(schema: DayGetListByAdminSchema = Depends()):
     result = await DayService().get_list_by_admin(
         token=schema.token,
         account_service_id=schema.account_service_id,
+        date_from=schema.date_from,
+        date_to=schema.date_to,
+        cursor=schema.cursor,
+        limit=schema.limit,
     )
     return Response(**result)
@@ -34,6 +34,10 @@ class MealGetListByAdminSchema(BaseModel):
     token: str = Field(min_length=32, max_length=64)
     date: Optional[datetime_date] = Field(default=None)
     account_service_id: int = Field()
+    date_from: Optional[datetime_date] = Field(default=None)
+    date_to: Optional[datetime_date] = Field(default=None)
+    cursor: Optional[str] = Field(default=None, max_length=64)
+    limit: Optional[int] = Field(default=None, ge=1, le=100)
 
 
 @router.get()
@@ -42,5 +46,9 @@ async def route(schema: MealGetListByAdminSchema = Depends()):
         token=schema.token,
         date_=schema.date,
         account_service_id=schema.account_service_id,
+        date_from=schema.date_from,
+        date_to=schema.date_to,
+        cursor=schema.cursor,
+        limit=schema.limit,
     )
     return Response(**result)
@@ -0,0 +1,46 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from datetime import date as datetime_date
+
+from pydantic import BaseModel, Field
+
+from app.services import NutritionService
+from app.utils import Response, Router
+
+
+router = Router(
+    prefix='/get',
+)
+
+
+class NutritionGetByAdminSchema(BaseModel):
+    token: str = Field(min_length=32, max_length=64)
+    account_services_ids: list[int] = Field(min_length=1, max_length=500)
+    date_from: datetime_date = Field()
+    date_to: datetime_date = Field()
+
+
+@router.post()
+async def route(schema: NutritionGetByAdminSchema):
+    result = await NutritionService().get_by_admin(
+        token=schema.token,
+        account_services_ids=schema.account_services_ids,
+        date_from=schema.date_from,
+        date_to=schema.date_to,
+    )
+    return Response(**result)
@@ -21,6 +21,7 @@ from .get import router as router_get
 from .get_list import router as router_get_list
 from .update import router as router_update
 from .delete import router as router_delete
+from .bulk_update import router as router_bulk_update
 from .translations import router as router_translations
 from .packs import router as router_packs
 
@@ -33,6 +34,7 @@ router = Router(
         router_get_list,
         router_update,
         router_delete,
+        router_bulk_update,
         router_translations,
         router_packs,
     ],
@@ -0,0 +1,59 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+from app.services import TextService
+from app.utils import Response, Router
+
+
+router = Router(
+    prefix='/bulk_update',
+)
+
+
+class TextBulkSchema(BaseModel):
+    key: str = Field(min_length=1, max_length=128)
+    value_default: str = Field(min_length=1, max_length=1024)
+    translations: dict[str, Annotated[str, Field(max_length=1024)] | None] = Field(default={})
+
+
+class TextBulkUpdateByAdminSchema(BaseModel):
+    token: str = Field(min_length=32, max_length=64)
+    texts: list[TextBulkSchema] = Field(default=[])
+    delete_keys: list[str] = Field(default=[])
+    delete_missing: bool = Field(default=False)
+    keep_prefixes: list[str] = Field(default=[])
+    replace_translations: bool = Field(default=False)
+    create_text_pack: bool = Field(default=True)
+
+
+@router.post()
+async def route(schema: TextBulkUpdateByAdminSchema):
+    result = await TextService().bulk_update_by_admin(
+        token=schema.token,
+        texts=[text.model_dump() for text in schema.texts],
+        delete_keys=schema.delete_keys,
+        delete_missing=schema.delete_missing,
+        keep_prefixes=schema.keep_prefixes,
+        replace_translations=schema.replace_translations,
+        create_text_pack=schema.create_text_pack,
+    )
+    return Response(**result)
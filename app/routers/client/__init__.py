@@ -25,6 +25,7 @@ from .exercises import router as router_exercises
 from .images import router as router_images
 from .languages import router as router_languages
 from .meals import router as router_meals
+from .nutrition import router as router_nutrition
 from .products import router as router_products
 from .services import router as router_services
 from .sessions import router as router_sessions
@@ -54,6 +55,7 @@ router = Router(
         router_images,
         router_languages,
         router_meals,
+        router_nutrition,
         router_products,
         router_services,
         router_texts,
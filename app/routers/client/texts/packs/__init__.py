@@ -17,11 +17,13 @@
 
 from app.utils import Router
 from .get import router as router_get
+from .delta import router as router_delta
 
 
 router = Router(
     prefix='/packs',
     routes_included=[
         router_get,
+        router_delta,
     ],
 )
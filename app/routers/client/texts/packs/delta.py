@@ -0,0 +1,42 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from fastapi import Depends
+from pydantic import BaseModel, Field
+
+from app.services import TextPackService
+from app.utils import RawResponse, Router
+
+
+router = Router(
+    prefix='/delta',
+)
+
+
+class TextPackDeltaSchema(BaseModel):
+    language: str = Field(min_length=1, max_length=128)
+    since_text_pack_id: int = Field(ge=0)
+
+
+@router.get()
+async def route(schema: TextPackDeltaSchema = Depends()):
+    result = await TextPackService.get_delta(
+        language_id_str=schema.language,
+        since_text_pack_id=schema.since_text_pack_id,
+    )
+    return RawResponse(**result)
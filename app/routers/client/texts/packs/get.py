@@ -15,11 +15,12 @@
 #
 
 
-from fastapi import Depends
+from fastapi import Depends, Header
 from pydantic import BaseModel, Field
+from starlette.responses import FileResponse, Response as StarletteResponse
 
 from app.services import TextPackService
-from app.utils import Response, Router
+from app.utils import RawResponse, Router
 
 
 router = Router(
@@ -32,6 +33,28 @@ class TextPackGetSchema(BaseModel):
 
 
 @router.get()
-async def route(schema: TextPackGetSchema = Depends()):
-    result = await TextPackService.get(language_id_str=schema.language)
-    return Response(**result)
+async def route(
+        schema: TextPackGetSchema = Depends(),
+        if_none_match: str = Header(default=None),
+        accept_encoding: str = Header(default=None),
+):
+    result = await TextPackService().get(
+        language_id_str=schema.language,
+        if_none_match=if_none_match,
+        accept_encoding=accept_encoding,
+    )
+    headers = {
+        'ETag': result['etag'],
+        'Cache-Control': 'no-cache',
+        'Vary': 'Accept-Encoding',
+    }
+    if not result['is_modified']:
+        return StarletteResponse(status_code=304, headers=headers)
+    if result['encoding']:
+        headers['Content-Encoding'] = result['encoding']
+        return FileResponse(path=result['path'], media_type='application/json', headers=headers)
+    return RawResponse(
+        headers=headers,
+        text_pack_id=result['text_pack_id'],
+        text_pack=result['text_pack'],
+    )
@@ -44,6 +44,7 @@ from .meal_product import MealProductService
 from .meal_report import MealReportService
 from .meal_report_image import MealReportImageService
 from .meal_report_product import MealReportProductService
+from .nutrition import NutritionService
 from .product import ProductService
 from .service import ServiceService
 from .service_cost import ServiceCostService
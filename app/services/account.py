@@ -29,6 +29,7 @@ from app.utils.crypto import create_salt, create_hash_by_string_and_salt
 from app.utils.decorators import session_required
 from app.utils.exceptions import InvalidPassword, InvalidUsername, ModelAlreadyExist, WrongPassword, \
     NoRequiredParameters, NotEnoughPermissions
+from app.utils.session_cache import session_cache
 from config import settings
 
 
@@ -118,7 +119,8 @@ class AccountService(BaseService):
         if by_admin:
             account: Account = await AccountRepository().get_by_id(id_=id_)
         else:
-            account: Account = session.account
+            # session.account may come from the session cache, changes are compared against the current row
+            account: Account = await AccountRepository().get_by_id(id_=session.account.id)
 
         action_parameters = {
             'updater': f'session_{session.id}',
@@ -172,7 +174,7 @@ class AccountService(BaseService):
         else:
             currency = None
 
-        await AccountRepository().update(
+        if not await AccountRepository().update(
             model=account,
             username=username,
             firstname=firstname,
@@ -182,7 +184,9 @@ class AccountService(BaseService):
             language=language,
             timezone=timezone,
             currency=currency,
-        )
+        ):
+            return {}
+        await session_cache.invalidate_account(account_id=account.id)
 
         await self.create_action(
             model=account,
@@ -278,7 +282,7 @@ class AccountService(BaseService):
 
     @session_required(return_model=False, permissions=['accounts'])
     async def get_by_admin(self, id_: int) -> dict:
-        account = await AccountRepository().get_by_id(id_=id_)
+        account = await AccountRepository().get_by_id_with_references(id_=id_)
         permissions = await AccountRoleCheckPermissionService.get_permissions(account=account)
 
         return {
@@ -387,7 +391,7 @@ class AccountService(BaseService):
             password_salt = await create_salt()
             password_hash = await create_hash_by_string_and_salt(string=generated_password, salt=password_salt)
         else:
-            account: Account = session.account
+            account: Account = await AccountRepository().get_by_id(id_=session.account.id)
             await self._is_correct_password(account=account, password=current_password)
             if not await self._is_valid_password(password=new_password):
                 raise InvalidPassword()
@@ -399,6 +403,7 @@ class AccountService(BaseService):
             password_salt=password_salt,
             password_hash=password_hash,
         )
+        await session_cache.invalidate_account(account_id=account.id)
 
         action_parameters = {
             'account_id': account.id,
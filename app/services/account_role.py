@@ -17,6 +17,7 @@
 
 from app.db.models import AccountRole, Session
 from app.repositories import AccountRepository, AccountRoleRepository, RoleRepository
+from app.services.account_role_check_premission import AccountRoleCheckPermissionService
 from app.services.base import BaseService
 from app.utils.decorators import session_required
 
@@ -36,6 +37,7 @@ class AccountRoleService(BaseService):
             account=account,
             role=role,
         )
+        await AccountRoleCheckPermissionService.clear_cache(account=account)
 
         await self.create_action(
             model=account_role,
@@ -58,6 +60,7 @@ class AccountRoleService(BaseService):
     ):
         account_role = await AccountRoleRepository().get_by_id(id_=id_)
         await AccountRoleRepository().delete(model=account_role)
+        await AccountRoleCheckPermissionService.clear_cache(account=account_role.account)
 
         await self.create_action(
             model=account_role,
@@ -15,20 +15,41 @@
 #
 
 
+from app.db import after_commit
 from app.db.models import Account
 from app.repositories import AccountRoleRepository
 from app.services.base import BaseService
+from app.utils.cache import TTLCache
 from app.utils.exceptions import AccountMissingPermission
+from config import settings
+
+
+permissions_cache = TTLCache(max_size=settings.permissions_cache_size, ttl=settings.permissions_cache_ttl)
 
 
 class AccountRoleCheckPermissionService(BaseService):
     @staticmethod
     async def get_permissions(account: Account):
-        permissions = await AccountRoleRepository.get_account_permissions(
-            account=account,
-            only_id_str=True,
-        )
-        return permissions
+        permissions = permissions_cache.get(account.id)
+        if permissions is None:
+            permissions = await AccountRoleRepository.get_account_permissions(
+                account=account,
+                only_id_str=True,
+            )
+            permissions_cache.set(account.id, permissions)
+        return list(permissions)
+
+    @staticmethod
+    async def clear_cache(account: Account = None):
+        async def clear():
+            if account:
+                permissions_cache.delete(account.id)
+            else:
+                permissions_cache.clear()
+
+        # Cleared again after commit, a concurrent request may cache the old permissions before it
+        await clear()
+        after_commit(clear)
 
     async def check_permission(self, account: Account, id_str: str):
         if account.id == 0:
@@ -117,13 +117,14 @@ class AccountServiceService(BaseService):
         account_service: AccountService = await AccountServiceRepository().get_by_id(id_=id_)
         if answers:
             await self.check_answers(questions=account_service.questions, answers=answers)
-        await AccountServiceRepository().update(
+        if not await AccountServiceRepository().update(
             model=account_service,
             answers=answers,
             state=state,
             datetime_from=datetime_from,
             datetime_to=datetime_to,
-        )
+        ):
+            return {}
 
         account_service_states = AccountServiceStates().all()
 
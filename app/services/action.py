@@ -15,14 +15,102 @@
 #
 
 
+
+import asyncio
+import logging
+from datetime import datetime
 from logging import debug
 
+from pytz import UTC
+
+from app.db import db_manager
 from app.repositories import ActionRepository
+from config import settings
+
+
+class ActionWriter:
+    """
+    Write-behind buffer for actions, flushed in batches by a background task. When the writer is not running or the
+    buffer is full, actions are written on the request path.
+    """
+    def __init__(self):
+        self.queue = None
+        self.task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self):
+        self.queue = asyncio.Queue(maxsize=settings.actions_queue_size)
+        self.task = asyncio.create_task(coro=self._run(), name='action_writer')
+
+    async def stop(self):
+        if not self.is_running:
+            return
+        await self.queue.put(None)
+        await self.task
+        self.task = None
+
+    def put(self, action: dict) -> bool:
+        if not self.is_running:
+            return False
+        try:
+            self.queue.put_nowait(action)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            action = await self.queue.get()
+            if action is None:
+                return
+            actions = [action]
+            deadline = loop.time() + settings.actions_flush_interval
+            while len(actions) < settings.actions_batch_size:
+                try:
+                    action = await asyncio.wait_for(self.queue.get(), timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if action is None:
+                    await self._write(actions=actions)
+                    return
+                actions.append(action)
+            await self._write(actions=actions)
+
+    @staticmethod
+    @db_manager
+    async def _write(actions: list[dict]):
+        try:
+            await ActionRepository().create_list(actions=actions)
+        except Exception as e:
+            logging.error(msg=f'[action_writer] {len(actions)} actions were not written: {e}')
+
+
+action_writer = ActionWriter()
 
 
 class ActionService:
     @staticmethod
+    async def create_list(actions: list[dict]):
+        actions = [
+            {
+                'datetime': datetime.now(tz=UTC),
+                'model': action['model'],
+                'model_id': action['model_id'],
+                'action': action['action'],
+                'parameters': action.get('parameters') or {},
+            }
+            for action in actions
+        ]
+        actions = [action for action in actions if not action_writer.put(action=action)]
+        if actions:
+            await ActionRepository().create_list(actions=actions)
+
     async def create(
+            self,
             model: str,
             model_id: int,
             action: str,
@@ -31,16 +119,23 @@ class ActionService:
         if not parameters:
             parameters = {}
 
-        action = await ActionRepository().create(model=model, model_id=model_id, action=action)
-
-        params_str = ''
-        for key, value in parameters.items():
-            await ActionRepository().create_parameter(action=action, key=key, value=value)
-            if not value:
-                value = 'none'
-            params_str += f'{key.upper()} = {str(value).upper()}\n'
-
-        debug(
-            msg=f'ACTION: {action.model.upper()}.{action.model_id}.{action.action.upper()}. '
-                f'PARAMS: \n{params_str}',
+        await self.create_list(
+            actions=[
+                {
+                    'model': model,
+                    'model_id': model_id,
+                    'action': action,
+                    'parameters': parameters,
+                },
+            ],
         )
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            params_str = ''.join(
+                f'{key.upper()} = {str(value if value else "none").upper()}\n'
+                for key, value in parameters.items()
+            )
+            debug(
+                msg=f'ACTION: {model.upper()}.{model_id}.{action.upper()}. '
+                    f'PARAMS: \n{params_str}',
+            )
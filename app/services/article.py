@@ -75,11 +75,12 @@ class ArticleService(BaseService):
     ) -> dict:
         article: Article = await ArticleRepository().get_by_id(id_=id_)
 
-        await ArticleRepository().update(
+        if not await ArticleRepository().update(
             model=article,
             is_hide=is_hide,
             can_guest=can_guest,
-        )
+        ):
+            return {}
 
         # Create action
         await self.create_action(
@@ -37,9 +37,23 @@ class BaseService:
         if with_client:
             parameters['client_host'] = client.host
             parameters['client_device'] = dumps(client.device.__dict__)
-        await ActionService.create(
+        await ActionService().create(
             model=underscore(model.__class__.__name__),
             model_id=model.id,
             action=action,
             parameters=parameters,
         )
+
+    @staticmethod
+    def get_cascade_parameters(deleted: dict[type[BaseModel], list[int]]) -> dict:
+        # Ids by table, split into "<table>_<n>" keys so every value fits into an action parameter
+        parameters = {}
+        for model, ids in deleted.items():
+            values = ['']
+            for id_ in map(str, ids):
+                if values[-1] and len(values[-1]) + len(id_) >= 256:
+                    values.append('')
+                values[-1] = f'{values[-1]},{id_}' if values[-1] else id_
+            for i, value in enumerate(values):
+                parameters[model._meta.table_name if i == 0 else f'{model._meta.table_name}_{i + 1}'] = value
+        return parameters
@@ -19,7 +19,8 @@ from app.db.models import Country, Session
 from app.repositories import CountryRepository, CurrencyRepository, LanguageRepository, TimezoneRepository
 from app.services.base import BaseService
 from app.utils.decorators import session_required
-from app.utils.exceptions import ModelAlreadyExist, NoRequiredParameters
+from app.utils.reference_cache import reference_cache
+from app.utils.exceptions import NoRequiredParameters
 
 
 class CountryService(BaseService):
@@ -33,15 +34,6 @@ class CountryService(BaseService):
             timezone_default_id_str: str,
             currency_default_id_str: str,
     ):
-        if await CountryRepository().is_exist_by_id_str(id_str=id_str):
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Country',
-                    'id_type': 'id_str',
-                    'id_value': id_str,
-                }
-            )
-
         language_default = await LanguageRepository().get_by_id_str(id_str=language_default_id_str)
         timezone_default = await TimezoneRepository().get_by_id_str(id_str=timezone_default_id_str)
         currency_default = await CurrencyRepository().get_by_id_str(id_str=currency_default_id_str)
@@ -53,6 +45,7 @@ class CountryService(BaseService):
             timezone_default=timezone_default,
             currency_default=currency_default,
         )
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=country,
@@ -124,12 +117,14 @@ class CountryService(BaseService):
         else:
             currency_default = None
 
-        await CountryRepository().update(
+        if not await CountryRepository().update(
             model=country,
             language_default=language_default,
             timezone_default=timezone_default,
             currency_default=currency_default,
-        )
+        ):
+            return {}
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=country,
@@ -148,6 +143,7 @@ class CountryService(BaseService):
         country: Country = await CountryRepository().get_by_id_str(id_str=id_str)
 
         await CountryRepository().delete(model=country)
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=country,
@@ -18,8 +18,8 @@
 from app.db.models import Session
 from app.repositories import CurrencyRepository
 from app.services.base import BaseService
-from app.utils.exceptions import ModelAlreadyExist
 from app.utils.decorators import session_required
+from app.utils.reference_cache import reference_cache
 
 
 class CurrencyService(BaseService):
@@ -29,18 +29,10 @@ class CurrencyService(BaseService):
             session: Session,
             id_str: str,
     ):
-        if await CurrencyRepository().is_exist_by_id_str(id_str=id_str):
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Currency',
-                    'id_type': 'id_str',
-                    'id_value': id_str,
-                }
-            )
-
         currency = await CurrencyRepository().create(
             id_str=id_str,
         )
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=currency,
@@ -62,6 +54,7 @@ class CurrencyService(BaseService):
     ):
         currency = await CurrencyRepository().get_by_id_str(id_str=id_str)
         await CurrencyRepository().delete(model=currency)
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=currency,
@@ -15,23 +15,28 @@
 #
 
 
-from datetime import date
+from datetime import date, timedelta
 
-from app.db.models import Session, Day, Meal, DayTraining, Training
+from app.db import db_transaction
+from app.db.models import Session, Day, Meal, Training
 from app.repositories import DayRepository, AccountServiceRepository, MealReportRepository, \
     MealProductRepository, DayMealRepository, MealRepository, DayTrainingRepository, TrainingReportRepository, \
     TrainingExerciseRepository, TrainingRepository
+from app.services.action import ActionService
 from app.services.training_exercise import TrainingExerciseService
 from app.services.training import TrainingService
 from app.services.base import BaseService
 from app.services.meal import MealService
 from app.utils.decorators import session_required
-from app.utils.exceptions import NotEnoughPermissions, ModelAlreadyExist, NegativeInteger
+from app.utils.exceptions import NotEnoughPermissions, ModelAlreadyExist, NegativeInteger, NoRequiredParameters, \
+    TooManyDates
+from config import settings
 
 
 class DayService(BaseService):
 
     @session_required(permissions=['accounts'])
+    @db_transaction()
     async def create_by_admin(
             self,
             session: Session,
@@ -108,11 +113,12 @@ class DayService(BaseService):
                     },
                 )
 
-        await DayRepository().update(
+        if not await DayRepository().update(
             model=day,
             water_amount=water_amount,
             water_intake=water_intake,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=day,
@@ -147,10 +153,11 @@ class DayService(BaseService):
             'by_admin': True,
         }
 
-        await DayRepository().update(
+        if not await DayRepository().update(
             model=day,
             water_intake=water_intake,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=day,
@@ -161,31 +168,14 @@ class DayService(BaseService):
         return {}
 
     @session_required(permissions=['accounts'])
+    @db_transaction()
     async def delete_by_admin(
             self,
             session: Session,
             id_: int,
     ):
         day: Day = await DayRepository().get_by_id(id_=id_)
-
-        training: Training = await TrainingRepository().get_by_date_and_account_service(
-            account_service=day.account_service,
-            date_=day.date,
-        )
-
-        if training:
-            await TrainingService().delete_by_admin(
-                session=session,
-                id_=training.id,
-            )
-
-        await MealService().delete_list_by_date_by_admin(
-            session=session,
-            account_service_id=day.account_service.id,
-            date_=day.date,
-        )
-
-        await DayRepository().delete(model=day)
+        deleted = await DayRepository().delete_cascade(models=[day])
 
         await self.create_action(
             model=day,
@@ -193,12 +183,14 @@ class DayService(BaseService):
             parameters={
                 'deleter': f'session_{session.id}',
                 'by_admin': True,
+                **self.get_cascade_parameters(deleted=deleted),
             },
         )
 
         return {}
 
     @session_required(permissions=['accounts'])
+    @db_transaction()
     async def duplicate_by_admin(
             self,
             session: Session,
@@ -271,6 +263,73 @@ class DayService(BaseService):
 
         return {'id': duplicated_day.id}
 
+    @session_required(permissions=['accounts'])
+    async def duplicate_list_by_admin(
+            self,
+            session: Session,
+            id_: int,
+            dates: list[date] = None,
+            date_from: date = None,
+            date_to: date = None,
+    ):
+        initial_day: Day = await DayRepository().get_by_id(id_=id_)
+
+        if bool(date_from) != bool(date_to):
+            raise NoRequiredParameters(
+                kwargs={
+                    'parameters': ['date_from', 'date_to'],
+                },
+            )
+        dates = set(dates or [])
+        if date_from and date_to:
+            dates.update(date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1))
+        dates.discard(initial_day.date)
+        if not dates:
+            raise NoRequiredParameters(
+                kwargs={
+                    'parameters': ['dates', 'date_from', 'date_to'],
+                },
+            )
+        if len(dates) > settings.days_duplicate_max_dates:
+            raise TooManyDates(
+                kwargs={
+                    'max': settings.days_duplicate_max_dates,
+                },
+            )
+
+        result = await DayRepository().duplicate(day=initial_day, dates=sorted(dates))
+
+        await ActionService.create_list(
+            actions=[
+                {
+                    'model': 'day',
+                    'model_id': day['id'],
+                    'action': 'duplicate',
+                    'parameters': {
+                        'creator': f'session_{session.id}',
+                        'initial_day_id': initial_day.id,
+                        'date': date_.isoformat(),
+                        'is_created': day['is_created'],
+                        'meals': day['meals'],
+                        'meals_products': day['meals_products'],
+                        'trainings_exercises': day['trainings_exercises'],
+                        'by_admin': True,
+                    },
+                }
+                for date_, day in result.items()
+            ],
+        )
+
+        return {
+            'days': [
+                {
+                    'id': day['id'],
+                    'date': date_.isoformat(),
+                }
+                for date_, day in result.items()
+            ],
+        }
+
     async def _get(
             self,
             session: Session,
@@ -359,17 +418,26 @@ class DayService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
             by_admin: bool = False,
     ):
         account_service = await AccountServiceRepository().get_by_id(id_=account_service_id)
         if account_service.account != session.account and not by_admin:
             raise NotEnoughPermissions()
 
+        days, next_cursor = await DayRepository().get_list_by_account_service_and_dates(
+            account_service=account_service,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
         return {
-            'days': [
-                await self._generate_day_dict(day=day)
-                for day in await DayRepository().get_list_by_account_service(account_service=account_service)
-            ]
+            'days': await self._generate_days_dicts(days=days),
+            'next_cursor': next_cursor,
         }
 
     @session_required(permissions=['accounts'])
@@ -377,10 +445,18 @@ class DayService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         return await self._get_list(
             session=session,
             account_service_id=account_service_id,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
             by_admin=True,
         )
 
@@ -389,61 +465,103 @@ class DayService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         return await self._get_list(
             session=session,
             account_service_id=account_service_id,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
         )
 
     @staticmethod
-    async def _generate_day_dict(day: Day):
-        day_training: DayTraining = await DayTrainingRepository().get_by_day(day=day)
-        if day_training:
-            training = day_training.training
-            training_report = await TrainingReportRepository().get_by_training(training=training)
-        else:
-            training = None
-            training_report = None
-
-        return {
-            'id': day.id,
-            'account_service_id': day.account_service.id,
-            'date': str(day.date),
-            'water_amount': day.water_amount,
-            'water_intake': day.water_intake,
-            'meals': [
-                {
-                    'id': day_meal.id,
-                    'meal_id': day_meal.meal.id,
-                    'account_service_id': day_meal.meal.account_service.id,
-                    'date': str(day_meal.meal.date),
-                    'type': day_meal.meal.type,
-                    'fats': day_meal.meal.fats,
-                    'proteins': day_meal.meal.proteins,
-                    'carbohydrates': day_meal.meal.carbohydrates,
-                    'meal_report_id': (await MealReportRepository().get_by_meal(meal=day_meal.meal)).id if await MealReportRepository().get_by_meal(meal=day_meal.meal) else None,
-                    'products': [
+    async def _generate_days_dicts(days: list[Day]) -> list[dict]:
+        days = list(days)
+        if not days:
+            return []
+
+        days_meals = {}
+        for day_meal in await DayMealRepository().get_list_by_days(days=days):
+            days_meals.setdefault(day_meal.day_id, []).append(day_meal)
+        meals = [day_meal.meal for days_meals_list in days_meals.values() for day_meal in days_meals_list]
+
+        meals_reports, meals_products = {}, {}
+        if meals:
+            for meal_report in await MealReportRepository().get_list_by_meals(meals=meals):
+                meals_reports.setdefault(meal_report.meal_id, meal_report)
+            for meal_product in await MealProductRepository().get_list_by_meals(meals=meals):
+                meals_products.setdefault(meal_product.meal_id, []).append(meal_product)
+
+        days_trainings = {}
+        for day_training in await DayTrainingRepository().get_list_by_days(days=days):
+            days_trainings.setdefault(day_training.day_id, day_training)
+        trainings = [day_training.training for day_training in days_trainings.values()]
+
+        trainings_reports, trainings_exercises = {}, {}
+        if trainings:
+            for training_report in await TrainingReportRepository().get_list_by_trainings(trainings=trainings):
+                trainings_reports.setdefault(training_report.training_id, training_report)
+            for training_exercise in await TrainingExerciseRepository().get_list_by_trainings(trainings=trainings):
+                trainings_exercises.setdefault(training_exercise.training_id, []).append(training_exercise)
+
+        days_dicts = []
+        for day in days:
+            day_training = days_trainings.get(day.id)
+            if day_training:
+                training = day_training.training
+                training_report = trainings_reports.get(training.id)
+            else:
+                training = None
+                training_report = None
+
+            days_dicts.append({
+                'id': day.id,
+                'account_service_id': day.account_service_id,
+                'date': str(day.date),
+                'water_amount': day.water_amount,
+                'water_intake': day.water_intake,
+                'meals': [
+                    {
+                        'id': day_meal.id,
+                        'meal_id': day_meal.meal.id,
+                        'account_service_id': day_meal.meal.account_service_id,
+                        'date': str(day_meal.meal.date),
+                        'type': day_meal.meal.type,
+                        'fats': day_meal.meal.fats,
+                        'proteins': day_meal.meal.proteins,
+                        'carbohydrates': day_meal.meal.carbohydrates,
+                        'meal_report_id': getattr(meals_reports.get(day_meal.meal.id), 'id', None),
+                        'products': [
+                            {
+                                'id': meal_product.id,
+                                'product': meal_product.product_id,
+                                'value': meal_product.value,
+                            } for meal_product in meals_products.get(day_meal.meal.id, [])
+                        ]
+                    }
+                    for day_meal in days_meals.get(day.id, [])
+                ],
+                'training': {
+                    'id': training.id,
+                    'training_report_id': training_report.id if training_report else None,
+                    'exercises': [
                         {
-                            'id': meal_product.id,
-                            'product': meal_product.product.id,
-                            'value': meal_product.value,
-                        } for meal_product in await MealProductRepository().get_list_by_meal(meal=day_meal.meal)
+                            'id': training_exercise.id,
+                            'exercise': training_exercise.exercise_id,
+                            'priority': training_exercise.priority,
+                            'value': training_exercise.value,
+                            'rest': training_exercise.rest,
+                        } for training_exercise in trainings_exercises.get(training.id, [])
                     ]
-                }
-                for day_meal in await DayMealRepository().get_list_by_day(day=day)
-            ],
-            'training': {
-                'id': training.id,
-                'training_report_id': training_report.id if training_report else None,
-                'exercises': [
-                    {
-                        'id': training_exercise.id,
-                        'exercise': training_exercise.exercise.id,
-                        'priority': training_exercise.priority,
-                        'value': training_exercise.value,
-                        'rest': training_exercise.rest,
-                    } for training_exercise in
-                    await TrainingExerciseRepository().get_list_by_training(training=training)
-                ]
-            } if day_training else None
-        }
+                } if day_training else None
+            })
+        return days_dicts
+
+    async def _generate_day_dict(self, day: Day) -> dict:
+        days_dicts = await self._generate_days_dicts(days=[day])
+        return days_dicts[0]
@@ -69,10 +69,11 @@ class DayMealService(BaseService):
             'by_admin': True,
         }
 
-        await DayMealRepository().update(
+        if not await DayMealRepository().update(
             model=day_meal,
             day=day,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=day_meal,
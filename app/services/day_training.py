@@ -69,10 +69,11 @@ class DayTrainingService(BaseService):
             'by_admin': True,
         }
 
-        await DayTrainingRepository().update(
+        if not await DayTrainingRepository().update(
             model=day_training,
             day=day,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=day_training,
@@ -124,11 +124,12 @@ class ExerciseService(BaseService):
                 }
             )
 
-        await ExerciseRepository().update(
+        if not await ExerciseRepository().update(
             model=exercise,
             type=type_,
             article=article,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=exercise,
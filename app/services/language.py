@@ -19,8 +19,8 @@ from app.db.models import Session
 from app.repositories import LanguageRepository
 from app.services.text_pack import TextPackService
 from app.services.base import BaseService
-from app.utils.exceptions import ModelAlreadyExist
 from app.utils.decorators import session_required
+from app.utils.reference_cache import reference_cache
 
 
 class LanguageService(BaseService):
@@ -31,19 +31,11 @@ class LanguageService(BaseService):
             id_str: str,
             name: str,
     ):
-        if await LanguageRepository().is_exist_by_id_str(id_str=id_str):
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Language',
-                    'id_type': 'id_str',
-                    'id_value': id_str,
-                }
-            )
-
         language = await LanguageRepository().create(
             id_str=id_str,
             name=name,
         )
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=language,
@@ -69,6 +61,7 @@ class LanguageService(BaseService):
         language = await LanguageRepository().get_by_id_str(id_str=id_str)
 
         await LanguageRepository().delete(model=language)
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=language,
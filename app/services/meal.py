@@ -17,10 +17,11 @@
 
 from datetime import date
 
-from app.db.models import MealReport, Session, Day, DayMeal, MealProduct
+from app.db import db_transaction
+from app.db.models import MealReport, Session, Day, MealProduct
 from app.db.models.meal import Meal
 from app.repositories import AccountServiceRepository, MealProductRepository, MealReportRepository, \
-    MealRepository, ProductRepository, DayRepository, DayMealRepository
+    MealRepository, ProductRepository, DayRepository
 from app.services import AccountService
 from app.services.day_meal import DayMealService
 from app.services.meal_product import MealProductService
@@ -39,6 +40,7 @@ class MealTypes:
 
 class MealService(BaseService):
     @session_required(permissions=['meals'])
+    @db_transaction()
     async def create_by_admin(
             self,
             session: Session,
@@ -117,6 +119,7 @@ class MealService(BaseService):
         return {'id': meal.id}
 
     @session_required(permissions=['meals'])
+    @db_transaction()
     async def update_by_admin(
             self,
             session: Session,
@@ -177,14 +180,15 @@ class MealService(BaseService):
                 }
             )
 
-        await MealRepository().update(
+        if not await MealRepository().update(
             model=meal,
             date=date_,
             type=type_,
             fats=fats,
             carbohydrates=carbohydrates,
             proteins=proteins,
-        )
+        ):
+            return {}
 
         fats = fats if fats else meal.fats
         proteins = proteins if proteins else meal.proteins
@@ -209,17 +213,14 @@ class MealService(BaseService):
         return {}
 
     @session_required(permissions=['meals'])
+    @db_transaction()
     async def delete_by_admin(
             self,
             session: Session,
             id_: int,
     ):
         meal = await MealRepository().get_by_id(id_=id_)
-        await MealRepository().delete(model=meal)
-        day: Day = await DayRepository().get_by_date(date_=meal.date, account_service=meal.account_service)
-        day_meal: DayMeal = await DayMealRepository().get_by_day_and_meal(day=day, meal=meal)
-        if day_meal:
-            await DayMealService().delete_by_admin(session=session, id_=day_meal.id)
+        deleted = await MealRepository().delete_cascade(models=[meal])
 
         await self.create_action(
             model=meal,
@@ -227,12 +228,14 @@ class MealService(BaseService):
             parameters={
                 'deleter': f'session_{session.id}',
                 'by_admin': True,
+                **self.get_cascade_parameters(deleted=deleted),
             }
         )
 
         return {}
 
     @session_required(permissions=['meals'])
+    @db_transaction()
     async def delete_list_by_date_by_admin(
             self,
             session: Session,
@@ -244,15 +247,27 @@ class MealService(BaseService):
             account_service=account_service,
             date_=date_,
         )
-        for meal in meals:
-            await self.delete_by_admin(
-                session=session,
-                id_=meal.id,
-            )
+        meals = list(meals)
+        if not meals:
+            return {}
+        deleted = await MealRepository().delete_cascade(models=meals)
+
+        # One action for the whole date, the ids of meals and their subtree are in the cascade parameters
+        await self.create_action(
+            model=account_service,
+            action='delete_meals',
+            parameters={
+                'deleter': f'session_{session.id}',
+                'date': date_.isoformat(),
+                'by_admin': True,
+                **self.get_cascade_parameters(deleted=deleted),
+            }
+        )
 
         return {}
 
     @session_required(permissions=['meals'])
+    @db_transaction()
     async def duplicate_by_admin(
             self,
             session: Session,
@@ -398,16 +413,20 @@ class MealService(BaseService):
             self,
             account_service_id: int,
             date_: date = None,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         account_service = await AccountServiceRepository().get_by_id(id_=account_service_id)
-        meals = await MealRepository().get_list_by_account_service_and_date(account_service=account_service,
-                                                                            date_=date_)
-        return {
-            'meals': [
-                await self._generate_meal_dict(meal=meal)
-                for meal in meals
-            ]
-        }
+        return await self._get_list(
+            account_service=account_service,
+            date_=date_,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
 
     @session_required()
     async def get_list(
@@ -415,19 +434,48 @@ class MealService(BaseService):
             session: Session,
             account_service_id: int,
             date_: date = None,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         account_service = await AccountServiceRepository().get_by_id(id_=account_service_id)
-        meals = await MealRepository().get_list_by_account_service_and_date(account_service=account_service,
-                                                                            date_=date_)
-
         if account_service.account != session.account:
             raise NotEnoughPermissions()
 
+        return await self._get_list(
+            account_service=account_service,
+            date_=date_,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
+
+    async def _get_list(
+            self,
+            account_service: AccountService,
+            date_: date = None,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
+    ):
+        if date_:
+            date_from, date_to = date_, date_
+        meals, next_cursor = await MealRepository().get_list_by_account_service_and_dates(
+            account_service=account_service,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
         return {
             'meals': [
                 await self._generate_meal_dict(meal=meal)
                 for meal in meals
-            ]
+            ],
+            'next_cursor': next_cursor,
         }
 
     @staticmethod
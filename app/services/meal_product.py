@@ -92,11 +92,12 @@ class MealProductService(BaseService):
                 }
             )
 
-        await MealProductRepository().update(
+        if not await MealProductRepository().update(
             model=meal_product,
             product=product,
             value=value,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=meal_product,
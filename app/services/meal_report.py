@@ -20,7 +20,6 @@ from json import JSONDecodeError, loads
 
 from peewee import DoesNotExist
 
-from .meal_report_image import MealReportImageService
 from .meal_report_product import MealReportProductService
 from .base import BaseService
 from app.repositories import MealReportImageRepository, MealReportProductRepository, \
@@ -164,36 +163,15 @@ class MealReportService(BaseService):
             if meal_report.meal.account_service.account != session.account:
                 raise NotEnoughPermissions()
 
-        products = await MealReportProductRepository().get_list_by_meal_report(meal_report=meal_report)
-        images = await MealReportImageRepository().get_list_by_meal_report(meal_report=meal_report)
-        for product in products:
-            if by_admin:
-                await MealReportProductService().delete_by_admin(
-                    session=session,
-                    id_=product.id,
-                )
-            else:
-                await MealReportProductService().delete(
-                    session=session,
-                    id_=product.id,
-                )
-        for image in images:
-            if by_admin:
-                await MealReportImageService().delete_by_admin(
-                    session=session,
-                    id_=image.id,
-                )
-            else:
-                await MealReportImageService().delete(
-                    session=session,
-                    id_=image.id,
-                )
-        await MealReportRepository().delete(model=meal_report)
+        deleted = await MealReportRepository().delete_cascade(models=[meal_report])
 
         await self.create_action(
             model=meal_report,
             action='delete',
-            parameters=action_parameters,
+            parameters={
+                **action_parameters,
+                **self.get_cascade_parameters(deleted=deleted),
+            },
         )
 
     @session_required()
@@ -0,0 +1,154 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.db.models import Session
+from app.repositories import AccountServiceRepository, MealProductRepository, MealReportProductRepository, \
+    ProductRepository
+from app.services.base import BaseService
+from app.utils.decorators import session_required
+from app.utils.exceptions import ModelDoesNotExist, NotEnoughPermissions, TooManyDates
+from app.utils.nutrition import get_adherence, get_factors, get_totals, get_weeks_starts, to_dict
+from config import settings
+
+
+class NutritionService(BaseService):
+    @staticmethod
+    async def _get(
+            account_services_ids: list[int],
+            date_from: date,
+            date_to: date,
+    ) -> dict:
+        days_count = (date_to - date_from).days + 1
+        if days_count > settings.nutrition_max_days:
+            raise TooManyDates(
+                kwargs={
+                    'max': settings.nutrition_max_days,
+                },
+            )
+        account_services_ids = list(dict.fromkeys(account_services_ids))
+        if days_count < 1 or not account_services_ids:
+            return {'account_services': []}
+
+        planned_values = await MealProductRepository().get_values_by_account_services(
+            account_services_ids=account_services_ids,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        reported_values = await MealReportProductRepository().get_values_by_account_services(
+            account_services_ids=account_services_ids,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        products_indexes, factors = get_factors(
+            products=await ProductRepository().get_nutrients_by_ids(
+                ids=list({value[2] for value in planned_values} | {value[2] for value in reported_values}),
+            ),
+        )
+
+        account_services_indexes = {id_: i for i, id_ in enumerate(account_services_ids)}
+        planned, reported = [
+            get_totals(
+                values=values,
+                account_services_indexes=account_services_indexes,
+                products_indexes=products_indexes,
+                factors=factors,
+                date_from=date_from,
+                days_count=days_count,
+            )
+            for values in (planned_values, reported_values)
+        ]
+        weeks_starts = get_weeks_starts(date_from=date_from, days_count=days_count)
+        planned_weeks = np.add.reduceat(planned, weeks_starts, axis=1)
+        reported_weeks = np.add.reduceat(reported, weeks_starts, axis=1)
+        adherence = get_adherence(planned=planned, reported=reported)
+        adherence_weeks = get_adherence(planned=planned_weeks, reported=reported_weeks)
+
+        weeks_ends = weeks_starts[1:] + [days_count]
+        return {
+            'account_services': [
+                {
+                    'id': account_service_id,
+                    'days': [
+                        {
+                            'date': (date_from + timedelta(days=day)).isoformat(),
+                            'planned': to_dict(values=planned[i, day]),
+                            'reported': to_dict(values=reported[i, day]),
+                            'adherence': to_dict(values=adherence[i, day]),
+                        }
+                        for day in range(days_count)
+                    ],
+                    'weeks': [
+                        {
+                            'date_from': (date_from + timedelta(days=weeks_starts[week])).isoformat(),
+                            'date_to': (date_from + timedelta(days=weeks_ends[week] - 1)).isoformat(),
+                            'planned': to_dict(values=planned_weeks[i, week]),
+                            'reported': to_dict(values=reported_weeks[i, week]),
+                            'adherence': to_dict(values=adherence_weeks[i, week]),
+                        }
+                        for week in range(len(weeks_starts))
+                    ],
+                }
+                for account_service_id, i in account_services_indexes.items()
+            ],
+        }
+
+    @session_required()
+    async def get(
+            self,
+            session: Session,
+            account_service_id: int,
+            date_from: date,
+            date_to: date,
+    ):
+        account_service = await AccountServiceRepository().get_by_id(id_=account_service_id)
+        if account_service.account != session.account:
+            raise NotEnoughPermissions()
+
+        return await self._get(
+            account_services_ids=[account_service.id],
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    @session_required(permissions=['accounts'], return_model=False)
+    async def get_by_admin(
+            self,
+            account_services_ids: list[int],
+            date_from: date,
+            date_to: date,
+    ):
+        unknown_ids = set(account_services_ids) - set(
+            await AccountServiceRepository().get_ids_by_ids(ids=account_services_ids),
+        )
+        if unknown_ids:
+            raise ModelDoesNotExist(
+                kwargs={
+                    'model': 'AccountService',
+                    'id_type': 'id',
+                    'id_value': sorted(unknown_ids),
+                },
+            )
+
+        return await self._get(
+            account_services_ids=account_services_ids,
+            date_from=date_from,
+            date_to=date_to,
+        )
@@ -20,7 +20,7 @@ from json import dumps, loads
 
 from hg_api_client.routes import HutkiGroshApiClient
 
-from app.db import db
+from app.db import db_manager, db_transaction
 from app.db.models import Session, Payment, AccountService, ServiceCost, PaymentMethod, Promocode, Account
 from app.repositories import PaymentRepository, AccountServiceRepository, ServiceCostRepository, \
     PaymentMethodRepository, PaymentMethodCurrencyRepository, PromocodeRepository
@@ -58,57 +58,58 @@ class PaymentService(BaseService):
         if await PaymentRepository().is_account_service_have_an_unpaid_bill(account_service=account_service):
             raise UnpaidBill()
 
-        if promocode_id_str:
-            if promocode_id_str == settings.secret_promo_code:
-                cost = 0.01
-            else:
-                promocode: Promocode = await PromocodeRepository().get_by_id_str(id_str=promocode_id_str)
-
-                user_promocode_currency = await PromocodeService().check(
-                    session=session,
-                    id_str=promocode_id_str,
-                    currency_id_str=service_cost.currency.id_str,
-                    service_cost_id=service_cost_id,
-                    return_currency=True,
-                )
+        async with db_transaction():
+            if promocode_id_str:
+                if promocode_id_str == settings.secret_promo_code:
+                    cost = 0.01
+                else:
+                    promocode: Promocode = await PromocodeRepository().get_by_id_str(id_str=promocode_id_str)
+
+                    user_promocode_currency = await PromocodeService().check(
+                        session=session,
+                        id_str=promocode_id_str,
+                        currency_id_str=service_cost.currency.id_str,
+                        service_cost_id=service_cost_id,
+                        return_currency=True,
+                    )
 
-                if promocode.type == PromocodeTypes.PERCENT:
-                    cost = cost - (cost / 100 * user_promocode_currency.amount)
-                elif promocode.type == PromocodeTypes.AMOUNT:
-                    cost = cost - user_promocode_currency.amount
+                    if promocode.type == PromocodeTypes.PERCENT:
+                        cost = cost - (cost / 100 * user_promocode_currency.amount)
+                    elif promocode.type == PromocodeTypes.AMOUNT:
+                        cost = cost - user_promocode_currency.amount
 
-                await PromocodeService().use(
-                    session=session,
-                    id_str=promocode_id_str,
-                )
+                    await PromocodeService().use(
+                        session=session,
+                        id_str=promocode_id_str,
+                    )
 
-        action_parameters = {
-            'creator': f'session_{session.id}',
-            'account_service_id': account_service_id,
-            'service_cost_id': service_cost_id,
-            'payment_method_id_str': payment_method_id_str,
-            'payment_method_currency_id': payment_method_currency_id,
-            'promocode': promocode_id_str,
-            'cost': cost,
-        }
+            action_parameters = {
+                'creator': f'session_{session.id}',
+                'account_service_id': account_service_id,
+                'service_cost_id': service_cost_id,
+                'payment_method_id_str': payment_method_id_str,
+                'payment_method_currency_id': payment_method_currency_id,
+                'promocode': promocode_id_str,
+                'cost': cost,
+            }
 
-        if by_admin:
-            action_parameters['by_admin'] = True
+            if by_admin:
+                action_parameters['by_admin'] = True
 
-        payment = await PaymentRepository().create(
-            account_service=account_service,
-            payment_method=payment_method,
-            payment_method_currency=payment_method_currency,
-            service_cost=service_cost,
-            cost=cost,
-            state=PaymentStates.CREATING,
-        )
+            payment = await PaymentRepository().create(
+                account_service=account_service,
+                payment_method=payment_method,
+                payment_method_currency=payment_method_currency,
+                service_cost=service_cost,
+                cost=cost,
+                state=PaymentStates.CREATING,
+            )
 
-        await self.create_action(
-            model=payment,
-            action='create',
-            parameters=action_parameters,
-        )
+            await self.create_action(
+                model=payment,
+                action='create',
+                parameters=action_parameters,
+            )
 
         await self.create_hg(payment_id=payment.id)  # FIXME
 
@@ -196,7 +197,7 @@ class PaymentService(BaseService):
         if by_admin:
             action_parameters['by_admin'] = True
 
-        await PaymentRepository.update(
+        await PaymentRepository().update(
             model=payment,
             state=state,
             data=data,
@@ -477,69 +478,69 @@ class PaymentService(BaseService):
             ),
         )
 
+    @db_manager
     async def check_hg(self):
-        with db:
-            for payment in await PaymentRepository().get_unpaid_payments_list():
-                payment_data = loads(payment.data)
+        for payment in await PaymentRepository().get_unpaid_payments_list():
+            payment_data = loads(payment.data)
 
-                api_client = HutkiGroshApiClient(
-                    url=settings.payment_hg_url,
-                )
+            api_client = HutkiGroshApiClient(
+                url=settings.payment_hg_url,
+            )
 
-                token = await api_client.token.get(
-                    client_id=settings.payment_hg_client_id,
-                    client_secret=settings.payment_hg_client_secret,
-                    service_provider_id=settings.payment_hg_service_provider_id,
-                    service_id=settings.payment_hg_service_id,
-                )
+            token = await api_client.token.get(
+                client_id=settings.payment_hg_client_id,
+                client_secret=settings.payment_hg_client_secret,
+                service_provider_id=settings.payment_hg_service_provider_id,
+                service_id=settings.payment_hg_service_id,
+            )
 
-                payment_invoices = await api_client.invoices.get(token=token, search_string=payment_data['invoice_name'])
-                payment_invoice = payment_invoices[0]
-                is_expired = datetime.fromisoformat(payment_invoice['paymentDueTerms']['dueUTC']) < datetime.utcnow()
+            payment_invoices = await api_client.invoices.get(token=token, search_string=payment_data['invoice_name'])
+            payment_invoice = payment_invoices[0]
+            is_expired = datetime.fromisoformat(payment_invoice['paymentDueTerms']['dueUTC']) < datetime.utcnow()
 
-                if payment_invoice['totalAmount'] == payment_invoice['amountPaid']:
-                    await self.update_by_task(
-                        id_=payment.id,
-                        state=PaymentStates.PAID,
+            if payment_invoice['totalAmount'] == payment_invoice['amountPaid']:
+                await self.update_by_task(
+                    id_=payment.id,
+                    state=PaymentStates.PAID,
+                )
+                if payment.account_service.state == AccountServiceStates.active:
+                    datetime_to = payment.account_service.datetime_to + timedelta(31)
+                    datetime_to = datetime_to - timedelta(
+                        hours=datetime_to.hour,
+                        minutes=datetime_to.minute,
+                        seconds=datetime_to.second,
+                        microseconds=datetime_to.microsecond
                     )
-                    if payment.account_service.state == AccountServiceStates.active:
-                        datetime_to = payment.account_service.datetime_to + timedelta(31)
-                        datetime_to = datetime_to - timedelta(
-                            hours=datetime_to.hour,
-                            minutes=datetime_to.minute,
-                            seconds=datetime_to.second,
-                            microseconds=datetime_to.microsecond
-                        )
-                        await AccountServiceService().update_by_task(
-                            id_=payment.account_service.id,
-                            datetime_to=datetime_to,
-                        )
-                    else:
-                        datetime_to = datetime.utcnow() + timedelta(31)
-                        datetime_to = datetime_to - timedelta(
-                            hours=datetime_to.hour,
-                            minutes=datetime_to.minute,
-                            seconds=datetime_to.second,
-                            microseconds=datetime_to.microsecond
-                        )
-                        await AccountServiceService().update_by_task(
-                            id_=payment.account_service.id,
-                            datetime_from=datetime.utcnow(),
-                            datetime_to=datetime_to,
-                            state=AccountServiceStates.active,
-                        )
-                    account: Account = payment.account_service.account
-                    fullname = ' '.join([account.lastname, account.firstname, account.surname])
-                    await TelegramNotification().new_purchase(
-                        fullname=fullname,
-                        username=account.username,
+                    await AccountServiceService().update_by_task(
+                        id_=payment.account_service.id,
+                        datetime_to=datetime_to,
                     )
-
-                if payment.state != PaymentStates.PAID and is_expired:
-                    await self.update_by_task(
-                        id_=payment.id,
-                        state=PaymentStates.EXPIRED,
+                else:
+                    datetime_to = datetime.utcnow() + timedelta(31)
+                    datetime_to = datetime_to - timedelta(
+                        hours=datetime_to.hour,
+                        minutes=datetime_to.minute,
+                        seconds=datetime_to.second,
+                        microseconds=datetime_to.microsecond
+                    )
+                    await AccountServiceService().update_by_task(
+                        id_=payment.account_service.id,
+                        datetime_from=datetime.utcnow(),
+                        datetime_to=datetime_to,
+                        state=AccountServiceStates.active,
                     )
+                account: Account = payment.account_service.account
+                fullname = ' '.join([account.lastname, account.firstname, account.surname])
+                await TelegramNotification().new_purchase(
+                    fullname=fullname,
+                    username=account.username,
+                )
+
+            if payment.state != PaymentStates.PAID and is_expired:
+                await self.update_by_task(
+                    id_=payment.id,
+                    state=PaymentStates.EXPIRED,
+                )
 
     @staticmethod
     async def cancel_hg(
@@ -178,7 +178,7 @@ class ProductService(BaseService):
         else:
             article = None
 
-        await ProductRepository().update(
+        if not await ProductRepository().update(
             model=product,
             type=type_,
             unit=unit,
@@ -188,7 +188,8 @@ class ProductService(BaseService):
             calories=calories,
             article=article,
             is_main=is_main,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=product,
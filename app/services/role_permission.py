@@ -15,6 +15,7 @@
 #
 
 
+from app.services.account_role_check_premission import AccountRoleCheckPermissionService
 from app.services.base import BaseService
 from app.repositories import RolePermissionRepository, RoleRepository, PermissionRepository
 from app.db.models import RolePermission, Session
@@ -36,6 +37,7 @@ class RolePermissionService(BaseService):
             role=role,
             permission=permission
         )
+        await AccountRoleCheckPermissionService.clear_cache()
 
         await self.create_action(
             model=role_permission,
@@ -59,6 +61,7 @@ class RolePermissionService(BaseService):
         role_permission = await RolePermissionRepository().get_by_id(id_=id_)
 
         await RolePermissionRepository().delete(model=role_permission)
+        await AccountRoleCheckPermissionService.clear_cache()
 
         await self.create_action(
             model=role_permission,
@@ -23,6 +23,7 @@ from app.services.text import TextService
 from app.services.base import BaseService
 from app.utils.exceptions import ModelAlreadyExist, InvalidServiceQuestionList
 from app.utils.decorators import session_required
+from app.utils.reference_cache import reference_cache
 
 
 class ServiceService(BaseService):
@@ -69,6 +70,7 @@ class ServiceService(BaseService):
             name_text=name_text,
             questions=questions_sections,
         )
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=service,
@@ -116,11 +118,13 @@ class ServiceService(BaseService):
                 }
             )
 
-        await ServiceRepository().update(
+        if not await ServiceRepository().update(
             model=service,
             name=name,
             questions=questions_sections,
-        )
+        ):
+            return {}
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=service,
@@ -138,6 +142,7 @@ class ServiceService(BaseService):
     ) -> dict:
         service: Service = await ServiceRepository().get_by_id_str(id_str=id_str)
         await ServiceRepository().delete(model=service)
+        await reference_cache.invalidate()
         await TextService().delete_by_admin(
             session=session,
             key=f'service_{service.id_str}',
@@ -61,10 +61,11 @@ class ServiceCostService(BaseService):
     ):
         service_cost = await ServiceCostRepository().get_by_id(id_=id_)
 
-        await ServiceCostRepository().update(
+        if not await ServiceCostRepository().update(
             model=service_cost,
             cost=cost,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=service_cost,
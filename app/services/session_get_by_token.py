@@ -22,6 +22,7 @@ from app.db.models import Session
 from app.services.base import BaseService
 from app.utils.crypto import create_hash_by_string_and_salt
 from app.utils.exceptions.account import WrongTokenFormat, WrongToken, WrongRootToken
+from app.utils.session_cache import session_cache
 from config import settings
 
 
@@ -57,11 +58,16 @@ class SessionGetByTokenService(BaseService):
             else:
                 raise WrongRootToken()
 
-        session: Session = await SessionRepository().get_by_id(id_=session_id)
+        session = await session_cache.get(session_id=session_id, token=token)
+        if session:
+            return session
+
+        session: Session = await SessionRepository.get_by_id_with_account(id_=session_id)
         if session.token_hash == await create_hash_by_string_and_salt(
             string=token,
             salt=session.token_salt,
         ):
+            await session_cache.set(session_id=session_id, token=token, session=session)
             return session
         else:
             raise WrongToken()
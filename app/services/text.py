@@ -16,7 +16,8 @@
 
 
 from app.db.models import Session, Text
-from app.repositories import TextRepository, TextTranslationRepository
+from app.repositories import LanguageRepository, TextRepository, TextTranslationRepository
+from app.services.action import ActionService
 from app.services.text_pack import TextPackService
 from app.services.base import BaseService
 from app.utils.decorators import session_required
@@ -126,11 +127,12 @@ class TextService(BaseService):
             create_text_pack: bool = True
     ) -> dict:
         text = await TextRepository().get_by_key(key=key)
-        await TextRepository().update(
+        if not await TextRepository().update(
             model=text,
             value_default=value_default,
-            new_key=new_key,
-        )
+            key=new_key,
+        ):
+            return {}
 
         action_parameters = {
             'updater': f'session_{session.id}',
@@ -184,3 +186,68 @@ class TextService(BaseService):
             await TextPackService().create_all_by_admin(session=session)
 
         return {}
+
+    @session_required(permissions=['texts'], can_root=True)
+    async def bulk_update_by_admin(
+            self,
+            session: Session,
+            texts: list[dict],
+            delete_keys: list[str] = None,
+            delete_missing: bool = False,
+            keep_prefixes: list[str] = None,
+            replace_translations: bool = False,
+            create_text_pack: bool = True,
+    ) -> dict:
+        languages = {language.id_str: language.id for language in await LanguageRepository().get_list()}
+        for text in texts:
+            for language in text['translations']:
+                if language not in languages:
+                    raise ModelDoesNotExist(
+                        kwargs={
+                            'model': 'Language',
+                            'id_type': 'id_str',
+                            'id_value': language,
+                        },
+                    )
+
+        result = await TextRepository().bulk_update(
+            texts=list({text['key']: text for text in texts}.values()),
+            languages=languages,
+            delete_keys=delete_keys,
+            delete_missing=delete_missing,
+            keep_prefixes=keep_prefixes,
+            replace_translations=replace_translations,
+        )
+
+        actions = []
+        for model, group, fields in [
+            ('text', 'texts', ['key', 'value_default']),
+            ('text_translation', 'translations', ['text_key', 'language', 'value']),
+        ]:
+            for action, result_key, actor in [
+                ('create', 'created', 'creator'),
+                ('update', 'updated', 'updater'),
+                ('delete', 'deleted', 'deleter'),
+            ]:
+                actions += [
+                    {
+                        'model': model,
+                        'model_id': id_,
+                        'action': action,
+                        'parameters': {
+                            actor: f'session_{session.id}',
+                            **{field: parameters[field] for field in fields if field in parameters},
+                            'by_admin': True,
+                        },
+                    }
+                    for id_, parameters in result[group][result_key]
+                ]
+        await ActionService.create_list(actions=actions)
+
+        if actions and create_text_pack:
+            await TextPackService().create_all_by_admin(session=session)
+
+        return {
+            group: {result_key: len(items) for result_key, items in results.items()}
+            for group, results in result.items()
+        }
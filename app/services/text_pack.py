@@ -15,8 +15,9 @@
 #
 
 
-from json import loads
+import logging
 
+from app.db import db_manager
 from app.db.models import TextPack, Session
 from app.repositories import TextPackRepository, LanguageRepository
 from app.services.base import BaseService
@@ -28,23 +29,62 @@ class TextPackService(BaseService):
     model = TextPack
 
     @staticmethod
-    async def get(language_id_str: str):
+    def _is_etag_matched(text_pack_id: int, if_none_match: str = None) -> bool:
+        if not if_none_match:
+            return False
+        etags = [value.strip().removeprefix('W/') for value in if_none_match.split(',')]
+        return '*' in etags or any(
+            f'"text_pack_{text_pack_id}{suffix}"' in etags
+            for suffix in ['', '-gzip', '-br']
+        )
+
+    async def get(self, language_id_str: str, if_none_match: str = None, accept_encoding: str = None):
+        language = await LanguageRepository().get_by_id_str(id_str=language_id_str)
+        text_pack = await TextPackRepository.get_current(language=language)
+        result = {
+            'etag': f'"text_pack_{text_pack.id}"',
+            'text_pack_id': text_pack.id,
+            'is_modified': True,
+            'encoding': None,
+            'path': None,
+            'text_pack': None,
+        }
+
+        if self._is_etag_matched(text_pack_id=text_pack.id, if_none_match=if_none_match):
+            result['is_modified'] = False
+            return result
+
+        encoded = await TextPackRepository().get_encoded(text_pack_id=text_pack.id, accept_encoding=accept_encoding)
+        if encoded:
+            result['encoding'], result['path'] = encoded
+            result['etag'] = f'"text_pack_{text_pack.id}-{result["encoding"]}"'
+        else:
+            result['text_pack'] = await TextPackRepository().read(text_pack_id=text_pack.id)
+        return result
+
+    @staticmethod
+    async def get_delta(language_id_str: str, since_text_pack_id: int):
         language = await LanguageRepository().get_by_id_str(id_str=language_id_str)
         text_pack = await TextPackRepository.get_current(language=language)
 
-        if text_pack.id == 0:
+        if since_text_pack_id == text_pack.id:
+            delta = b'{"added":{},"changed":{},"removed":[]}'
+        else:
+            delta = await TextPackRepository().get_delta(
+                language=language,
+                since_text_pack_id=since_text_pack_id,
+                text_pack_id=text_pack.id,
+            )
+
+        if delta is None:
             return {
                 'text_pack_id': text_pack.id,
-                'text_pack': {},
+                'text_pack': await TextPackRepository().read(text_pack_id=text_pack.id),
             }
-
-        with open(f'{settings.path_texts_packs}/{text_pack.id}.json', encoding='utf-8', mode='r') as md_file:
-            json_str = md_file.read()
-
-        json = loads(json_str)
         return {
             'text_pack_id': text_pack.id,
-            'text_pack': json,
+            'since_text_pack_id': since_text_pack_id,
+            'delta': delta,
         }
 
     @session_required(permissions=['texts'], can_root=True)
@@ -54,7 +94,7 @@ class TextPackService(BaseService):
             language_id_str: str,
     ):
         language = await LanguageRepository().get_by_id_str(id_str=language_id_str)
-        text_pack = await TextPackRepository.create(language=language)
+        text_pack = await TextPackRepository().create(language=language)
         await self.create_action(
             model=text_pack,
             action='create',
@@ -73,8 +113,16 @@ class TextPackService(BaseService):
             session: Session,
     ):
         languages = await LanguageRepository().get_list()
-        for language in languages:
-            await self.create_by_admin(session=session, language_id_str=language.id_str)
+        text_packs = await TextPackRepository().create_list(languages=languages)
+        for text_pack in text_packs:
+            await self.create_action(
+                model=text_pack,
+                action='create',
+                parameters={
+                    'creator': f'session_{session.id}',
+                    'by_admin': True,
+                },
+            )
         return {}
 
     @session_required(permissions=['texts'])
@@ -90,3 +138,15 @@ class TextPackService(BaseService):
             },
         )
         return {}
+
+    @db_manager
+    async def delete_old(self):
+        result = await TextPackRepository().delete_old(
+            keep=settings.texts_packs_keep,
+            delta_base_ttl=settings.texts_packs_delta_base_ttl * 24 * 60 * 60,
+        )
+        logging.info(
+            msg=f'[texts_packs] {result["text_packs"]} text packs and {result["files"]} files deleted, '
+                f'{result["size"]} bytes reclaimed',
+        )
+        return result
@@ -85,10 +85,11 @@ class TextTranslationService(BaseService):
         language: Language = await LanguageRepository().get_by_id_str(id_str=language)
         text_translation: TextTranslation = await TextTranslationRepository().get(text=text, language=language)
 
-        await TextTranslationRepository().update(
+        if not await TextTranslationRepository().update(
             model=text_translation,
             value=value,
-        )
+        ):
+            return {}
         await self.create_action(
             model=text_translation,
             action='update',
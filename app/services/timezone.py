@@ -18,8 +18,8 @@
 from app.db.models import Session
 from app.repositories import TimezoneRepository
 from app.services.base import BaseService
-from app.utils.exceptions import ModelAlreadyExist
 from app.utils.decorators import session_required
+from app.utils.reference_cache import reference_cache
 
 
 class TimezoneService(BaseService):
@@ -30,19 +30,11 @@ class TimezoneService(BaseService):
             id_str: str,
             deviation: int,
     ):
-        if await TimezoneRepository().is_exist_by_id_str(id_str=id_str):
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Timezone',
-                    'id_type': 'id_str',
-                    'id_value': id_str,
-                }
-            )
-
         timezone = await TimezoneRepository().create(
             id_str=id_str,
             deviation=deviation
         )
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=timezone,
@@ -66,6 +58,7 @@ class TimezoneService(BaseService):
     ):
         timezone = await TimezoneRepository().get_by_id_str(id_str=id_str)
         await TimezoneRepository().delete(model=timezone)
+        await reference_cache.invalidate()
 
         await self.create_action(
             model=timezone,
@@ -17,9 +17,10 @@
 
 from datetime import date
 
-from app.db.models import Session, Training, TrainingReport, Day, DayTraining
+from app.db import db_transaction
+from app.db.models import Session, Training, TrainingReport, Day
 from app.repositories import TrainingExerciseRepository, TrainingReportRepository, TrainingRepository, \
-    AccountServiceRepository, DayRepository, DayTrainingRepository
+    AccountServiceRepository, DayRepository
 from app.services.base import BaseService
 from app.services.day_training import DayTrainingService
 from app.utils.decorators import session_required
@@ -28,6 +29,7 @@ from app.utils.exceptions import NotEnoughPermissions, ModelDoesNotExist
 
 class TrainingService(BaseService):
     @session_required(permissions=['trainings'])
+    @db_transaction()
     async def create_by_admin(
             self,
             session: Session,
@@ -78,10 +80,11 @@ class TrainingService(BaseService):
     ):
         training: Training = await TrainingRepository().get_by_id(id_=id_)
 
-        await TrainingRepository().update(
+        if not await TrainingRepository().update(
             model=training,
             date=date_,
-        )
+        ):
+            return {}
 
         day: Day = await DayRepository().get_by_date(
             date_=date_,
@@ -107,17 +110,14 @@ class TrainingService(BaseService):
         return {}
 
     @session_required(permissions=['trainings'])
+    @db_transaction()
     async def delete_by_admin(
             self,
             session: Session,
             id_: int,
     ):
         training = await TrainingRepository().get_by_id(id_=id_)
-        await TrainingRepository().delete(model=training)
-        day: Day = await DayRepository().get_by_date(date_=training.date, account_service=training.account_service)
-        day_training: DayTraining = await DayTrainingRepository().get_by_day(day=day)
-        if day_training:
-            await DayTrainingService().delete_by_admin(session=session, id_=day_training.id)
+        deleted = await TrainingRepository().delete_cascade(models=[training])
 
         await self.create_action(
             model=training,
@@ -125,6 +125,7 @@ class TrainingService(BaseService):
             parameters={
                 'deleter': f'session_{session.id}',
                 'by_admin': True,
+                **self.get_cascade_parameters(deleted=deleted),
             }
         )
 
@@ -219,19 +220,29 @@ class TrainingService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
             by_admin: bool = False,
     ):
         account_service = await AccountServiceRepository().get_by_id(id_=account_service_id)
-        trainings = await TrainingRepository().get_list_by_account_service(account_service=account_service)
-
         if account_service.account != session.account and not by_admin:
             raise NotEnoughPermissions()
 
+        trainings, next_cursor = await TrainingRepository().get_list_by_account_service_and_dates(
+            account_service=account_service,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
+        )
         return {
             'trainings': [
                 await self._generate_training_dict(training=training)
                 for training in trainings
             ],
+            'next_cursor': next_cursor,
         }
 
     @session_required()
@@ -239,10 +250,18 @@ class TrainingService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         return await self._get_list(
             session=session,
             account_service_id=account_service_id,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
         )
 
     @session_required(permissions=['trainings'])
@@ -250,10 +269,18 @@ class TrainingService(BaseService):
             self,
             session: Session,
             account_service_id: int,
+            date_from: date = None,
+            date_to: date = None,
+            cursor: str = None,
+            limit: int = None,
     ):
         return await self._get_list(
             session=session,
             account_service_id=account_service_id,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit,
             by_admin=True,
         )
 
@@ -109,13 +109,14 @@ class TrainingExerciseService(BaseService):
 
         exercise = await ExerciseRepository().get_by_id(id_=exercise_id)
 
-        await TrainingExerciseRepository().update(
+        if not await TrainingExerciseRepository().update(
             model=training_exercise,
             exercise=exercise,
             priority=priority,
             value=value,
             rest=rest,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=training_exercise,
@@ -19,7 +19,7 @@ from geoip2.errors import AddressNotFoundError
 from app.db.models import Session, Url
 from app.repositories import UrlRepository, UrlClickRepository
 from app.services.base import BaseService
-from app.utils.exceptions import ModelAlreadyExist, NoRequiredParameters
+from app.utils.exceptions import NoRequiredParameters
 from app.utils.decorators import session_required
 
 
@@ -31,15 +31,6 @@ class UrlService(BaseService):
             name: str,
             redirect: str,
     ):
-        if await UrlRepository().is_exist_by_name(name=name):
-            raise ModelAlreadyExist(
-                kwargs={
-                    'model': 'Url',
-                    'id_type': 'name',
-                    'id_value': name,
-                }
-            )
-
         url = await UrlRepository().create(
             name=name,
             redirect=redirect,
@@ -85,11 +76,12 @@ class UrlService(BaseService):
         if redirect:
             action_parameters['redirect'] = redirect
 
-        await UrlRepository().update(
+        if not await UrlRepository().update(
             model=url,
             name=name,
             redirect=redirect,
-        )
+        ):
+            return {}
 
         await self.create_action(
             model=url,
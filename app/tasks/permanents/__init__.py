@@ -20,13 +20,23 @@ import logging
 
 from app.tasks.permanents.payments import sync_payments
 from app.tasks.permanents.sync_gd import sync_gd
+from app.tasks.permanents.texts_packs import delete_old_texts_packs
+from app.utils.reference_cache import reference_cache
+from config import settings
 
 prefix = '[start_app]'
 
 
+async def listen_reference_cache():
+    if settings.reference_cache_pubsub:
+        await reference_cache.listen()
+
+
 TASKS = [
     sync_gd,
     sync_payments,
+    delete_old_texts_packs,
+    listen_reference_cache,
 ]
 
 
@@ -15,11 +15,26 @@
 #
 
 
+import logging
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from app.db import db_connection, reset_db_state
 from app.tasks.permanents.sync_gd.syncers.texts import sync_texts
 from config import settings
 from .base import sync_base
 from .roles_permissions import sync_roles_permissions
-from ..utils import google_sheets_api_client, mybody_api_client
+from ..utils import google_sheets_api_client, mybody_api_client, sheets_hashes
+
+
+@asynccontextmanager
+async def sheet_transaction():
+    if settings.sync_gd_mode != 'service':
+        yield
+        return
+    reset_db_state()
+    async with db_connection():
+        yield
 
 
 async def sync():
@@ -63,62 +78,85 @@ async def sync():
             currency_default=obj.get('currency_default'),
         )
 
+    started = monotonic()
     table = await google_sheets_api_client.get_table_by_name(name=settings.sync_db_table_name)
-
-    # Permissions
-    await sync_base(
+    rows = await google_sheets_api_client.get_rows_by_names(
         table=table,
-        sheet_name='permissions',
-        api_method_get_list=mybody_api_client.admin.permissions.get_list,
-        api_method_delete=mybody_api_client.admin.permissions.delete,
-        api_method_create=create_permission,
+        names=['permissions', 'roles', 'languages', 'timezones', 'currencies', 'countries', 'texts', 'errors'],
     )
+    logging.info(msg=f'[sync_gd] sheets read in {monotonic() - started:.2f}s')
+
+    # Permissions
+    if sheets_hashes.is_changed(name='permissions', rows=[rows['permissions']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['permissions'],
+                api_method_get_list=mybody_api_client.admin.permissions.get_list,
+                api_method_delete=mybody_api_client.admin.permissions.delete,
+                api_method_create=create_permission,
+            )
+        sheets_hashes.save(name='permissions')
 
     # Roles
-    await sync_base(
-        table=table,
-        sheet_name='roles',
-        api_method_get_list=mybody_api_client.admin.roles.get_list,
-        api_method_delete=mybody_api_client.admin.roles.delete,
-        api_method_create=create_roles,
-        key_name='name',
-    )
+    if sheets_hashes.is_changed(name='roles', rows=[rows['roles'], rows['permissions']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['roles'],
+                api_method_get_list=mybody_api_client.admin.roles.get_list,
+                api_method_delete=mybody_api_client.admin.roles.delete,
+                api_method_create=create_roles,
+                key_name='name',
+            )
+        sheets_hashes.save(name='roles')
 
     # Languages
-    await sync_base(
-        table=table,
-        sheet_name='languages',
-        api_method_get_list=mybody_api_client.client.languages.get_list,
-        api_method_delete=mybody_api_client.admin.languages.delete,
-        api_method_create=create_language,
-    )
+    if sheets_hashes.is_changed(name='languages', rows=[rows['languages']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['languages'],
+                api_method_get_list=mybody_api_client.client.languages.get_list,
+                api_method_delete=mybody_api_client.admin.languages.delete,
+                api_method_create=create_language,
+            )
+        sheets_hashes.save(name='languages')
 
     # Timezones
-    await sync_base(
-        table=table,
-        sheet_name='timezones',
-        api_method_get_list=mybody_api_client.client.timezones.get_list,
-        api_method_delete=mybody_api_client.admin.timezones.delete,
-        api_method_create=create_timezone,
-    )
+    if sheets_hashes.is_changed(name='timezones', rows=[rows['timezones']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['timezones'],
+                api_method_get_list=mybody_api_client.client.timezones.get_list,
+                api_method_delete=mybody_api_client.admin.timezones.delete,
+                api_method_create=create_timezone,
+            )
+        sheets_hashes.save(name='timezones')
 
     # Currencies
-    await sync_base(
-        table=table,
-        sheet_name='currencies',
-        api_method_get_list=mybody_api_client.client.currencies.get_list,
-        api_method_delete=mybody_api_client.admin.currencies.delete,
-        api_method_create=create_currency,
-    )
+    if sheets_hashes.is_changed(name='currencies', rows=[rows['currencies']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['currencies'],
+                api_method_get_list=mybody_api_client.client.currencies.get_list,
+                api_method_delete=mybody_api_client.admin.currencies.delete,
+                api_method_create=create_currency,
+            )
+        sheets_hashes.save(name='currencies')
 
     # Countries
-    await sync_base(
-        table=table,
-        sheet_name='countries',
-        api_method_get_list=mybody_api_client.client.countries.get_list,
-        api_method_delete=mybody_api_client.admin.countries.delete,
-        api_method_create=create_country,
-    )
+    if sheets_hashes.is_changed(name='countries', rows=[rows['countries']]):
+        async with sheet_transaction():
+            await sync_base(
+                table=rows['countries'],
+                api_method_get_list=mybody_api_client.client.countries.get_list,
+                api_method_delete=mybody_api_client.admin.countries.delete,
+                api_method_create=create_country,
+            )
+        sheets_hashes.save(name='countries')
 
     # Texts
-    await sync_texts(table=table)
\ No newline at end of file
+    if sheets_hashes.is_changed(name='texts', rows=[rows['texts'], rows['errors'], rows['languages']]):
+        async with sheet_transaction():
+            await sync_texts(rows_texts=rows['texts'], rows_error=rows['errors'])
+        sheets_hashes.save(name='texts')
+
+    logging.info(msg=f'[sync_gd] synced in {monotonic() - started:.2f}s')
\ No newline at end of file
@@ -15,21 +15,16 @@
 #
 
 
-from gspread import Spreadsheet
-
-from ..utils.google_sheets_api_client import google_sheets_api_client
+from addict import Dict
 
 
 async def sync_base(
-        table: Spreadsheet,
-        sheet_name,
+        table: list[Dict],
         api_method_get_list,
         api_method_delete,
         api_method_create,
         key_name='id_str',
 ):
-    sheet = await google_sheets_api_client.get_sheet_by_table_and_name(table=table, name=sheet_name)
-    table = await google_sheets_api_client.get_rows(sheet=sheet)
     table_ids_str = [obj.get(key_name) for obj in table]
 
     api = await api_method_get_list()
@@ -15,10 +15,10 @@
 #
 
 
+import logging
+
 from addict import Dict
-from gspread import Spreadsheet
 
-from ..utils.google_sheets_api_client import google_sheets_api_client
 from ..utils.mybody_api_client import mybody_api_client
 
 
@@ -33,17 +33,9 @@ PREFIXES = [
 DEFAULT_LANGUAGE = 'eng'
 
 
-async def sync_texts(table: Spreadsheet):
-    is_changed = False
-
+async def sync_texts(rows_texts: list[Dict], rows_error: list[Dict]):
     languages = [language.id_str for language in await mybody_api_client.client.languages.get_list()]
 
-    sheet_texts = await google_sheets_api_client.get_sheet_by_table_and_name(table=table, name='texts')
-    rows_texts = await google_sheets_api_client.get_rows(sheet=sheet_texts)
-
-    sheet_error = await google_sheets_api_client.get_sheet_by_table_and_name(table=table, name='errors')
-    rows_error = await google_sheets_api_client.get_rows(sheet=sheet_error)
-
     texts_table = rows_texts + [
         Dict(
             key=f'error_{error.code}',
@@ -53,103 +45,33 @@ async def sync_texts(table: Spreadsheet):
         ) for error in rows_error
     ]
 
-    sheet_keys = [row.get('key') for row in texts_table]
-
-    texts = await mybody_api_client.admin.texts.get_list()
-    texts_keys = [text.key for text in texts]
-    texts_api = Dict(
-        **{
-            text.key: dict(
-                default_value=text.value_default,
-                translations={
-                    translation.language: translation.value for translation in text.translations
-                },
-            ) for text in texts
-        }
-    )
-    match = list(set(sheet_keys) & set(texts_keys))
-
-    need_create = [key for key in sheet_keys if key not in match]
-    need_delete = [key for key in texts_keys if key not in match and not key.startswith(tuple(PREFIXES))]
-
-    # Global block
-
-    # Delete
-    for key in need_delete:
-        await mybody_api_client.admin.texts.delete(
-            key=key,
-            create_text_pack=False,
-        )
-        is_changed = True
-
+    # Cells come as numbers or strings, empty cells delete the translation
+    texts, skipped_keys = [], []
     for text_table in texts_table:
-        key = text_table.key
-        text_api = texts_api.get(key)
-
-        skip_update = False
-        # Create
-        if key in need_create:
-            await mybody_api_client.admin.texts.create(
-                key=key,
-                value_default=text_table.get(DEFAULT_LANGUAGE),
-                create_text_pack=False,
-            )
-            skip_update = True
-            is_changed = True
-
-        # Update
-        if not skip_update:
-            current_value_default = text_api.get('default_value')
-            new_value_default = text_table.get(DEFAULT_LANGUAGE)
-
-            if current_value_default != new_value_default:
-                await mybody_api_client.admin.texts.update(
-                    key=key,
-                    value_default=new_value_default,
-                    create_text_pack=False,
-                )
-                is_changed = True
-
-        # Translations block
-        current_translations = text_api.translations if text_api else {}
-        new_translations = text_table.copy(); new_translations.pop('key')
-        match_translations = list(set(current_translations.keys()) & set(new_translations.keys()))
-        need_create_translations = [key for key in new_translations.keys() if key not in match_translations]
-        need_delete_translations = [key for key in current_translations.keys() if key not in match_translations]
-
-        # Delete translation
-        for language_delete in need_delete_translations:
-            await mybody_api_client.admin.texts.translations.delete(
-                text_key=key,
-                language=language_delete,
-                create_text_pack=False,
-            )
-            is_changed = True
+        key = str(text_table.key)
+        values = {
+            language: '' if text_table.get(language) is None else str(text_table.get(language))
+            for language in languages if language in text_table
+        }
+        # A text without the default value is left as it is until the sheet is fixed, instead of failing the batch
+        if not values.get(DEFAULT_LANGUAGE):
+            skipped_keys.append(key)
             continue
-
-        for language in languages:
-            # Create translation
-            if language in need_create_translations:
-                await mybody_api_client.admin.texts.translations.create(
-                    text_key=key,
-                    language=language,
-                    value=new_translations.get(language),
-                    create_text_pack=False,
-                )
-                is_changed = True
-                continue
-
-            # Update translation
-            current_translation = current_translations.get(language, None)
-            new_translation = new_translations.get(language, None)
-            if current_translation != new_translation:
-                is_changed = True
-                await mybody_api_client.admin.texts.translations.update(
-                    text_key=key,
-                    language=language,
-                    value=new_translation,
-                    create_text_pack=False,
-                )
-
-    if is_changed:
-        await mybody_api_client.admin.texts.packs.create_all()
+        texts.append(
+            dict(
+                key=key,
+                value_default=values[DEFAULT_LANGUAGE],
+                translations={language: value or None for language, value in values.items()},
+            ),
+        )
+    if skipped_keys:
+        logging.warning(msg=f'[sync_gd] texts without "{DEFAULT_LANGUAGE}" value skipped: {", ".join(skipped_keys)}')
+
+    # The sheet is the source of truth: one bulk request creates, updates and deletes texts and translations, and
+    # creates the text packs only if something has changed
+    await mybody_api_client.admin.texts.bulk_update(
+        texts=texts,
+        delete_missing=True,
+        keep_prefixes=PREFIXES + skipped_keys,
+        replace_translations=True,
+    )
@@ -16,4 +16,5 @@
 
 
 from .mybody_api_client import mybody_api_client
-from .google_sheets_api_client import google_sheets_api_client
\ No newline at end of file
+from .google_sheets_api_client import google_sheets_api_client
+from .sheets_hashes import sheets_hashes
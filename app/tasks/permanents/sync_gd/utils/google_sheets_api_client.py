@@ -15,9 +15,15 @@
 #
 
 
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import gspread
 from addict import Dict
 from gspread import Spreadsheet, Worksheet
+from gspread.utils import fill_gaps, numericise_all, to_records
 from oauth2client.service_account import ServiceAccountCredentials
 
 
@@ -35,37 +41,67 @@ class GoogleSheetsApiClient:
             scopes=self.scope,
         )
         self.client = gspread.authorize(self.creds)
+        self.executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='google_sheets')
+        self.tables = {}
+
+    async def _run(self, function, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(function, *args, **kwargs))
 
     async def get_tables(self) -> list[Spreadsheet]:
-        return self.client.openall()
+        return await self._run(self.client.openall)
 
     async def get_table_by_name(self, name: str) -> Spreadsheet:
+        table = self.tables.get(name.lower())
+        if table:
+            return table
         tables = await self.get_tables()
         for table in tables:
             if table.title.lower() == name.lower():
+                self.tables[name.lower()] = table
                 return table
         raise Exception('Required table not found')
 
-    @staticmethod
-    async def get_sheet_by_table_and_name(table: Spreadsheet, name: str) -> Worksheet:
-        worksheets = table.worksheets()
+    async def get_sheet_by_table_and_name(self, table: Spreadsheet, name: str) -> Worksheet:
+        worksheets = await self._run(table.worksheets)
         for worksheet in worksheets:
             if worksheet.title.lower() == name.lower():
                 return worksheet
         raise Exception('Required sheet not found')
 
-    @staticmethod
-    async def get_columns_by_name(worksheet: Worksheet, column_name: str):
-        column_index = worksheet.row_values(1).index(column_name) + 1
-        return worksheet.col_values(column_index)
+    async def get_columns_by_name(self, worksheet: Worksheet, column_name: str):
+        column_index = (await self._run(worksheet.row_values, 1)).index(column_name) + 1
+        return await self._run(worksheet.col_values, column_index)
 
-    @staticmethod
-    async def get_rows(sheet: Worksheet):
+    async def get_rows(self, sheet: Worksheet):
         data = {
-            'rows': sheet.get_all_records(),
+            'rows': await self._run(sheet.get_all_records),
         }
         return Dict(**data).rows
 
+    @staticmethod
+    def _get_records(values: list[list]) -> list[dict]:
+        if not values:
+            return []
+        values = fill_gaps(values)
+        return to_records(values[0], [numericise_all(row) for row in values[1:]])
+
+    async def get_rows_by_names(self, table: Spreadsheet, names: list[str]) -> dict[str, list[Dict]]:
+        """
+        Rows of several sheets read with one batch request, records are built the same way as get_all_records.
+        """
+        worksheets = {worksheet.title.lower(): worksheet.title for worksheet in await self._run(table.worksheets)}
+        titles = []
+        for name in names:
+            if name.lower() not in worksheets:
+                raise Exception('Required sheet not found')
+            titles.append(worksheets[name.lower()])
+
+        response = await self._run(table.values_batch_get, ranges=[f"'{title}'" for title in titles])
+        return {
+            name: Dict(rows=self._get_records(values=value_range.get('values', []))).rows
+            for name, value_range in zip(names, response['valueRanges'])
+        }
+
 
 google_sheets_api_client = GoogleSheetsApiClient(
     filename='google_creds.json',
@@ -16,6 +16,8 @@
 
 
 from mybody_api_client import MyBodyApiClient
+from mybody_api_client.routes.admin.texts import AdminTextRoute as BaseAdminTextRoute
+from mybody_api_client.utils import RequestTypes
 
 from config import settings
 
@@ -23,7 +25,40 @@ from config import settings
 TOKEN = f'0:{settings.root_token}'
 
 
-mybody_api_client = MyBodyApiClient(
-    url=settings.sync_db_url,
-    token=TOKEN,
-)
+class AdminTextRoute(BaseAdminTextRoute):
+    """
+    Adds POST /admin/texts/bulk_update, which the pinned mybody_api_client does not have yet.
+    """
+    async def bulk_update(
+            self,
+            texts: list[dict],
+            delete_keys: list[str] = None,
+            delete_missing: bool = False,
+            keep_prefixes: list[str] = None,
+            replace_translations: bool = False,
+            create_text_pack: bool = True,
+    ):
+        return await self.request(
+            type_=RequestTypes.POST,
+            prefix='/bulk_update',
+            parameters={
+                'texts': texts,
+                'delete_keys': delete_keys or [],
+                'delete_missing': delete_missing,
+                'keep_prefixes': keep_prefixes or [],
+                'replace_translations': replace_translations,
+                'create_text_pack': create_text_pack,
+            },
+        )
+
+
+if settings.sync_gd_mode == 'service':
+    from .mybody_service_client import MyBodyServiceClient
+
+    mybody_api_client = MyBodyServiceClient()
+else:
+    mybody_api_client = MyBodyApiClient(
+        url=settings.sync_db_url,
+        token=TOKEN,
+    )
+    mybody_api_client.admin.texts = AdminTextRoute(url=mybody_api_client.admin.url, token=TOKEN)
@@ -0,0 +1,255 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from addict import Dict
+
+from app.services import CountryService, CurrencyService, LanguageService, PermissionService, RoleService, \
+    RolePermissionService, TextPackService, TextService, TextTranslationService, TimezoneService
+from config import settings
+
+
+TOKEN = f'0:{settings.root_token}'
+
+
+class ServiceRoute:
+    @staticmethod
+    def response(result: dict, response_key: str = None):
+        result = Dict(result)
+        return result[response_key] if response_key else result
+
+
+class AdminPermissionRoute(ServiceRoute):
+    async def create(self, id_str: str, name: str):
+        result = await PermissionService().create_by_admin(token=TOKEN, id_str=id_str, name=name)
+        return self.response(result=result, response_key='id')
+
+    async def delete(self, id_str: str):
+        return self.response(result=await PermissionService().delete_by_admin(token=TOKEN, id_str=id_str))
+
+    async def get_list(self):
+        result = await PermissionService().get_list_by_admin(token=TOKEN)
+        return self.response(result=result, response_key='permissions')
+
+
+class AdminRolePermissionRoute(ServiceRoute):
+    async def create(self, role_id: int, permission: str):
+        result = await RolePermissionService().create_by_admin(
+            token=TOKEN,
+            role_id=role_id,
+            permission_id_str=permission,
+        )
+        return self.response(result=result, response_key='id')
+
+
+class AdminRoleRoute(ServiceRoute):
+    permissions = AdminRolePermissionRoute()
+
+    async def create(self, name: str):
+        result = await RoleService().create_by_admin(token=TOKEN, name=name)
+        return self.response(result=result, response_key='id')
+
+    async def delete(self, id_: int):
+        return self.response(result=await RoleService().delete_by_admin(token=TOKEN, id_=id_))
+
+    async def get(self, id_: int):
+        return self.response(result=await RoleService().get(token=TOKEN, id_=id_), response_key='role')
+
+    async def get_list(self):
+        return self.response(result=await RoleService().get_list(token=TOKEN), response_key='roles')
+
+
+class AdminLanguageRoute(ServiceRoute):
+    async def create(self, id_str: str, name: str):
+        result = await LanguageService().create_by_admin(token=TOKEN, id_str=id_str, name=name)
+        return self.response(result=result, response_key='id_str')
+
+    async def delete(self, id_str: str):
+        return self.response(result=await LanguageService().delete_by_admin(token=TOKEN, id_str=id_str))
+
+
+class AdminTimezoneRoute(ServiceRoute):
+    async def create(self, id_str: str, deviation: int):
+        result = await TimezoneService().create_by_admin(token=TOKEN, id_str=id_str, deviation=deviation)
+        return self.response(result=result, response_key='id_str')
+
+    async def delete(self, id_str: str):
+        return self.response(result=await TimezoneService().delete_by_admin(token=TOKEN, id_str=id_str))
+
+
+class AdminCurrencyRoute(ServiceRoute):
+    async def create(self, id_str: str):
+        result = await CurrencyService().create_by_admin(token=TOKEN, id_str=id_str)
+        return self.response(result=result, response_key='id_str')
+
+    async def delete(self, id_str: str):
+        return self.response(result=await CurrencyService().delete_by_admin(token=TOKEN, id_str=id_str))
+
+
+class AdminCountryRoute(ServiceRoute):
+    async def create(
+            self,
+            id_str: str,
+            name: str,
+            language_default: str,
+            timezone_default: str,
+            currency_default: str,
+    ):
+        result = await CountryService().create_by_admin(
+            token=TOKEN,
+            id_str=id_str,
+            name=name,
+            language_default_id_str=language_default,
+            timezone_default_id_str=timezone_default,
+            currency_default_id_str=currency_default,
+        )
+        return self.response(result=result, response_key='id_str')
+
+    async def delete(self, id_str: str):
+        return self.response(result=await CountryService().delete_by_admin(token=TOKEN, id_str=id_str))
+
+
+class AdminTextTranslationRoute(ServiceRoute):
+    async def create(self, text_key: str, language: str, value: str, create_text_pack: bool = True):
+        result = await TextTranslationService().create_by_admin(
+            token=TOKEN,
+            text_key=text_key,
+            language=language,
+            value=value,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result, response_key='id')
+
+    async def update(self, text_key: str, language: str, value: str, create_text_pack: bool = True):
+        result = await TextTranslationService().update_by_admin(
+            token=TOKEN,
+            text_key=text_key,
+            language=language,
+            value=value,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result)
+
+    async def delete(self, text_key: str, language: str, create_text_pack: bool = True):
+        result = await TextTranslationService().delete_by_admin(
+            token=TOKEN,
+            text_key=text_key,
+            language=language,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result)
+
+
+class AdminTextPackRoute(ServiceRoute):
+    async def create_all(self):
+        return self.response(result=await TextPackService().create_all_by_admin(token=TOKEN))
+
+
+class AdminTextRoute(ServiceRoute):
+    translations = AdminTextTranslationRoute()
+    packs = AdminTextPackRoute()
+
+    async def create(self, key: str, value_default: str, create_text_pack: bool = True):
+        result = await TextService().create_by_admin(
+            token=TOKEN,
+            key=key,
+            value_default=value_default,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result, response_key='key')
+
+    async def update(self, key: str, value_default: str = None, new_key: str = None, create_text_pack: bool = True):
+        result = await TextService().update_by_admin(
+            token=TOKEN,
+            key=key,
+            value_default=value_default,
+            new_key=new_key,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result)
+
+    async def delete(self, key: str, create_text_pack: bool = True):
+        result = await TextService().delete_by_admin(token=TOKEN, key=key, create_text_pack=create_text_pack)
+        return self.response(result=result)
+
+    async def get_list(self):
+        return self.response(result=await TextService().get_list(token=TOKEN), response_key='texts')
+
+    async def bulk_update(
+            self,
+            texts: list[dict],
+            delete_keys: list[str] = None,
+            delete_missing: bool = False,
+            keep_prefixes: list[str] = None,
+            replace_translations: bool = False,
+            create_text_pack: bool = True,
+    ):
+        result = await TextService().bulk_update_by_admin(
+            token=TOKEN,
+            texts=texts,
+            delete_keys=delete_keys,
+            delete_missing=delete_missing,
+            keep_prefixes=keep_prefixes,
+            replace_translations=replace_translations,
+            create_text_pack=create_text_pack,
+        )
+        return self.response(result=result)
+
+
+class AdminRoute:
+    permissions = AdminPermissionRoute()
+    roles = AdminRoleRoute()
+    languages = AdminLanguageRoute()
+    timezones = AdminTimezoneRoute()
+    currencies = AdminCurrencyRoute()
+    countries = AdminCountryRoute()
+    texts = AdminTextRoute()
+
+
+class ClientLanguageRoute(ServiceRoute):
+    async def get_list(self):
+        return self.response(result=await LanguageService.get_list(), response_key='languages')
+
+
+class ClientTimezoneRoute(ServiceRoute):
+    async def get_list(self):
+        return self.response(result=await TimezoneService.get_list(), response_key='timezones')
+
+
+class ClientCurrencyRoute(ServiceRoute):
+    async def get_list(self):
+        return self.response(result=await CurrencyService.get_list(), response_key='currencies')
+
+
+class ClientCountryRoute(ServiceRoute):
+    async def get_list(self):
+        return self.response(result=await CountryService().get_list(), response_key='countries')
+
+
+class ClientRoute:
+    languages = ClientLanguageRoute()
+    timezones = ClientTimezoneRoute()
+    currencies = ClientCurrencyRoute()
+    countries = ClientCountryRoute()
+
+
+class MyBodyServiceClient:
+    """
+    Same interface as MyBodyApiClient for the routes used by sync_gd, calls the service layer in-process.
+    """
+    admin = AdminRoute()
+    client = ClientRoute()
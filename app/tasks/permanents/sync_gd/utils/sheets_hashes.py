@@ -0,0 +1,56 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from hashlib import sha256
+from json import dumps, loads
+from os import replace
+from os.path import exists
+
+from config import settings
+
+
+class SheetsHashes:
+    """
+    Hashes of sheets rows from the last successful sync, stored between runs.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.hashes = None
+        self.hashes_pending = {}
+
+    def _load(self) -> dict:
+        if self.hashes is None:
+            self.hashes = {}
+            if exists(self.path):
+                with open(self.path, encoding='utf-8', mode='r') as file:
+                    self.hashes = loads(file.read())
+        return self.hashes
+
+    def is_changed(self, name: str, rows: list) -> bool:
+        hash_ = sha256(dumps(rows, sort_keys=True, default=str).encode()).hexdigest()
+        self.hashes_pending[name] = hash_
+        return self._load().get(name) != hash_
+
+    def save(self, name: str):
+        self._load()[name] = self.hashes_pending.pop(name)
+        with open(f'{self.path}.tmp', encoding='utf-8', mode='w') as file:
+            file.write(dumps(self.hashes))
+        replace(f'{self.path}.tmp', self.path)
+
+
+sheets_hashes = SheetsHashes(path=settings.path_sync_gd_hashes)
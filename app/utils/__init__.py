@@ -18,10 +18,11 @@
 from app.utils.exceptions.base import ApiException
 from .middleware import Middleware
 from .router import Router
-from .response import Response, ResponseState
+from .response import Response, RawResponse, ResponseState
 from . import crypto
 from . import client
 from .units import Units
+from .cache import TTLCache
 from .use_schema import use_schema
 from .validation_error import validation_error
 from .telegram_notification import TelegramNotification
@@ -0,0 +1,48 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from contextvars import ContextVar
+
+
+class AuthContext:
+    """
+    Authorization state of the current request: sessions resolved by token and permissions already verified
+    per account, so nested service calls do not authorize again.
+    """
+    def __init__(self):
+        self.sessions = {}
+        self.permissions = {}
+
+    def get_session(self, token: str):
+        return self.sessions.get(token)
+
+    def set_session(self, token: str, session):
+        self.sessions[token] = session
+
+    def has_permission(self, account_id: int, id_str: str) -> bool:
+        return id_str in self.permissions.get(account_id, set())
+
+    def add_permission(self, account_id: int, id_str: str):
+        self.permissions.setdefault(account_id, set()).add(id_str)
+
+
+auth_context: ContextVar[AuthContext | None] = ContextVar('auth_context', default=None)
+
+
+def reset_auth_context():
+    auth_context.set(AuthContext())
@@ -17,6 +17,7 @@
 
 from app.services.account_role_check_premission import AccountRoleCheckPermissionService
 from app.services.session_get_by_token import SessionGetByTokenService
+from app.utils.auth_context import auth_context
 from app.utils.exceptions.main import MethodNotSupportedRoot
 
 
@@ -34,8 +35,14 @@ def session_required(
             if token or 'token' in kwargs.keys():
                 kwargs.pop('token')
 
+            context = auth_context.get()
+
             if not session and not can_guest or (token and can_guest):
-                session = await SessionGetByTokenService().execute(token=token)
+                session = context.get_session(token=token) if context else None
+                if not session:
+                    session = await SessionGetByTokenService().execute(token=token)
+                    if context:
+                        context.set_session(token=token, session=session)
 
                 # Check support root
                 if session.id == 0 and not can_root:
@@ -50,7 +57,12 @@ def session_required(
 
             # Check permissions
             for permission in permissions or []:
-                await AccountRoleCheckPermissionService().check_permission(account=session.account, id_str=permission)
+                account = session.account
+                if context and context.has_permission(account_id=account.id, id_str=permission):
+                    continue
+                await AccountRoleCheckPermissionService().check_permission(account=account, id_str=permission)
+                if context:
+                    context.add_permission(account_id=account.id, id_str=permission)
 
             return await function(*args, **kwargs)
         return wrapper
@@ -19,9 +19,11 @@ from .account import AccountMissingPermission, InvalidAccountServiceAnswerList,
     WrongPassword
 from .article import ArticleSessionRequired
 from .base import ApiException
+from .day import TooManyDates
 from .exercise import InvalidExerciseType
 from .image import InvalidFileType, TooLargeFile
-from .main import ModelAlreadyExist, ModelDoesNotExist, NoRequiredParameters, NotEnoughPermissions, NegativeInteger
+from .main import ModelAlreadyExist, ModelDoesNotExist, NoRequiredParameters, NotEnoughPermissions, NegativeInteger, \
+    InvalidCursor, DatabaseBusy
 from .meal import InvalidMealType
 from .product import InvalidProductList, InvalidProductType, InvalidUnit
 from .service import InvalidServiceQuestionList
@@ -46,3 +46,13 @@ class MethodNotSupportedRoot(ApiException):
 class NegativeInteger(ApiException):
     code = 1005
     message = "Variable {variable} can't be negative"
+
+
+class InvalidCursor(ApiException):
+    code = 1006
+    message = 'Invalid cursor "{cursor}"'
+
+
+class DatabaseBusy(ApiException):
+    code = 1007
+    message = 'Service is busy, try again later'
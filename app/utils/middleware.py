@@ -18,28 +18,39 @@
 from json import loads
 
 from fastapi import Request
+from playhouse.pool import MaxConnectionsExceeded
 from pydantic import ValidationError
 
-from app.db.db import db
-from app.utils.exceptions import ApiException
+from app.db import db_connection, reset_db_state
+from app.utils.auth_context import reset_auth_context
+from app.utils.exceptions import ApiException, DatabaseBusy
 from app.utils.response import ResponseState, Response
 from app.utils.validation_error import validation_error
 
 
 class Middleware:
+    @staticmethod
+    def get_error_response(e: ApiException) -> Response:
+        return Response(
+            state=ResponseState.error,
+            error={
+                'code': e.code,
+                'kwargs': e.kwargs,
+                'message': e.message.format(**e.kwargs),
+            }
+        )
+
     async def __call__(self, request: Request, call_next):
-        with db:
-            try:
-                response = await call_next(request)
-            except ApiException as e:
-                response = Response(
-                    state=ResponseState.error,
-                    error={
-                        'code': e.code,
-                        'kwargs': e.kwargs,
-                        'message': e.message.format(**e.kwargs),
-                    }
-                )
-            except ValidationError as e:
-                response = await validation_error(_=request, exception=loads(e.json()))
+        reset_db_state()
+        reset_auth_context()
+        try:
+            async with db_connection():
+                try:
+                    response = await call_next(request)
+                except ApiException as e:
+                    response = self.get_error_response(e=e)
+                except ValidationError as e:
+                    response = await validation_error(_=request, exception=loads(e.json()))
+        except MaxConnectionsExceeded:
+            response = self.get_error_response(e=DatabaseBusy())
         return response
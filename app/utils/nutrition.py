@@ -0,0 +1,78 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from .units import Units
+
+
+NUTRIENTS = ['fats', 'proteins', 'carbohydrates', 'calories']
+CALORIES_PER_GRAM = np.array([9, 4, 4])
+
+
+def get_factors(products: list[tuple]) -> tuple[dict[int, int], np.ndarray]:
+    """
+    Nutrients of one unit of value for every product: per piece for pieces, per gram (millilitre) otherwise, as
+    products store them per 100. Missing calories are derived from the macros.
+    """
+    indexes = {product[0]: i for i, product in enumerate(products)}
+    factors = np.array([product[2:] for product in products], dtype=float).reshape(len(products), len(NUTRIENTS))
+    factors[:, 3] = np.where(np.isnan(factors[:, 3]), factors[:, :3] @ CALORIES_PER_GRAM, factors[:, 3])
+    units = np.array([product[1] for product in products], dtype=object)
+    factors[units != Units.PIECES] /= 100
+    return indexes, factors
+
+
+def get_totals(
+        values: list[tuple],
+        account_services_indexes: dict[int, int],
+        products_indexes: dict[int, int],
+        factors: np.ndarray,
+        date_from: date,
+        days_count: int,
+) -> np.ndarray:
+    """
+    Sum (account_service_id, date, product_id, value) rows into an (account services, days, nutrients) array.
+    """
+    totals = np.zeros((len(account_services_indexes), days_count, len(NUTRIENTS)))
+    if not values:
+        return totals
+    account_services = np.fromiter((account_services_indexes[value[0]] for value in values), dtype=int)
+    days = np.fromiter(((value[1] - date_from).days for value in values), dtype=int)
+    products = np.fromiter((products_indexes[value[2]] for value in values), dtype=int)
+    amounts = np.fromiter((value[3] for value in values), dtype=float)
+    np.add.at(totals, (account_services, days), factors[products] * amounts[:, None])
+    return totals
+
+
+def get_weeks_starts(date_from: date, days_count: int) -> list[int]:
+    # Day indexes where an ISO week (from Monday) starts, the first one may be partial
+    return [0] + [i for i in range(1, days_count) if (date_from + timedelta(days=i)).weekday() == 0]
+
+
+def get_adherence(planned: np.ndarray, reported: np.ndarray) -> np.ndarray:
+    # Reported share of the plan in percents, NaN where nothing was planned
+    return np.divide(reported * 100, planned, out=np.full(planned.shape, np.nan), where=planned > 0)
+
+
+def to_dict(values: np.ndarray) -> dict:
+    return {
+        nutrient: None if np.isnan(value) else round(float(value), 1)
+        for nutrient, value in zip(NUTRIENTS, values)
+    }
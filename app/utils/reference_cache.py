@@ -0,0 +1,97 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+import asyncio
+import logging
+
+from app.db import after_commit
+from app.utils.cache import TTLCache
+from config import settings
+
+
+class ReferenceCache:
+    """
+    Process-local cache of languages, countries, timezones, currencies and services. Any admin write drops all entries
+    by bumping the version, with pub/sub enabled every worker drops them together.
+    """
+    channel = 'mybody_api:reference_cache'
+
+    def __init__(self, max_size: int, ttl: int):
+        self.items = TTLCache(max_size=max_size, ttl=ttl)
+        self.version = 0
+        self._redis = None
+
+    @property
+    def redis(self):
+        if not self._redis:
+            from redis.asyncio import Redis
+
+            self._redis = Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                username=settings.redis_user,
+                password=settings.redis_password,
+            )
+        return self._redis
+
+    def get(self, key: tuple):
+        item = self.items.get(key)
+        if not item:
+            return None
+        version, value = item
+        if version != self.version:
+            return None
+        return value
+
+    def set(self, key: tuple, value, version: int):
+        # Rows read before an invalidation must not be stored under the new version
+        if version != self.version:
+            return
+        self.items.set(key, (version, value))
+
+    def drop(self):
+        self.version += 1
+        self.items.clear()
+
+    async def _invalidate(self):
+        self.drop()
+        if settings.reference_cache_pubsub:
+            await self.redis.publish(self.channel, self.version)
+
+    async def invalidate(self):
+        # Invalidated again after commit, a concurrent reader may cache the old rows before it
+        await self._invalidate()
+        after_commit(self._invalidate)
+
+    async def listen(self):
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message['type'] == 'message':
+                            self.drop()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(msg=f'[reference_cache] {e}')
+                self.drop()
+                await asyncio.sleep(5)
+
+
+reference_cache = ReferenceCache(max_size=settings.reference_cache_size, ttl=settings.reference_cache_ttl)
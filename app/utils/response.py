@@ -15,7 +15,9 @@
 #
 
 
-from starlette.responses import JSONResponse
+from json import dumps
+
+from starlette.responses import JSONResponse, Response as StarletteResponse
 
 
 class ResponseState:
@@ -30,3 +32,24 @@ class Response:
             **kwargs,
         }
         return JSONResponse(content=json, headers=headers)
+
+
+def raw_content(state: str = ResponseState.successful, **kwargs) -> bytes:
+    content = b'{"state":' + dumps(state).encode()
+    for key, value in kwargs.items():
+        if not isinstance(value, bytes):
+            value = dumps(value, ensure_ascii=False).encode()
+        content += b',' + dumps(key).encode() + b':' + value
+    return content + b'}'
+
+
+class RawResponse:
+    """
+    Same envelope as Response, bytes values are embedded as already serialized JSON.
+    """
+    def __new__(cls, state: str = ResponseState.successful, headers: dict = None, **kwargs) -> StarletteResponse:
+        return StarletteResponse(
+            content=raw_content(state=state, **kwargs),
+            media_type='application/json',
+            headers=headers,
+        )
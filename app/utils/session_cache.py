@@ -0,0 +1,115 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from hashlib import sha256
+from pickle import dumps, loads
+
+from app.db import after_commit
+from app.utils.cache import TTLCache
+from config import settings
+
+
+class MemorySessionCache:
+    def __init__(self, max_size: int, ttl: int):
+        self.items = TTLCache(max_size=max_size, ttl=ttl)
+        self.accounts_versions = {}
+
+    async def get(self, key: str) -> tuple[int, int, bytes] | None:
+        return self.items.get(key)
+
+    async def set(self, key: str, account_id: int, value: bytes):
+        self.items.set(key, (account_id, self.accounts_versions.get(account_id, 0), value))
+
+    async def get_account_version(self, account_id: int) -> int:
+        return self.accounts_versions.get(account_id, 0)
+
+    async def invalidate_account(self, account_id: int):
+        self.accounts_versions[account_id] = self.accounts_versions.get(account_id, 0) + 1
+
+
+class RedisSessionCache:
+    prefix = 'mybody_api:sessions'
+
+    def __init__(self, ttl: int):
+        from redis.asyncio import Redis
+
+        self.ttl = ttl
+        self.redis = Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            username=settings.redis_user,
+            password=settings.redis_password,
+        )
+
+    async def get(self, key: str) -> tuple[int, int, bytes] | None:
+        value = await self.redis.get(f'{self.prefix}:{key}')
+        return loads(value) if value else None
+
+    async def set(self, key: str, account_id: int, value: bytes):
+        version = await self.get_account_version(account_id=account_id)
+        await self.redis.set(f'{self.prefix}:{key}', dumps((account_id, version, value)), ex=self.ttl)
+
+    async def get_account_version(self, account_id: int) -> int:
+        version = await self.redis.get(f'{self.prefix}:accounts:{account_id}')
+        return int(version) if version else 0
+
+    async def invalidate_account(self, account_id: int):
+        await self.redis.incr(f'{self.prefix}:accounts:{account_id}')
+
+
+class SessionCache:
+    """
+    Verified sessions with their joined account, keyed by a hash of the full token. Entries of an account are
+    dropped together by bumping the account version.
+    """
+    def __init__(self):
+        if settings.sessions_cache_backend == 'redis':
+            self.backend = RedisSessionCache(ttl=settings.sessions_cache_ttl)
+        else:
+            self.backend = MemorySessionCache(max_size=settings.sessions_cache_size, ttl=settings.sessions_cache_ttl)
+
+    @staticmethod
+    def _key(session_id: int, token: str) -> str:
+        return sha256(f'{session_id}:{token}'.encode()).hexdigest()
+
+    async def get(self, session_id: int, token: str):
+        item = await self.backend.get(key=self._key(session_id=session_id, token=token))
+        if not item:
+            return None
+        account_id, version, value = item
+        if version != await self.backend.get_account_version(account_id=account_id):
+            return None
+        return loads(value)
+
+    async def set(self, session_id: int, token: str, session):
+        await self.backend.set(
+            key=self._key(session_id=session_id, token=token),
+            account_id=session.account_id,
+            value=dumps(session),
+        )
+
+    async def invalidate_account(self, account_id: int):
+        async def invalidate():
+            await self.backend.invalidate_account(account_id=account_id)
+
+        # Invalidated again after commit, a concurrent request may cache the old account before it
+        await invalidate()
+        after_commit(invalidate)
+
+
+session_cache = SessionCache()
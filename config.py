@@ -32,6 +32,11 @@ class Settings(BaseSettings):
     mysql_user: str
     mysql_password: str
     mysql_name: str
+    mysql_pool_size: int = 10
+    mysql_pool_max_overflow: int = 10
+    mysql_pool_stale_timeout: int = 300
+    mysql_pool_timeout: int = 10
+    mysql_check_hot_queries: bool = False
 
     redis_host: str
     redis_port: int
@@ -44,6 +49,7 @@ class Settings(BaseSettings):
     root_token: str
     sync_db_url: str
     sync_db_table_name: str
+    sync_gd_mode: str = 'http'
 
     payment_hg_url: str
     payment_hg_client_id: int
@@ -67,8 +73,26 @@ class Settings(BaseSettings):
 
     path_articles: str = 'assets/articles'
     path_texts_packs: str = 'assets/texts_packs'
+    texts_packs_keep: int = 10
+    texts_packs_delta_base_ttl: int = 30
     path_images: str = 'assets/images'
+    path_sync_gd_hashes: str = 'assets/sync_gd_hashes.json'
     items_per_page: int = 10
+    days_duplicate_max_dates: int = 62
+    nutrition_max_days: int = 366
+
+    permissions_cache_size: int = 10000
+    permissions_cache_ttl: int = 60
+    sessions_cache_backend: str = 'memory'
+    sessions_cache_size: int = 10000
+    sessions_cache_ttl: int = 60
+    reference_cache_size: int = 10000
+    reference_cache_ttl: int = 60
+    reference_cache_pubsub: bool = True
+    actions_write_behind: bool = False
+    actions_queue_size: int = 10000
+    actions_batch_size: int = 500
+    actions_flush_interval: float = 1
 
     model_config = SettingsConfigDict(env_file='.env')
 
@@ -0,0 +1,131 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+import logging
+from hashlib import md5
+from os import environ
+
+import pytest
+from peewee import SqliteDatabase
+
+
+for name in [
+    'api_port', 'tasks_flower_port', 'mysql_port', 'redis_port', 'payment_hg_client_id',
+    'payment_hg_service_provider_id', 'payment_hg_service_id',
+]:
+    environ.setdefault(name.upper(), '1')
+for name in [
+    'tg_bot_token', 'tg_request_chat_id', 'tg_new_request_message', 'tg_new_purchase_message', 'mysql_host',
+    'mysql_user', 'mysql_password', 'mysql_name', 'redis_host', 'redis_user', 'redis_password', 'flower_user',
+    'flower_password', 'root_token', 'sync_db_url', 'sync_db_table_name', 'payment_hg_url',
+    'payment_hg_client_secret', 'payment_hg_service_provider_name', 'payment_hg_service_name',
+    'payment_hg_address_country', 'payment_hg_address_line', 'payment_hg_address_city', 'payment_hg_full_address',
+    'payment_hg_locality_code', 'payment_hg_store_name', 'payment_hg_store_locality_name', 'payment_hg_store_city',
+    'payment_hg_store_locality_city', 'payment_hg_prefix', 'secret_promo_code',
+]:
+    environ.setdefault(name.upper(), 'test')
+
+
+from app.db.db import ConnectionState, reset_db_state
+from app.db.models import Account, AccountRole, AccountService, Country, Currency, Language, Permission, Role, \
+    RolePermission, Service, Session, Text, Timezone, models
+from app.services.account_role_check_premission import permissions_cache
+from app.utils.auth_context import reset_auth_context
+from app.utils.reference_cache import reference_cache
+from app.utils.session_cache import session_cache
+
+
+class QueriesCounter(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord):
+        if isinstance(record.msg, tuple):
+            self.count += 1
+
+
+@pytest.fixture
+def database():
+    """
+    Models bound to an in-memory SQLite database, shared with the database threads through the context state.
+    Process caches are dropped, ids start over in every database.
+    """
+    reset_db_state()
+    reset_auth_context()
+    permissions_cache.clear()
+    session_cache.backend.items.clear()
+    reference_cache.drop()
+    database = SqliteDatabase(':memory:', check_same_thread=False)
+    database._state = ConnectionState()
+    with database.bind_ctx(models):
+        database.connect()
+        database.create_tables(models)
+        yield database
+        database.close()
+
+
+@pytest.fixture
+def queries(database):
+    logger = logging.getLogger('peewee')
+    level = logger.level
+    counter = QueriesCounter()
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    yield counter
+    logger.removeHandler(counter)
+    logger.setLevel(level)
+
+
+@pytest.fixture
+def account(database) -> Account:
+    language = Language.create(id_str='eng', name='English')
+    return Account.create(
+        username='test',
+        password_salt='salt',
+        password_hash='hash',
+        firstname='Test',
+        lastname='Test',
+        country=Country.create(id_str='by', name='Belarus', language_default=language),
+        language=language,
+        timezone=Timezone.create(id_str='utc'),
+        currency=Currency.create(id_str='usd'),
+    )
+
+
+@pytest.fixture
+def account_service(account) -> AccountService:
+    text = Text.create(key='service_test', value_default='Test')
+    service = Service.create(id_str='test', name_text=text)
+    return AccountService.create(account=account, service=service, state='active')
+
+
+@pytest.fixture
+def create_token(account):
+    """
+    Creates a session of the account with a role granting the permissions, returns its token.
+    """
+    def create(permissions: list[str]) -> str:
+        text = Text.create(key=f'role_{"_".join(permissions)}', value_default='Test')
+        role = Role.create(name_text=text)
+        for permission in permissions:
+            RolePermission.create(role=role, permission=Permission.create(id_str=permission, name_text=text))
+        AccountRole.create(account=account, role=role)
+        session = Session.create(account=account, token_salt='salt', token_hash=md5(b'tokensalt').hexdigest())
+        return f'{session.id}:token'
+    return create
@@ -0,0 +1,79 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from asyncio import run
+
+import pytest
+
+from app.db.models import Account, Session
+from app.services.account_role_check_premission import AccountRoleCheckPermissionService
+from app.utils.auth_context import reset_auth_context
+from app.utils.decorators import session_required
+from app.utils.session_cache import session_cache
+
+
+class TestService:
+    __test__ = False
+
+    @session_required(permissions=['texts'])
+    async def get(self, session: Session):
+        return session
+
+    @session_required(permissions=['texts'])
+    async def get_nested(self, session: Session):
+        await self.get(session=session)
+        await self.get(session=session)
+        return session
+
+
+@pytest.fixture
+def token(create_token) -> str:
+    return create_token(permissions=['texts'])
+
+
+async def clear_caches(account: Account):
+    await session_cache.invalidate_account(account_id=account.id)
+    await AccountRoleCheckPermissionService.clear_cache(account=account)
+
+
+def test_session_required_queries(account, token, queries):
+    async def main():
+        reset_auth_context()
+        await clear_caches(account=account)
+        queries.count = 0
+        await TestService().get(token=token)
+        queries_first = queries.count
+
+        # Caches of the process are dropped, the second call is served by the request auth context only
+        await clear_caches(account=account)
+        queries.count = 0
+        await TestService().get(token=token)
+        queries_second = queries.count
+
+        reset_auth_context()
+        await clear_caches(account=account)
+        queries.count = 0
+        await TestService().get_nested(token=token)
+        queries_nested = queries.count
+
+        return queries_first, queries_second, queries_nested
+
+    queries_first, queries_second, queries_nested = run(main())
+    assert queries_first > 0
+    assert queries_second == 0
+    assert queries_nested == queries_first
@@ -0,0 +1,90 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from asyncio import run
+from datetime import date
+
+import pytest
+from peewee import IntegrityError
+
+from app.db.models import Meal, Url
+from app.repositories import MealRepository, UrlRepository
+from app.repositories.base import ER_DUP_ENTRY
+from app.utils.exceptions import ModelAlreadyExist
+
+
+@pytest.fixture
+def unique_database(database, monkeypatch):
+    """
+    SQLite counterpart of migration 3: partial unique indexes over not deleted rows, with duplicate key errors
+    reported under the MySQL code.
+    """
+    database.execute_sql('CREATE UNIQUE INDEX urls_name_active ON urls (name) WHERE is_deleted = 0')
+    database.execute_sql(
+        'CREATE UNIQUE INDEX meals_account_service_id_date_type_active ON meals (account_service_id, date, type) '
+        'WHERE is_deleted = 0',
+    )
+    execute_sql = database.execute_sql
+
+    def execute_sql_mysql(*args, **kwargs):
+        try:
+            return execute_sql(*args, **kwargs)
+        except IntegrityError as e:
+            if 'UNIQUE constraint failed' in str(e):
+                raise IntegrityError(ER_DUP_ENTRY, str(e))
+            raise
+
+    monkeypatch.setattr(database, 'execute_sql', execute_sql_mysql)
+    return database
+
+
+def test_create_already_exist(unique_database):
+    run(UrlRepository().create(name='test', redirect='https://a'))
+    with pytest.raises(ModelAlreadyExist) as e:
+        run(UrlRepository().create(name='test', redirect='https://b'))
+    assert e.value.kwargs == {'model': 'Url', 'id_type': 'name', 'id_value': 'test'}
+
+
+def test_create_after_delete(unique_database):
+    url = run(UrlRepository().create(name='test', redirect='https://a'))
+    run(UrlRepository().delete(model=url))
+    run(UrlRepository().create(name='test', redirect='https://b'))
+    assert Url.select().where(Url.name == 'test').count() == 2
+
+
+def test_update_already_exist(unique_database):
+    run(UrlRepository().create(name='test', redirect='https://a'))
+    url = run(UrlRepository().create(name='other', redirect='https://b'))
+    with pytest.raises(ModelAlreadyExist) as e:
+        run(UrlRepository().update(model=url, name='test'))
+    assert e.value.kwargs == {'model': 'Url', 'id_type': 'name', 'id_value': 'test'}
+
+
+def test_update_already_exist_composite(unique_database, account_service):
+    date_ = date(2024, 1, 1)
+    kwargs = {'account_service': account_service, 'date': date_, 'fats': 1, 'proteins': 2, 'carbohydrates': 3}
+    run(MealRepository().create(type='breakfast', **kwargs))
+    meal = run(MealRepository().create(type='lunch', **kwargs))
+    with pytest.raises(ModelAlreadyExist) as e:
+        run(MealRepository().update(model=meal, type='breakfast'))
+    assert e.value.kwargs == {
+        'model': 'Meal',
+        'id_type': 'account_service, date, type',
+        'id_value': [account_service.id, '2024-01-01', 'breakfast'],
+    }
+    assert Meal.get_by_id(meal.id).type == 'lunch'
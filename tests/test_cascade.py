@@ -0,0 +1,66 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from asyncio import run
+from datetime import date
+
+from app.db.models import AccountService, Day, DayMeal, DayTraining, Exercise, Image, Meal, MealProduct, MealReport, \
+    MealReportImage, MealReportProduct, Product, Text, Training, TrainingExercise, TrainingReport
+from app.repositories import DayRepository
+
+
+def create_day(account_service: AccountService, date_: date) -> dict:
+    text = Text.create(key=f'test_{date_.isoformat()}', value_default='Test')
+    product = Product.create(name_text=text, type='meat', is_main=True, unit='g', fats=1, proteins=2, carbohydrates=3)
+    day = Day.create(account_service=account_service, date=date_, water_amount=2000)
+    meal = Meal.create(account_service=account_service, date=date_, fats=1, proteins=2, carbohydrates=3,
+                       type='meal_1')
+    meal_report = MealReport.create(meal=meal, comment='Test')
+    image = Image.create(id_str=f'test_{date_.isoformat()}', model='meal_report', model_id=str(meal_report.id))
+    training = Training.create(account_service=account_service, date=date_)
+    return {
+        Day: [day],
+        DayMeal: [DayMeal.create(day=day, meal=meal)],
+        Meal: [meal],
+        MealProduct: [MealProduct.create(meal=meal, product=product, value=100)],
+        MealReport: [meal_report],
+        MealReportProduct: [MealReportProduct.create(meal_report=meal_report, product=product, value=100)],
+        MealReportImage: [MealReportImage.create(meal_report=meal_report, image=image)],
+        DayTraining: [DayTraining.create(day=day, training=training)],
+        Training: [training],
+        TrainingExercise: [
+            TrainingExercise.create(training=training, exercise=Exercise.create(name_text=text, type='time'),
+                                    priority=1, value=10, rest=60),
+        ],
+        TrainingReport: [TrainingReport.create(training=training, comment='Test')],
+    }
+
+
+def test_delete_cascade_subtree(account_service):
+    models = create_day(account_service=account_service, date_=date(2024, 1, 1))
+    models_other = create_day(account_service=account_service, date_=date(2024, 1, 2))
+
+    deleted = run(DayRepository().delete_cascade(models=models[Day]))
+
+    assert {model: sorted(ids) for model, ids in deleted.items()} == {
+        model: [row.id for row in rows] for model, rows in models.items()
+    }
+    for model, rows in models.items():
+        assert all(model.get_by_id(row.id).is_deleted for row in rows), model.__name__
+    for model, rows in models_other.items():
+        assert not any(model.get_by_id(row.id).is_deleted for row in rows), model.__name__
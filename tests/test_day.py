@@ -0,0 +1,74 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from asyncio import run
+from datetime import date, timedelta
+
+import pytest
+
+from app.db.models import AccountService, Day, DayMeal, DayTraining, Exercise, Meal, MealProduct, MealReport, \
+    Product, Text, Training, TrainingExercise, TrainingReport
+from app.services.day import DayService
+
+
+def create_days(account_service: AccountService, count: int) -> list[Day]:
+    text = Text.create(key=f'test_{count}', value_default='Test')
+    product = Product.create(
+        name_text=text, type='meat', is_main=True, unit='g', fats=1, proteins=2, carbohydrates=3,
+    )
+    exercise = Exercise.create(name_text=text, type='time')
+    date_start = date(2024, 1, 1) + timedelta(days=100 * count)
+
+    days = []
+    for i in range(count):
+        date_ = date_start + timedelta(days=i)
+        day = Day.create(account_service=account_service, date=date_, water_amount=2000)
+        for type_ in ['breakfast', 'lunch', 'dinner']:
+            meal = Meal.create(account_service=account_service, date=date_, fats=1, proteins=2, carbohydrates=3,
+                               type=type_)
+            DayMeal.create(day=day, meal=meal)
+            MealReport.create(meal=meal, comment='Test')
+            for value in [100, 200]:
+                MealProduct.create(meal=meal, product=product, value=value)
+        training = Training.create(account_service=account_service, date=date_)
+        DayTraining.create(day=day, training=training)
+        TrainingReport.create(training=training, comment='Test')
+        for priority in [1, 2]:
+            TrainingExercise.create(training=training, exercise=exercise, priority=priority, value=10, rest=60)
+        days.append(day)
+    return days
+
+
+@pytest.mark.parametrize('count', [7, 31])
+def test_generate_days_dicts_queries(account_service, queries, count):
+    days_one = create_days(account_service=account_service, count=1)
+    days_many = create_days(account_service=account_service, count=count)
+
+    queries.count = 0
+    days_dicts_one = run(DayService._generate_days_dicts(days=days_one))
+    queries_one = queries.count
+
+    queries.count = 0
+    days_dicts_many = run(DayService._generate_days_dicts(days=days_many))
+    queries_many = queries.count
+
+    assert len(days_dicts_one) == 1
+    assert len(days_dicts_many) == count
+    assert all(len(day_dict['meals']) == 3 for day_dict in days_dicts_many)
+    assert all(day_dict['training'] for day_dict in days_dicts_many)
+    assert queries_one == queries_many
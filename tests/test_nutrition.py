@@ -0,0 +1,114 @@
+#
+# (c) 2024, Yegor Yakubovich, yegoryakubovich.com, personal@yegoryakybovich.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+from asyncio import run
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.services.nutrition import NutritionService
+from app.utils import Units
+from app.utils.exceptions import ModelDoesNotExist
+from app.utils.nutrition import get_adherence, get_factors, get_totals, get_weeks_starts, to_dict
+
+
+PRODUCTS = [
+    # (id, unit, fats, proteins, carbohydrates, calories)
+    (10, Units.GRAMS, 10, 20, 30, 400),
+    (20, Units.PIECES, 1, 2, 3, 50),
+    (30, Units.MILLILITRES, 1, 1, 1, None),
+]
+
+
+def test_get_factors_units():
+    indexes, factors = get_factors(products=PRODUCTS)
+    assert indexes == {10: 0, 20: 1, 30: 2}
+    # Per 100 for grams and millilitres, per piece for pieces
+    np.testing.assert_allclose(factors[0], [0.1, 0.2, 0.3, 4])
+    np.testing.assert_allclose(factors[1], [1, 2, 3, 50])
+
+
+def test_get_factors_calories_from_macros():
+    _, factors = get_factors(products=PRODUCTS)
+    # 9 kcal per gram of fats, 4 per gram of proteins and carbohydrates, then per 100
+    np.testing.assert_allclose(factors[2], [0.01, 0.01, 0.01, 0.17])
+
+
+def test_get_totals():
+    products_indexes, factors = get_factors(products=PRODUCTS)
+    totals = get_totals(
+        values=[
+            (1, date(2024, 1, 1), 10, 200),
+            (1, date(2024, 1, 1), 20, 2),
+            (2, date(2024, 1, 3), 10, 100),
+        ],
+        account_services_indexes={1: 0, 2: 1},
+        products_indexes=products_indexes,
+        factors=factors,
+        date_from=date(2024, 1, 1),
+        days_count=3,
+    )
+    assert totals.shape == (2, 3, 4)
+    np.testing.assert_allclose(totals[0, 0], [22, 44, 66, 900])
+    np.testing.assert_allclose(totals[1, 2], [10, 20, 30, 400])
+    assert totals.sum() == totals[0, 0].sum() + totals[1, 2].sum()
+
+
+def test_weeks_partial_first_week():
+    # Wednesday to Sunday of the next week: 5 days of the first week, then a full week
+    weeks_starts = get_weeks_starts(date_from=date(2024, 1, 3), days_count=12)
+    assert weeks_starts == [0, 5]
+    days = np.arange(12, dtype=float).reshape(1, 12, 1)
+    np.testing.assert_allclose(np.add.reduceat(days, weeks_starts, axis=1).ravel(), [10, 56])
+
+
+def test_weeks_from_monday():
+    assert get_weeks_starts(date_from=date(2024, 1, 1), days_count=15) == [0, 7, 14]
+
+
+def test_adherence_nothing_planned():
+    adherence = get_adherence(planned=np.array([0, 200, 0, 10, 0]), reported=np.array([50, 50, 0, 10, 0]))
+    assert np.isnan(adherence[[0, 2, 4]]).all()
+    np.testing.assert_allclose(adherence[[1, 3]], [25, 100])
+    assert to_dict(values=adherence[:4]) == {
+        'fats': None,
+        'proteins': 25.0,
+        'carbohydrates': None,
+        'calories': 100.0,
+    }
+
+
+def test_get_by_admin_unknown_account_services(account_service, create_token):
+    token = create_token(permissions=['accounts'])
+    with pytest.raises(ModelDoesNotExist) as e:
+        run(NutritionService().get_by_admin(
+            token=token,
+            account_services_ids=[account_service.id, 404, 405],
+            date_from=date(2024, 1, 1),
+            date_to=date(2024, 1, 7),
+        ))
+    assert e.value.kwargs['id_value'] == [404, 405]
+
+    result = run(NutritionService().get_by_admin(
+        token=token,
+        account_services_ids=[account_service.id],
+        date_from=date(2024, 1, 1),
+        date_to=date(2024, 1, 7),
+    ))
+    assert [account_service_dict['id'] for account_service_dict in result['account_services']] == [account_service.id]